@@ -0,0 +1,236 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+from fastapi import Request, Response
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_API_CACHE_PATH = os.path.join(CURRENT_DIR, "..", "..", "logs", "api_cache.db")
+
+# memory: 프로세스 내 LRU (기본), sqlite: 여러 워커 프로세스가 공유하는 로컬 파일, off: 사용 안 함
+API_CACHE_BACKEND = os.getenv("API_CACHE_BACKEND", "memory")
+API_CACHE_PATH = os.getenv("API_CACHE_PATH", DEFAULT_API_CACHE_PATH)
+API_CACHE_TTL_SECONDS = float(os.getenv("API_CACHE_TTL_SECONDS", "600"))
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "10000"))
+
+SEARCH_TAG = "search"
+
+
+def song_tag(song_id: int) -> str:
+    return f"song:{song_id}"
+
+
+def person_tag(person_id: int) -> str:
+    return f"person:{person_id}"
+
+
+class CacheEntry(NamedTuple):
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU + TTL 캐시. 태그별로 키를 모아 두어 태그 단위로 무효화합니다."""
+
+    def __init__(self, max_entries: int = API_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._entry_tags: Dict[str, Set[str]] = {}
+        self._tag_keys: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, tags: Set[str]):
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._entry_tags[key] = tags
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self._tag_keys.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._entry_tags.clear()
+            self._tag_keys.clear()
+
+    def _remove(self, key: str):
+        """(락 안에서 호출)"""
+        if self._entries.pop(key, None) is None:
+            return
+        for tag in self._entry_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+
+class SQLiteCacheBackend:
+    """여러 uvicorn 워커가 공유할 수 있는 로컬 SQLite 파일 캐시. (크롤러가 다른 프로세스에서 돌아도 무효화가 공유됨)"""
+
+    def __init__(self, path: str = API_CACHE_PATH, max_entries: int = API_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                etag TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS entry_tags (tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key))")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_entry_tags_key ON entry_tags (key)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, expires_at FROM entries WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return CacheEntry(*row)
+
+    def set(self, key: str, entry: CacheEntry, tags: Set[str]):
+        with self._lock:
+            self._conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, body, etag, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, entry.body, entry.etag, entry.expires_at, time.time()),
+            )
+            self._conn.executemany("INSERT OR IGNORE INTO entry_tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in tags])
+            overflow = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                victims = [row[0] for row in self._conn.execute(
+                    "SELECT key FROM entries ORDER BY last_access ASC LIMIT ?", (overflow,)
+                )]
+                self._delete_keys(victims)
+            self._conn.commit()
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if not tags:
+            return 0
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(row[0] for row in self._conn.execute("SELECT key FROM entry_tags WHERE tag = ?", (tag,)))
+            self._delete_keys(list(keys))
+            self._conn.commit()
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM entry_tags")
+            self._conn.commit()
+
+    def _delete_keys(self, keys):
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+        self._conn.executemany("DELETE FROM entry_tags WHERE key = ?", [(key,) for key in keys])
+
+
+class ApiCache:
+    """
+    읽기 전용 API 응답(JSON 본문)을 캐시합니다.
+
+    - 키: 요청 경로 + 정렬된 쿼리 파라미터 (MBID는 경로에 포함)
+    - 값: 직렬화된 응답 본문과 그 해시로 만든 ETag. `If-None-Match`가 같으면 304를 돌려줍니다.
+    - 무효화: 응답에 관련된 곡/인물 태그 단위. 크롤러 저장 경로(batch_writer)와 Genius 가져오기가 호출합니다.
+    """
+
+    def __init__(self, backend, ttl_seconds: float = API_CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0 # 무효화할 때마다 증가 (계산 중에 무효화된 응답은 저장하지 않기 위함)
+
+    @staticmethod
+    def make_key(request: Request) -> str:
+        return request.url.path + "?" + "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+
+    def respond(self, request: Request, compute: Callable[[], Tuple[bytes, Set[str]]]) -> Response:
+        """
+        캐시된 응답을 돌려주거나, compute()로 (JSON 본문, 태그)를 만들어 저장한 뒤 돌려줍니다.
+        compute()가 HTTPException을 던지면 캐시하지 않고 그대로 전달됩니다.
+        """
+        key = self.make_key(request)
+        entry = self.backend.get(key) if self.backend is not None else None
+        if entry is None:
+            self.misses += 1
+            generation = self._generation
+            body, tags = compute()
+            entry = CacheEntry(body, '"' + hashlib.sha1(body).hexdigest() + '"', time.time() + self.ttl_seconds)
+            if self.backend is not None and generation == self._generation:
+                self.backend.set(key, entry, tags)
+        else:
+            self.hits += 1
+
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"} # 매번 재검증 (변경 없으면 304)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and entry.etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def invalidate(self, song_ids: Iterable[int] = (), person_ids: Iterable[int] = (), search: bool = True) -> int:
+        """곡/인물이 변경되었을 때 관련 응답을 지웁니다. 지운 항목 수를 반환합니다."""
+        if self.backend is None:
+            return 0
+        self._generation += 1
+        tags = {song_tag(song_id) for song_id in song_ids} | {person_tag(person_id) for person_id in person_ids}
+        if search:
+            tags.add(SEARCH_TAG)
+        return self.backend.invalidate(tags)
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+
+def _create_backend():
+    if API_CACHE_BACKEND == "off":
+        return None
+    if API_CACHE_BACKEND == "sqlite":
+        return SQLiteCacheBackend()
+    return MemoryCacheBackend()
+
+
+api_cache = ApiCache(_create_backend())
@@ -0,0 +1,215 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from . import collaborators, crud, metrics, models, roles, schemas, search_index
+from .api_cache import api_cache
+from .graph_index import graph_index
+from .identity_cache import PersonCacheTransaction, PersonIdentityCache
+
+logger = logging.getLogger(__name__)
+
+
+def _insert_ignore(db: Session, model):
+    """DB 종류에 맞는 `INSERT ... ON CONFLICT DO NOTHING` 구문을 만듭니다."""
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(model.__table__)
+
+
+def _dedupe_songs(parsed_songs: List[schemas.CrawledSongData]) -> List[schemas.CrawledSongData]:
+    """MBID가 없는 곡과 페이지 내 중복 곡을 제거합니다. (먼저 나온 곡 유지)"""
+    seen = set()
+    unique_songs = []
+    for parsed_song in parsed_songs:
+        if not parsed_song.mbid or parsed_song.mbid in seen:
+            continue
+        seen.add(parsed_song.mbid)
+        unique_songs.append(parsed_song)
+    return unique_songs
+
+
+def _resolve_persons(db: Session, songs: List[schemas.CrawledSongData],
+                     transaction: PersonCacheTransaction) -> int:
+    """
+    곡들의 기여자를 캐시에 올려둡니다. DB에 없는 인물은 일괄 INSERT 후 다시 로드하여
+    이 트랜잭션에만 보관합니다. (커밋 후 공유 캐시에 추가)
+    """
+    keys = [(c.person_mbid, c.person_name) for song in songs for c in song.contributions]
+    transaction.cache.prefetch(db, keys)
+
+    new_person_rows: Dict[str, Dict[str, Any]] = {}
+    for mbid, name in keys:
+        if transaction.get(mbid, name):
+            continue
+        # 같은 페이지에서 같은 인물이 여러 번 나와도 한 번만 생성합니다.
+        row_key = mbid or f"name:{name}"
+        new_person_rows.setdefault(row_key, {
+            "name": name,
+            "mbid": mbid,
+            "genius_id": None,
+            "image_url": None,
+            "is_explored": False,
+        })
+
+    if not new_person_rows:
+        return 0
+
+    db.execute(_insert_ignore(db, models.Person).on_conflict_do_nothing(), list(new_person_rows.values()))
+    created = crud.get_persons_by_mbids_or_names(
+        db,
+        mbids={row["mbid"] for row in new_person_rows.values() if row["mbid"]},
+        names={row["name"] for row in new_person_rows.values()},
+    )
+    for db_person in created:
+        transaction.add_model(db_person)
+    return len(new_person_rows)
+
+
+def _insert_songs(db: Session, songs: List[schemas.CrawledSongData],
+                  transaction: PersonCacheTransaction) -> Tuple[Dict[str, int], List[str], Dict[str, Set[int]], Dict[str, int]]:
+    """
+    곡, 인물, 기여 관계를 executemany 방식으로 일괄 INSERT합니다. (커밋은 하지 않음)
+    반환값: ({song_mbid: song_id}, 기여자 MBID 목록, 변경된 곡/인물 ID {"song_ids", "person_ids"},
+            커밋 후 지표에 더할 행 수 {"persons", "contributions"})
+    """
+    started = time.perf_counter()
+    new_person_count = _resolve_persons(db, songs, transaction)
+    person_seconds = time.perf_counter() - started
+    metrics.STAGE_SECONDS.observe(person_seconds, stage=metrics.PERSON_RESOLUTION)
+
+    song_rows = [
+        {
+            "title": song.title,
+            "artist": song.artist,
+            "album": song.album,
+            "release_date": song.release_date,
+            "source_url": song.source_url,
+            "youtube_url": song.youtube_url,
+            "mbid": song.mbid,
+        }
+        for song in songs
+    ]
+    db.execute(_insert_ignore(db, models.Song).on_conflict_do_nothing(index_elements=["mbid"]), song_rows)
+    song_ids = crud.get_song_ids_by_mbids(db, {song.mbid for song in songs})
+    role_ids = roles.get_role_ids(db, {c.role for song in songs for c in song.contributions})
+
+    contribution_rows = {}
+    person_mbids = []
+    person_names: Dict[int, str] = {}
+    for song in songs:
+        song_id = song_ids[song.mbid]
+        for contribution in song.contributions:
+            person = transaction.get(contribution.person_mbid, contribution.person_name)
+            if person is None:
+                raise LookupError(f"인물 '{contribution.person_name}'을(를) 확인할 수 없습니다.")
+            if person.mbid:
+                person_mbids.append(person.mbid)
+            person_names[person.id] = person.name
+            role_id = role_ids[contribution.role]
+            contribution_rows[(song_id, person.id, role_id)] = {
+                "song_id": song_id,
+                "person_id": person.id,
+                "role_id": role_id,
+            }
+
+    # 협업 쌍 테이블은 기여 관계가 INSERT되기 전의 참여자 목록을 기준으로 갱신합니다.
+    memberships: Dict[int, Set[int]] = defaultdict(set)
+    for song_id, person_id, _ in contribution_rows:
+        memberships[song_id].add(person_id)
+    added_members, existing_members = collaborators.record_new_contributions(db, memberships)
+    search_index.record_new_contributions(
+        db, added_members, person_names, {song_ids[song.mbid]: song.title for song in songs}
+    )
+    # 캐시 무효화 대상: 참여자가 바뀐 곡과, 그 곡의 기존/신규 참여자 전원 (협업자 목록이 바뀜)
+    touched_persons: Set[int] = set()
+    for song_id, added in added_members.items():
+        touched_persons |= added | existing_members.get(song_id, set())
+    changes = {"song_ids": set(added_members), "person_ids": touched_persons}
+
+    if contribution_rows:
+        stmt = _insert_ignore(db, models.Contribution).on_conflict_do_nothing(
+            index_elements=["song_id", "person_id", "role_id"]
+        )
+        db.execute(stmt, list(contribution_rows.values()))
+
+    metrics.STAGE_SECONDS.observe(time.perf_counter() - started - person_seconds, stage=metrics.DB_INSERT)
+    return song_ids, person_mbids, changes, {"persons": new_person_count, "contributions": len(contribution_rows)}
+
+
+def _commit_page(db: Session, transaction: PersonCacheTransaction, songs: List[schemas.CrawledSongData],
+                 changes: Dict[str, Set[int]], written: Dict[str, int]):
+    with metrics.timed(metrics.DB_COMMIT):
+        db.commit()
+    transaction.commit()
+    api_cache.invalidate(**changes)
+    if written["contributions"]:
+        graph_index.invalidate()
+    metrics.SONGS_IMPORTED.inc(len(songs))
+    metrics.PERSONS_CREATED.inc(written["persons"])
+    metrics.CONTRIBUTIONS_WRITTEN.inc(written["contributions"])
+
+
+def _write_songs(db: Session, songs: List[schemas.CrawledSongData],
+                 person_cache: PersonIdentityCache) -> Tuple[Dict[str, int], List[str]]:
+    """
+    곡들을 한 트랜잭션으로 저장하고 커밋합니다. ({song_mbid: song_id}, 기여자 MBID 목록)
+    어떤 예외든 발생하면 DB를 롤백하고, 이 트랜잭션에서 만든 인물은 공유 캐시에 넣지 않습니다.
+    """
+    with person_cache.transaction() as transaction:
+        try:
+            song_ids, person_mbids, changes, written = _insert_songs(db, songs, transaction)
+            _commit_page(db, transaction, songs, changes, written)
+        except BaseException:
+            db.rollback()
+            raise
+    return song_ids, person_mbids
+
+
+def write_song_page(db: Session, parsed_songs: List[schemas.CrawledSongData],
+                    person_cache: PersonIdentityCache) -> Dict[str, Any]:
+    """
+    `get_artist_recordings` 한 페이지 분량의 곡을 한 번의 트랜잭션으로 저장합니다.
+
+    1. 이미 저장된 곡은 MBID `IN (...)` 쿼리 한 번으로 걸러냅니다.
+    2. 신규 곡/인물/기여 관계를 일괄 INSERT하고 페이지당 한 번만 커밋합니다.
+    3. 일괄 저장이 실패하면 곡 단위로 다시 시도하여, 문제가 있는 곡만 건너뜁니다.
+    """
+    songs = _dedupe_songs(parsed_songs)
+    existing_song_ids = crud.get_song_ids_by_mbids(db, {song.mbid for song in songs})
+    new_songs = [song for song in songs if song.mbid not in existing_song_ids]
+
+    result = {
+        "imported_song_count": 0,
+        "skipped_song_count": len(parsed_songs) - len(new_songs),
+        "failed_song_mbids": [],
+        "song_ids": [],
+        "person_mbids": [],
+    }
+    if not new_songs:
+        return result
+
+    try:
+        song_ids, person_mbids = _write_songs(db, new_songs, person_cache)
+        result["imported_song_count"] = len(new_songs)
+        result["song_ids"] = list(song_ids.values())
+        result["person_mbids"] = person_mbids
+        return result
+    except (SQLAlchemyError, LookupError) as e:
+        logger.warning("페이지 일괄 저장 실패, 곡 단위로 재시도합니다: %s", e)
+
+    for song in new_songs:
+        try:
+            song_ids, person_mbids = _write_songs(db, [song], person_cache)
+        except (SQLAlchemyError, LookupError) as e:
+            logger.error("곡 '%s' (MBID: %s) 저장 중 DB 오류: %s", song.title, song.mbid, e)
+            result["failed_song_mbids"].append(song.mbid)
+            continue
+        result["imported_song_count"] += 1
+        result["song_ids"].extend(song_ids.values())
+        result["person_mbids"].extend(person_mbids)
+    return result
@@ -0,0 +1,119 @@
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+
+logger = logging.getLogger(__name__)
+
+REBUILD_SONG_CHUNK_SIZE = 2000 # 전체 재구성 시 한 번에 처리할 곡 수
+IN_QUERY_CHUNK_SIZE = 500
+
+
+def _existing_members(db: Session, song_ids: Iterable[int]) -> Dict[int, Set[int]]:
+    """곡별로 이미 기여 관계가 저장된 인물 ID 목록을 조회합니다."""
+    members: Dict[int, Set[int]] = defaultdict(set)
+    values = list(song_ids)
+    for start in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+        chunk = values[start:start + IN_QUERY_CHUNK_SIZE]
+        rows = (
+            db.query(models.Contribution.song_id, models.Contribution.person_id)
+            .filter(models.Contribution.song_id.in_(chunk))
+            .distinct()
+            .all()
+        )
+        for song_id, person_id in rows:
+            members[song_id].add(person_id)
+    return members
+
+
+def _apply_pair_deltas(db: Session, new_members: Dict[int, Set[int]],
+                       old_members: Dict[int, Set[int]]) -> Dict[int, Set[int]]:
+    """
+    곡별 새 참여자(new)와 기존 참여자(old)로 늘어난 협업 쌍을 계산하여 UPSERT합니다.
+    새 참여자끼리, 그리고 새 참여자와 기존 참여자 사이의 쌍만 +1 되므로 같은 곡이 두 번 집계되지 않습니다.
+    행마다 정수 하나만 더하므로, 협업이 많은 허브 인물도 페이지당 쓰기 비용이 늘어나지 않습니다.
+    반환값: 곡별로 실제로 새로 추가된 참여자 ({song_id: {person_id}})
+    """
+    pair_counts: Dict[Tuple[int, int], int] = defaultdict(int)
+    added_members: Dict[int, Set[int]] = {}
+    for song_id, persons in new_members.items():
+        added = persons - old_members.get(song_id, set())
+        if not added:
+            continue
+        added_members[song_id] = added
+        everyone = added | old_members.get(song_id, set())
+        for person_id in added:
+            for other_id in everyone:
+                if other_id == person_id:
+                    continue
+                pair_counts[(person_id, other_id)] += 1
+                if other_id not in added:
+                    # 기존 참여자 쪽 방향도 함께 갱신
+                    pair_counts[(other_id, person_id)] += 1
+
+    if not pair_counts:
+        return added_members
+
+    table = models.CollaboratorPair.__table__
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["person_id", "collaborator_id"],
+        set_={"shared_song_count": table.c.shared_song_count + stmt.excluded.shared_song_count},
+    )
+    db.execute(stmt, [
+        {"person_id": person_id, "collaborator_id": other_id, "shared_song_count": count}
+        for (person_id, other_id), count in pair_counts.items()
+    ])
+    return added_members
+
+
+def record_new_contributions(db: Session, memberships: Dict[int, Set[int]]
+                             ) -> Tuple[Dict[int, Set[int]], Dict[int, Set[int]]]:
+    """
+    곡별 참여 인물({song_id: {person_id}})을 협업 쌍 테이블에 반영합니다. (커밋은 하지 않음)
+    기여 관계를 INSERT하기 전에 같은 트랜잭션 안에서 호출해야 합니다.
+    반환값: (곡별로 새로 추가된 참여자, 곡별로 이미 저장되어 있던 참여자)
+    """
+    if not memberships:
+        return {}, {}
+    existing_members = _existing_members(db, memberships.keys())
+    return _apply_pair_deltas(db, memberships, existing_members), existing_members
+
+
+def rebuild_collaborator_pairs(db: Session) -> int:
+    """contributions 테이블 전체로부터 협업 쌍 테이블을 다시 만듭니다. 생성된 행 수를 반환합니다."""
+    db.query(models.CollaboratorPair).delete()
+    last_song_id = 0
+    while True:
+        song_ids = [
+            song_id for (song_id,) in
+            db.query(models.Contribution.song_id)
+            .filter(models.Contribution.song_id > last_song_id)
+            .distinct()
+            .order_by(models.Contribution.song_id)
+            .limit(REBUILD_SONG_CHUNK_SIZE)
+            .all()
+        ]
+        if not song_ids:
+            break
+        _apply_pair_deltas(db, _existing_members(db, song_ids), {})
+        last_song_id = song_ids[-1]
+    db.commit()
+    pair_count = db.query(func.count()).select_from(models.CollaboratorPair).scalar()
+    logger.info("협업 쌍 테이블 재구성 완료: %s행", pair_count)
+    return pair_count
+
+
+def ensure_collaborator_pairs(db: Session):
+    """협업 쌍 테이블이 비어 있는데 기여 관계가 있으면 (기존 DB) 한 번 채웁니다."""
+    has_pairs = db.query(models.CollaboratorPair.person_id).first() is not None
+    has_contributions = db.query(models.Contribution.song_id).first() is not None
+    if has_contributions and not has_pairs:
+        logger.info("기존 데이터로 협업 쌍 테이블을 생성합니다...")
+        rebuild_collaborator_pairs(db)
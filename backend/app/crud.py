@@ -1,49 +1,132 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import Boolean
-from . import models, schemas, genius_api
+import logging
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy import Boolean, func
+from . import models, schemas, genius_api, search_index, collaborators, roles
+from .api_cache import api_cache
 from fastapi import HTTPException
 from datetime import date
-from typing import List, Set, Tuple, Dict, Optional
+from typing import Any, Iterator, List, Set, Tuple, Dict, Optional
 from collections import Counter, defaultdict
 
+logger = logging.getLogger(__name__)
+
+# IN (...) 쿼리 한 번에 넘길 최대 값 개수 (SQLite 바인드 변수 제한 대비)
+IN_QUERY_CHUNK_SIZE = 500
+
 # --- Person CRUD ---
 
 def get_person(db: Session, person_id: int) -> Optional[models.Person]:
-    print(f"[LOG][CRUD] get_person 호출: person_id={person_id}")
+    logger.debug("get_person 호출: person_id=%s", person_id)
     result = db.query(models.Person).filter(models.Person.id == person_id).first()
-    print(f"[LOG][CRUD] get_person 반환: {result.name if result else 'None'}")
+    logger.debug("get_person 반환: %s", result.name if result else 'None')
     return result
 
 def get_person_by_genius_id(db: Session, genius_id: int) -> Optional[models.Person]:
     """Helper function to get a person by their Genius ID."""
-    print(f"[LOG][CRUD] get_person_by_genius_id 호출: genius_id={genius_id}")
+    logger.debug("get_person_by_genius_id 호출: genius_id=%s", genius_id)
     result = db.query(models.Person).filter(models.Person.genius_id == genius_id).first()
-    print(f"[LOG][CRUD] get_person_by_genius_id 반환: {result.name if result else 'None'}")
+    logger.debug("get_person_by_genius_id 반환: %s", result.name if result else 'None')
     return result
 
 def get_person_by_mbid(db: Session, mbid: str) -> Optional[models.Person]:
     """Helper function to get a person by their MusicBrainz ID."""
-    print(f"[LOG][CRUD] get_person_by_mbid 호출: mbid={mbid}")
+    logger.debug("get_person_by_mbid 호출: mbid=%s", mbid)
     result = db.query(models.Person).filter(models.Person.mbid == mbid).first()
-    print(f"[LOG][CRUD] get_person_by_mbid 반환: {result.name if result else 'None'}")
+    logger.debug("get_person_by_mbid 반환: %s", result.name if result else 'None')
     return result
 
 def get_person_by_name(db: Session, name: str) -> Optional[models.Person]:
     """Helper function to get a person by their name."""
-    print(f"[LOG][CRUD] get_person_by_name 호출: name='{name}'")
+    logger.debug("get_person_by_name 호출: name='%s'", name)
     result = db.query(models.Person).filter(models.Person.name == name).first()
-    print(f"[LOG][CRUD] get_person_by_name 반환: {result.name if result else 'None'}")
+    logger.debug("get_person_by_name 반환: %s", result.name if result else 'None')
     return result
 
-def get_persons(db: Session, skip: int = 0, limit: int = 100) -> List[models.Person]:
-    print(f"[LOG][CRUD] get_persons 호출: skip={skip}, limit={limit}")
-    results = db.query(models.Person).offset(skip).limit(limit).all()
-    print(f"[LOG][CRUD] get_persons 반환: 총 {len(results)}명")
+def count_songs_by_person_role(db: Session, mbid: str, role_name: str) -> int:
+    """인물(MBID)이 해당 역할(roles.name)로 참여한 저장된 곡 수를 반환합니다."""
+    return (
+        db.query(func.count(models.Contribution.song_id))
+        .join(models.Person, models.Person.id == models.Contribution.person_id)
+        .join(models.Role, models.Role.id == models.Contribution.role_id)
+        .filter(models.Person.mbid == mbid, models.Role.name == role_name)
+        .scalar()
+    )
+
+def get_persons_by_mbids_or_names(db: Session, mbids: Set[str], names: Set[str]) -> List[models.Person]:
+    """MBID 또는 이름 목록에 해당하는 인물들을 `IN (...)` 쿼리로 일괄 조회합니다."""
+    results: Dict[int, models.Person] = {}
+    for column, values in ((models.Person.mbid, list(mbids)), (models.Person.name, list(names))):
+        # SQLite의 바인드 변수 개수 제한을 고려하여 나누어 조회합니다.
+        for start in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+            chunk = values[start:start + IN_QUERY_CHUNK_SIZE]
+            for person in db.query(models.Person).filter(column.in_(chunk)).all():
+                results[person.id] = person
+    return list(results.values())
+
+def get_person_crawl_stats(db: Session, mbids: Set[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    탐색 우선순위 계산용 통계를 일괄 조회합니다.
+    반환값: {mbid: {"song_count": 참여 곡 수, "role_counts": {역할: 횟수}, "latest_release": 최근 발매일}}
+    """
+    values = [mbid for mbid in mbids if mbid]
+    stats: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+        chunk = values[start:start + IN_QUERY_CHUNK_SIZE]
+        song_rows = (
+            db.query(
+                models.Person.mbid,
+                func.count(func.distinct(models.Contribution.song_id)),
+                func.max(models.Song.release_date),
+            )
+            .join(models.Contribution, models.Contribution.person_id == models.Person.id)
+            .join(models.Song, models.Song.id == models.Contribution.song_id)
+            .filter(models.Person.mbid.in_(chunk))
+            .group_by(models.Person.mbid)
+            .all()
+        )
+        for mbid, song_count, latest_release in song_rows:
+            stats[mbid] = {"song_count": song_count, "role_counts": {}, "latest_release": latest_release}
+
+        role_rows = (
+            db.query(models.Person.mbid, models.Role.name, func.count())
+            .join(models.Contribution, models.Contribution.person_id == models.Person.id)
+            .join(models.Role, models.Role.id == models.Contribution.role_id)
+            .filter(models.Person.mbid.in_(chunk))
+            .group_by(models.Person.mbid, models.Role.name)
+            .all()
+        )
+        for mbid, role, role_count in role_rows:
+            if mbid in stats:
+                stats[mbid]["role_counts"][role] = role_count
+    return stats
+
+def _paginate(db: Session, model, contribution_target, skip: int, limit: int,
+              after_id: Optional[int], include_contributions: bool) -> list:
+    """
+    목록 조회 공통 로직.
+    - after_id가 있으면 키셋 페이지네이션 (`id > after_id ORDER BY id`): 페이지 깊이와 관계없이 인덱스로 바로 찾습니다.
+    - 없으면 기존 offset 방식 (skip=0이면 키셋의 첫 페이지와 같음)
+    - include_contributions: 기여 관계를 selectinload로 페이지당 한 번에 미리 로드합니다.
+    """
+    query = db.query(model)
+    if include_contributions:
+        query = query.options(selectinload(model.contributions).joinedload(contribution_target))
+    if after_id is not None:
+        query = query.filter(model.id > after_id).order_by(model.id)
+    else:
+        query = query.order_by(model.id).offset(skip)
+    return query.limit(limit).all()
+
+def get_persons(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None,
+                include_contributions: bool = True) -> List[models.Person]:
+    logger.debug("get_persons 호출: skip=%s, after_id=%s, limit=%s", skip, after_id, limit)
+    results = _paginate(db, models.Person, models.Contribution.song, skip, limit, after_id, include_contributions)
+    logger.debug("get_persons 반환: 총 %s명", len(results))
     return results
 
 def create_person(db: Session, person: schemas.PersonCreate) -> models.Person:
     """Creates a new Person instance from a schema, adds it to the session, but does not commit."""
-    print(f"[LOG][CRUD] create_person 호출: name='{person.name}', mbid={person.mbid}")
+    logger.debug("create_person 호출: name='%s', mbid=%s", person.name, person.mbid)
     db_person = models.Person(
         name=person.name,
         genius_id=person.genius_id,
@@ -54,78 +137,165 @@ def create_person(db: Session, person: schemas.PersonCreate) -> models.Person:
     db.add(db_person)
     # db.flush() # REMOVED
     # db.refresh(db_person) # REMOVED
-    print(f"[LOG][CRUD] create_person 생성됨: name='{db_person.name}' (ID는 flush/commit 후에만 얻을 수 있음)")
+    logger.debug("create_person 생성됨: name='%s' (ID는 flush/commit 후에만 얻을 수 있음)", db_person.name)
     return db_person
 
 def update_person_explored_status(db: Session, person_id: int, status: bool) -> Optional[models.Person]:
     """Updates the is_explored status for a given person."""
-    print(f"[LOG][CRUD] update_person_explored_status 호출: person_id={person_id}, status={status}")
+    logger.debug("update_person_explored_status 호출: person_id=%s, status=%s", person_id, status)
     db_person = db.query(models.Person).filter(models.Person.id == person_id).first()
     if db_person:
         db_person.is_explored = status
         db.add(db_person)
         # db.flush() # REMOVED
         # db.refresh(db_person) # REMOVED
-        print(f"[LOG][CRUD] update_person_explored_status 업데이트됨: id={db_person.id}, is_explored={db_person.is_explored}")
+        logger.debug("update_person_explored_status 업데이트됨: id=%s, is_explored=%s", db_person.id, db_person.is_explored)
     else:
-        print(f"[LOG][CRUD] update_person_explored_status: person_id={person_id} 찾을 수 없음.")
+        logger.debug("update_person_explored_status: person_id=%s 찾을 수 없음.", person_id)
     return db_person
 
+def _load_ranked(db: Session, model, ranked_ids: List[int]) -> list:
+    """검색 색인이 돌려준 ID 순서대로 모델 객체를 조회합니다."""
+    if not ranked_ids:
+        return []
+    by_id = {obj.id: obj for obj in db.query(model).filter(model.id.in_(ranked_ids)).all()}
+    return [by_id[entity_id] for entity_id in ranked_ids if entity_id in by_id]
+
 def search_persons_by_name(db: Session, query: str, limit: int = 10) -> List[models.Person]:
-    """Search for persons by name (partial match)."""
+    """Search for persons by name (FTS prefix/choseong match, ranked by song count)."""
+    if search_index.is_enabled(db):
+        ranked = search_index.search(db, query, "person", limit=limit)
+        return _load_ranked(db, models.Person, [person_id for person_id, _ in ranked])
     return db.query(models.Person).filter(models.Person.name.ilike(f"%{query}%")).limit(limit).all()
 
 
 # --- Song CRUD ---
 
 def get_song(db: Session, song_id: int) -> Optional[models.Song]:
-    print(f"[LOG][CRUD] get_song 호출: song_id={song_id}")
+    logger.debug("get_song 호출: song_id=%s", song_id)
     result = db.query(models.Song).filter(models.Song.id == song_id).first()
-    print(f"[LOG][CRUD] get_song 반환: {result.title if result else 'None'}")
+    logger.debug("get_song 반환: %s", result.title if result else 'None')
     return result
 
 def get_song_by_genius_id(db: Session, genius_id: int) -> Optional[models.Song]:
-    print(f"[LOG][CRUD] get_song_by_genius_id 호출: genius_id={genius_id}")
+    logger.debug("get_song_by_genius_id 호출: genius_id=%s", genius_id)
     result = db.query(models.Song).filter(models.Song.genius_id == genius_id).first()
-    print(f"[LOG][CRUD] get_song_by_genius_id 반환: {result.title if result else 'None'}")
+    logger.debug("get_song_by_genius_id 반환: %s", result.title if result else 'None')
     return result
 
 def get_song_by_mbid(db: Session, mbid: str) -> Optional[models.Song]:
     """Helper function to get a song by its MusicBrainz ID."""
-    print(f"[LOG][CRUD] get_song_by_mbid 호출: mbid='{mbid}' (type: {type(mbid)}, len: {len(mbid)})")
+    logger.debug("get_song_by_mbid 호출: mbid='%s'", mbid)
     result = db.query(models.Song).filter(models.Song.mbid == mbid).first()
     if not result:
-        print(f"[LOG][CRUD]  >> Song with mbid='{mbid}' NOT FOUND!")
-    print(f"[LOG][CRUD] get_song_by_mbid 반환: {result.title if result else 'None'}")
+        logger.debug(">> Song with mbid='%s' NOT FOUND!", mbid)
+    logger.debug("get_song_by_mbid 반환: %s", result.title if result else 'None')
+    return result
+
+def get_song_ids_by_mbids(db: Session, mbids: Set[str]) -> Dict[str, int]:
+    """MBID 목록 중 DB에 이미 존재하는 곡들의 {mbid: id} 매핑을 일괄 조회합니다."""
+    values = [mbid for mbid in mbids if mbid]
+    result: Dict[str, int] = {}
+    for start in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+        chunk = values[start:start + IN_QUERY_CHUNK_SIZE]
+        rows = db.query(models.Song.mbid, models.Song.id).filter(models.Song.mbid.in_(chunk)).all()
+        result.update({mbid: song_id for mbid, song_id in rows})
     return result
 
 def get_song_by_source_url(db: Session, source_url: str) -> Optional[models.Song]:
-    print(f"[LOG][CRUD] get_song_by_source_url 호출: source_url='{source_url}'")
+    logger.debug("get_song_by_source_url 호출: source_url='%s'", source_url)
     result = db.query(models.Song).filter(models.Song.source_url == source_url).first()
-    print(f"[LOG][CRUD] get_song_by_source_url 반환: {result.title if result else 'None'}")
+    logger.debug("get_song_by_source_url 반환: %s", result.title if result else 'None')
     return result
 
-def get_songs(db: Session, skip: int = 0, limit: int = 100) -> List[models.Song]:
-    print(f"[LOG][CRUD] get_songs 호출: skip={skip}, limit={limit}")
-    results = db.query(models.Song).offset(skip).limit(limit).all()
-    print(f"[LOG] crud.get_songs 반환: 총 {len(results)}곡")
+def get_songs(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None,
+              include_contributions: bool = True) -> List[models.Song]:
+    logger.debug("get_songs 호출: skip=%s, after_id=%s, limit=%s", skip, after_id, limit)
+    results = _paginate(db, models.Song, models.Contribution.person, skip, limit, after_id, include_contributions)
+    logger.debug("crud.get_songs 반환: 총 %s곡", len(results))
     return results
 
 def create_song(db: Session, song: models.Song) -> models.Song:
     """단순히 준비된 Song 모델 객체를 데이터베이스에 추가합니다."""
-    print(f"[LOG][CRUD] create_song 호출: title='{song.title}', mbid={song.mbid}")
+    logger.debug("create_song 호출: title='%s', mbid=%s", song.title, song.mbid)
     db.add(song)
     # db.flush() # REMOVED
     # db.refresh(song) # REMOVED
-    print(f"[LOG][CRUD] create_song 생성됨: title='{song.title}' (ID는 flush/commit 후에만 얻을 수 있음)")
+    logger.debug("create_song 생성됨: title='%s' (ID는 flush/commit 후에만 얻을 수 있음)", song.title)
     return song
 
 def search_songs_by_title(db: Session, query: str, limit: int = 10) -> List[models.Song]:
-    """Search for songs by title (partial match)."""
+    """Search for songs by title (FTS prefix/choseong match, ranked by contributor count)."""
+    if search_index.is_enabled(db):
+        ranked = search_index.search(db, query, "song", limit=limit)
+        return _load_ranked(db, models.Song, [song_id for song_id, _ in ranked])
     return db.query(models.Song).filter(models.Song.title.ilike(f"%{query}%")).limit(limit).all()
 
 
 
+# --- Export ---
+
+EXPORT_BATCH_SIZE = 1000
+
+def _iter_export_batches(db: Session, model, columns) -> Iterator[List[Dict[str, Any]]]:
+    """
+    테이블 전체를 id 키셋으로 EXPORT_BATCH_SIZE개씩 읽습니다.
+    ORM 객체 대신 컬럼 값만 읽으므로 세션에 객체가 쌓이지 않고, 배치마다 읽기 트랜잭션을 짧게 끝냅니다.
+    """
+    last_id = 0
+    while True:
+        rows = (
+            db.query(*columns)
+            .filter(model.id > last_id)
+            .order_by(model.id)
+            .limit(EXPORT_BATCH_SIZE)
+            .all()
+        )
+        if not rows:
+            return
+        yield [row._asdict() for row in rows]
+        last_id = rows[-1].id
+        db.rollback() # 배치 사이에 읽기 트랜잭션을 닫아 WAL 체크포인트를 막지 않도록 합니다.
+
+def _contributions_by(db: Session, column, ids: List[int], fields) -> Dict[int, List[Dict[str, Any]]]:
+    grouped: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    rows = (
+        db.query(column, *fields)
+        .join(models.Role, models.Role.id == models.Contribution.role_id)
+        .filter(column.in_(ids))
+        .all()
+    )
+    for row in rows:
+        grouped[row[0]].append({field.key: value for field, value in zip(fields, row[1:])})
+    return grouped
+
+def iter_songs_for_export(db: Session) -> Iterator[Dict[str, Any]]:
+    """모든 곡을 {곡 컬럼..., contributions: [{person_id, role}]} 형태로 하나씩 반환합니다."""
+    columns = [models.Song.id, models.Song.title, models.Song.artist, models.Song.album, models.Song.release_date,
+               models.Song.genius_id, models.Song.mbid, models.Song.youtube_url, models.Song.source_url]
+    for batch in _iter_export_batches(db, models.Song, columns):
+        contributions = _contributions_by(
+            db, models.Contribution.song_id, [row["id"] for row in batch],
+            (models.Contribution.person_id, models.Role.name.label("role")),
+        )
+        for row in batch:
+            row["contributions"] = contributions.get(row["id"], [])
+            yield row
+
+def iter_persons_for_export(db: Session) -> Iterator[Dict[str, Any]]:
+    """모든 인물을 {인물 컬럼..., contributions: [{song_id, role}]} 형태로 하나씩 반환합니다."""
+    columns = [models.Person.id, models.Person.name, models.Person.genius_id, models.Person.mbid,
+               models.Person.image_url, models.Person.source_url, models.Person.is_explored]
+    for batch in _iter_export_batches(db, models.Person, columns):
+        contributions = _contributions_by(
+            db, models.Contribution.person_id, [row["id"] for row in batch],
+            (models.Contribution.song_id, models.Role.name.label("role")),
+        )
+        for row in batch:
+            row["contributions"] = contributions.get(row["id"], [])
+            yield row
+
+
 def import_genius_song_data(db: Session, genius_song_id: int) -> (models.Song, bool):
     """
     Genius API에서 노래 상세 정보를 가져와 데이터베이스에 저장합니다.
@@ -192,9 +362,46 @@ def import_genius_song_data(db: Session, genius_song_id: int) -> (models.Song, b
         title=title, artist=artist_display, album=album_name, release_date=release_date,
         genius_id=genius_song_id, contributions=final_contributions
     )
+    return _save_genius_song(db, song_create_schema), True
 
-    db_song = create_song(db, song=song_create_schema)
-    return db_song, True
+def _save_genius_song(db: Session, song_data: schemas.SongCreate) -> models.Song:
+    """
+    Genius 곡 하나를 인물/기여 관계와 함께 저장하고 커밋합니다.
+    batch_writer와 같은 순서로 협업 쌍과 검색 색인을 갱신한 뒤, 커밋이 끝나면 API 캐시를 지웁니다.
+    """
+    try:
+        db_song = create_song(db, song=models.Song(**song_data.model_dump(exclude={"contributions"})))
+        persons: Dict[int, models.Person] = {}
+        for contribution in song_data.contributions:
+            person = get_person_by_genius_id(db, contribution.person_genius_id)
+            if person is None:
+                person = models.Person(name=contribution.person_name, genius_id=contribution.person_genius_id)
+                db.add(person)
+            persons[contribution.person_genius_id] = person
+        db.flush()
+
+        role_ids = roles.get_role_ids(db, {role for c in song_data.contributions for role in c.roles})
+        # 협업 쌍 테이블은 기여 관계가 INSERT되기 전의 참여자 목록을 기준으로 갱신합니다.
+        added_members, existing_members = collaborators.record_new_contributions(
+            db, {db_song.id: {person.id for person in persons.values()}}
+        )
+        search_index.record_new_contributions(
+            db, added_members, {person.id: person.name for person in persons.values()}, {db_song.id: db_song.title}
+        )
+        db.add_all(
+            models.Contribution(song_id=db_song.id, person_id=persons[c.person_genius_id].id, role_id=role_id)
+            for c in song_data.contributions
+            for role_id in {role_ids[role] for role in c.roles}
+        )
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+
+    # 커밋된 뒤에만 캐시를 지워야, 그 사이의 요청이 변경 전 데이터를 다시 캐시하지 않습니다.
+    touched_person_ids = set().union(*added_members.values(), *existing_members.values())
+    api_cache.invalidate(song_ids=[db_song.id], person_ids=touched_person_ids)
+    return db_song
 
 def batch_import_genius_songs(db: Session, genius_song_ids: List[int]) -> schemas.BatchImportResponse:
     """주어진 Genius 노래 ID 리스트를 일괄적으로 임포트합니다."""
@@ -211,7 +418,7 @@ def batch_import_genius_songs(db: Session, genius_song_ids: List[int]) -> schema
             else:
                 skipped_count += 1
         except Exception as e:
-            print(f"Failed to import song ID {song_id}: {e}")
+            logger.warning("Failed to import song ID %s: %s", song_id, e)
             failed_ids.append(song_id)
             db.rollback()
 
@@ -224,75 +431,106 @@ def batch_import_genius_songs(db: Session, genius_song_ids: List[int]) -> schema
 # --- Collaboration Details ---
 
 
-def get_song_graph_details_by_mbid(db: Session, mbid: str):
+ROLE_SEPARATOR = "\x1f" # 역할 이름에 쉼표가 들어갈 수 있으므로 group_concat 구분자로 제어 문자를 사용
+
+
+def _aggregate_roles(db: Session):
+    """인물별 역할 목록을 하나의 문자열로 합치는 집계 함수 (DB 종류별)"""
+    if db.bind.dialect.name == "postgresql":
+        return func.string_agg(models.Role.name, ROLE_SEPARATOR)
+    return func.group_concat(models.Role.name, ROLE_SEPARATOR)
+
+
+def get_song_graph_details_by_mbid(db: Session, mbid: str) -> Dict[str, Any]:
     """
     특정 곡의 mbid를 받아, 해당 곡(main)과 참여 인물 리스트(related)를 반환합니다.
     프론트엔드의 `getLayoutedElements(data, 'song')` 형식에 맞춘 응답입니다.
+
+    곡/기여 관계/인물을 JOIN 쿼리 한 번으로 가져오고, 인물별 역할은 SQL에서 묶습니다.
+    ORM 객체를 만들지 않고 컬럼 값만 읽으므로 참여 인물 수가 늘어도 쿼리 수는 그대로입니다.
     """
-    song = get_song_by_mbid(db, mbid=mbid)
-    if not song:
+    rows = (
+        db.query(
+            models.Song.id, models.Song.title, models.Song.artist, models.Song.album,
+            models.Song.release_date, models.Song.genius_id, models.Song.mbid, models.Song.youtube_url,
+            models.Person.id, models.Person.name, models.Person.genius_id, models.Person.mbid,
+            models.Person.image_url, _aggregate_roles(db),
+        )
+        .outerjoin(models.Contribution, models.Contribution.song_id == models.Song.id)
+        .outerjoin(models.Person, models.Person.id == models.Contribution.person_id)
+        .outerjoin(models.Role, models.Role.id == models.Contribution.role_id)
+        .filter(models.Song.mbid == mbid)
+        .group_by(models.Song.id, models.Person.id)
+        .order_by(models.Person.id)
+        .all()
+    )
+    if not rows:
         raise HTTPException(status_code=404, detail="Song with given MBID not found in DB.")
 
-    # 각 기여자의 역할을 수집
-    person_roles_map = defaultdict(lambda: {"person": None, "roles": []})
-    for contribution in song.contributions:
-        person = contribution.person
-        if person:
-            person_roles_map[person.id]["person"] = person
-            person_roles_map[person.id]["roles"].append(contribution.role)
-    
-    # 최종 related 리스트 생성
-    related_persons = []
-    for person_id, data in person_roles_map.items():
-        person_obj = data["person"]
-        # Pydantic 모델로 변환하여 역할 정보 추가
-        person_with_roles = schemas.Person.model_validate(person_obj).model_dump()
-        person_with_roles["roles"] = data["roles"]
-        related_persons.append(person_with_roles)
-
-    return {"main": song, "related": related_persons}
+    first = rows[0]
+    main = {
+        "id": first[0], "title": first[1], "artist": first[2], "album": first[3],
+        "release_date": first[4], "genius_id": first[5], "mbid": first[6], "youtube_url": first[7],
+    }
+    related_persons = [
+        {
+            "id": person_id, "name": name, "genius_id": genius_id, "mbid": person_mbid,
+            "image_url": image_url, "roles": roles.split(ROLE_SEPARATOR),
+        }
+        # 기여자가 없는 곡은 인물 컬럼이 모두 NULL인 행 하나만 반환됩니다.
+        for *_, person_id, name, genius_id, person_mbid, image_url, roles in rows
+        if person_id is not None
+    ]
+    return {"main": main, "related": related_persons}
 
 
-def get_collaboration_details_by_mbid(db: Session, mbid: str) -> schemas.CollaborationResponse:
-    """특정 아티스트의 협업자 및 협업 곡 목록을 MBID 기준으로 상세히 반환합니다."""
-    main_artist = get_person_by_mbid(db, mbid=mbid)
-    if not main_artist:
-        raise HTTPException(status_code=404, detail="Main artist not found in DB with the given MBID.")
+def _get_collaboration_details(db: Session, main_artist: models.Person, identifier_column) -> schemas.CollaborationResponse:
+    """
+    미리 집계된 협업 쌍 테이블(collaborator_pairs)에서 협업자 목록을 읽어 응답을 만듭니다.
+    협업자는 인덱스 순서(협업 곡 수 내림차순)로 한 번에 조회하고, 함께 참여한 곡은
+    이 인물의 곡(`ix_contributions_person_song`)과 그 곡의 참여자(기본 키)를 조인하는 쿼리 하나로 찾습니다.
+    곡 정보는 `IN (...)` 쿼리로 일괄 조회합니다.
+    identifier_column: 이 값이 있는 협업자만 포함합니다. (Person.mbid 또는 Person.genius_id)
+    """
+    collaborators = (
+        db.query(models.Person)
+        .join(models.CollaboratorPair, models.CollaboratorPair.collaborator_id == models.Person.id)
+        .filter(models.CollaboratorPair.person_id == main_artist.id, identifier_column.isnot(None))
+        .order_by(models.CollaboratorPair.shared_song_count.desc())
+        .all()
+    )
 
-    collaborations = defaultdict(list)
-    collaborator_objects: Dict[str, models.Person] = {}
+    own = aliased(models.Contribution)
+    other = aliased(models.Contribution)
+    shared_song_ids: Dict[int, Set[int]] = defaultdict(set)
+    shared_rows = (
+        db.query(other.person_id, other.song_id)
+        .join(own, own.song_id == other.song_id)
+        .filter(own.person_id == main_artist.id, other.person_id != main_artist.id)
+        .distinct()
+        .all()
+    )
+    for person_id, song_id in shared_rows:
+        shared_song_ids[person_id].add(song_id)
 
-    # 1. 메인 아티스트가 참여한 모든 곡을 찾습니다.
-    for main_artist_contrib in main_artist.contributions:
-        song = main_artist_contrib.song
-        
-        # 2. 해당 곡에 참여한 다른 모든 사람들을 찾습니다.
-        for song_contrib in song.contributions:
-            collaborator = song_contrib.person
-            
-            # 3. 메인 아티스트 본인은 제외하고, mbid가 있는 협업자만 집계합니다.
-            if collaborator.id != main_artist.id and collaborator.mbid:
-                # 이전에 추가되지 않은 곡만 추가
-                if not any(s.id == song.id for s in collaborations[collaborator.mbid]):
-                    collaborations[collaborator.mbid].append(song)
-
-                if collaborator.mbid not in collaborator_objects:
-                    collaborator_objects[collaborator.mbid] = collaborator
-
-    # 4. 집계된 결과를 CollaborationDetail 스키마 리스트로 변환합니다.
-    collaboration_details_list = []
-    for col_mbid, song_list in collaborations.items():
-        person_obj = collaborator_objects[col_mbid]
-        
-        collaboration_details_list.append(
-            schemas.CollaborationDetail(
-                collaborator=person_obj,
-                songs=[schemas.R_Song.model_validate(s) for s in song_list]
-            )
+    collaborator_song_ids = [
+        (collaborator, sorted(shared_song_ids.get(collaborator.id, ())))
+        for collaborator in collaborators
+    ]
+    all_song_ids = list({song_id for _, song_ids in collaborator_song_ids for song_id in song_ids})
+    songs_by_id: Dict[int, schemas.R_Song] = {}
+    for start in range(0, len(all_song_ids), IN_QUERY_CHUNK_SIZE):
+        chunk = all_song_ids[start:start + IN_QUERY_CHUNK_SIZE]
+        for song in db.query(models.Song).filter(models.Song.id.in_(chunk)).all():
+            songs_by_id[song.id] = schemas.R_Song.model_validate(song)
+
+    collaboration_details_list = [
+        schemas.CollaborationDetail(
+            collaborator=collaborator,
+            songs=[songs_by_id[song_id] for song_id in song_ids if song_id in songs_by_id]
         )
-    
-    # 협업 횟수 순으로 정렬
-    collaboration_details_list.sort(key=lambda x: len(x.songs), reverse=True)
+        for collaborator, song_ids in collaborator_song_ids
+    ]
 
     return schemas.CollaborationResponse(
         main_artist=main_artist,
@@ -300,48 +538,21 @@ def get_collaboration_details_by_mbid(db: Session, mbid: str) -> schemas.Collabo
     )
 
 
+def get_collaboration_details_by_mbid(db: Session, mbid: str) -> schemas.CollaborationResponse:
+    """특정 아티스트의 협업자 및 협업 곡 목록을 MBID 기준으로 상세히 반환합니다."""
+    main_artist = get_person_by_mbid(db, mbid=mbid)
+    if not main_artist:
+        raise HTTPException(status_code=404, detail="Main artist not found in DB with the given MBID.")
+
+    # mbid가 있는 협업자만 집계합니다.
+    return _get_collaboration_details(db, main_artist, models.Person.mbid)
+
+
 def get_collaboration_details(db: Session, genius_id: int) -> schemas.CollaborationResponse:
     """특정 아티스트의 협업자 및 협업 곡 목록을 상세히 반환합니다."""
     main_artist = get_person_by_genius_id(db, genius_id=genius_id)
     if not main_artist:
         raise HTTPException(status_code=404, detail="Main artist not found in DB.")
 
-    collaborations = defaultdict(list)
-    collaborator_objects: Dict[int, models.Person] = {}
-
-    # 1. 메인 아티스트가 참여한 모든 곡을 찾습니다.
-    for main_artist_contrib in main_artist.contributions:
-        song = main_artist_contrib.song
-        
-        # 2. 해당 곡에 참여한 다른 모든 사람들을 찾습니다.
-        for song_contrib in song.contributions:
-            collaborator = song_contrib.person
-            
-            # 3. 메인 아티스트 본인은 제외하고, genius_id가 있는 협업자만 집계합니다.
-            if collaborator.id != main_artist.id and collaborator.genius_id:
-                # 이전에 추가되지 않은 곡만 추가
-                if not any(s.id == song.id for s in collaborations[collaborator.genius_id]):
-                    collaborations[collaborator.genius_id].append(song)
-
-                if collaborator.genius_id not in collaborator_objects:
-                    collaborator_objects[collaborator.genius_id] = collaborator
-
-    # 4. 집계된 결과를 CollaborationDetail 스키마 리스트로 변환합니다.
-    collaboration_details_list = []
-    for col_genius_id, song_list in collaborations.items():
-        person_obj = collaborator_objects[col_genius_id]
-        
-        collaboration_details_list.append(
-            schemas.CollaborationDetail(
-                collaborator=person_obj,
-                songs=[schemas.R_Song.model_validate(s) for s in song_list]
-            )
-        )
-    
-    # 협업 횟수 순으로 정렬
-    collaboration_details_list.sort(key=lambda x: len(x.songs), reverse=True)
-
-    return schemas.CollaborationResponse(
-        main_artist=main_artist,
-        collaborations=collaboration_details_list
-    )
\ No newline at end of file
+    # genius_id가 있는 협업자만 집계합니다.
+    return _get_collaboration_details(db, main_artist, models.Person.genius_id)
@@ -0,0 +1,306 @@
+import logging
+import queue as queue_module
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from fastapi import HTTPException
+
+from . import batch_writer, metrics, schemas
+from .database import SessionLocal, db_file_size_bytes
+from .frontier import ExplorationFrontier
+from .scheduler import CrawlScheduler
+
+logger = logging.getLogger(__name__)
+
+EXPLORATION_FETCH_WORKERS = 4 # 동시에 MusicBrainz 페이지를 가져오는 워커 수
+WRITE_QUEUE_SIZE = 8 # 파싱된 페이지를 쌓아둘 수 있는 최대 개수 (초과 시 수집 단계가 대기)
+IDLE_WAIT_SECONDS = 0.5
+
+
+class _PageJob:
+    """수집 단계 → 저장 단계로 전달되는 Recording 한 페이지."""
+
+    def __init__(self, artist_mbid: str, parsed_songs: List[schemas.CrawledSongData]):
+        self.artist_mbid = artist_mbid
+        self.parsed_songs = parsed_songs
+        self.imported_song_count = 0
+        self.done = threading.Event()
+
+
+class _ArtistDoneJob:
+    """아티스트 수집이 끝났음을 알리는 작업. 성공한 경우 저장 단계에서 탐색 완료로 표시합니다."""
+
+    def __init__(self, artist_mbid: str, artist_name: Optional[str] = None,
+                 imported_song_count: int = 0, succeeded: bool = False, cancelled: bool = False,
+                 fetch_report: Optional[Dict[str, Any]] = None):
+        self.artist_mbid = artist_mbid
+        self.artist_name = artist_name
+        self.imported_song_count = imported_song_count
+        self.succeeded = succeeded
+        self.cancelled = cancelled # 취소로 중단된 아티스트는 실패가 아니라 대기 상태로 되돌립니다.
+        self.fetch_report = fetch_report # `RecordingFetchPlanner.report()`
+
+
+class ExplorationEngine:
+    """
+    여러 아티스트를 동시에 탐색하는 수집(fetch) / 저장(write) 2단계 파이프라인입니다.
+
+    - 수집 단계: 워커 풀이 큐에서 아티스트 MBID를 꺼내 Recording 페이지를 병렬로 요청하고 파싱합니다.
+      모든 요청은 `musicbrainz_api.rate_limiter` 하나를 공유하므로 전체 호출 속도는 API 제한을 지킵니다.
+    - 저장 단계: 단일 writer 스레드가 제한된 크기의 큐에서 파싱된 페이지를 꺼내 SQLite에 저장합니다.
+
+    네트워크 대기, JSON 파싱, DB 쓰기가 서로 겹쳐서 진행됩니다.
+    `cancel_event`가 설정되면 새 페이지/아티스트 수집을 멈추고, 이미 받은 페이지까지만 저장한 뒤 종료합니다.
+    """
+
+    def __init__(self, service, frontier: ExplorationFrontier, known_explored_mbids: Set[str],
+                 db_path: str, target_db_size_bytes: float,
+                 artist_song_limit: int, page_limit: int,
+                 fetch_workers: int = EXPLORATION_FETCH_WORKERS,
+                 write_queue_size: int = WRITE_QUEUE_SIZE,
+                 scheduler: Optional[CrawlScheduler] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 on_progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.service = service
+        self.frontier = frontier
+        self.known_explored_mbids = known_explored_mbids
+        self.db_path = db_path
+        self.target_db_size_bytes = target_db_size_bytes
+        self.artist_song_limit = artist_song_limit
+        self.page_limit = page_limit
+        self.fetch_workers = max(1, fetch_workers)
+        self.scheduler = scheduler or CrawlScheduler()
+        self.cancel_event = cancel_event or threading.Event()
+        self.on_progress = on_progress
+
+        self._write_queue: "queue_module.Queue" = queue_module.Queue(maxsize=write_queue_size)
+        self._lock = threading.Lock()
+        self._queue_changed = threading.Condition(self._lock)
+        self._in_progress: Set[str] = set()
+        self._stop = threading.Event()
+        self.results: List[Dict[str, Any]] = []
+        self.imported_song_count = 0
+        self.pages_written = 0
+        self._fetch_totals = {"requests": 0, "bytes": 0, "pages_skipped": 0, "requests_saved": 0, "bytes_saved": 0}
+
+    # --- 큐 관리 (모든 접근은 self._lock 안에서) ---
+
+    def _db_size_reached(self) -> bool:
+        current_db_size = db_file_size_bytes(self.db_path)
+        metrics.DB_SIZE_BYTES.set(current_db_size)
+        if current_db_size >= self.target_db_size_bytes:
+            logger.info("목표 DB 크기에 도달했습니다. (%s bytes) 새 아티스트 탐색을 중단합니다.", current_db_size)
+            return True
+        return False
+
+    def _next_artist(self) -> Optional[str]:
+        """탐색할 다음 아티스트 MBID를 꺼냅니다. 더 이상 할 일이 없으면 None을 반환합니다."""
+        with self._queue_changed:
+            while not self._stop.is_set():
+                if self.cancel_event.is_set():
+                    logger.info("탐색 취소 요청을 받았습니다. 새 아티스트 탐색을 중단합니다.")
+                    self._stop.set()
+                    break
+                if self._db_size_reached():
+                    self._stop.set()
+                    break
+
+                while len(self.frontier):
+                    artist_mbid = self.frontier.pop() # 큐에서 하나 꺼내기 (탐색 중 상태로 기록됨)
+                    if artist_mbid is None:
+                        break
+                    if artist_mbid in self.known_explored_mbids:
+                        self.frontier.mark_done(artist_mbid)
+                        continue
+                    self._in_progress.add(artist_mbid)
+                    metrics.FRONTIER_SIZE.set(len(self.frontier))
+                    logger.debug("큐에서 '%s' 꺼냄. 남은 큐 크기: %s", artist_mbid, len(self.frontier))
+                    return artist_mbid
+
+                if not self._in_progress:
+                    # 큐가 비었고, 새 MBID를 추가할 수 있는 진행 중인 아티스트도 없음
+                    break
+                # 다른 워커가 저장하면서 큐에 새 아티스트를 추가할 때까지 대기
+                self._queue_changed.wait(timeout=IDLE_WAIT_SECONDS)
+
+            self._queue_changed.notify_all()
+            return None
+
+    def _finish_artist(self, artist_mbid: str, succeeded: bool, cancelled: bool = False):
+        with self._queue_changed:
+            self._in_progress.discard(artist_mbid)
+            if succeeded:
+                self.frontier.mark_done(artist_mbid)
+            elif cancelled:
+                self.frontier.release(artist_mbid) # 다음 탐색 때 처음부터 다시 수집
+            else:
+                self.frontier.mark_failed(artist_mbid)
+            self._queue_changed.notify_all()
+
+    # --- 수집 단계 ---
+
+    def _fetch_worker(self):
+        while True:
+            artist_mbid = self._next_artist()
+            if artist_mbid is None:
+                return
+            logger.info("--- 아티스트 (MBID: %s) 탐색 시작 ---", artist_mbid)
+            done_job = _ArtistDoneJob(artist_mbid)
+            try:
+                done_job = self._fetch_artist(artist_mbid)
+            except HTTPException as e:
+                logger.warning("API 호출 오류로 아티스트 (MBID: %s) 탐색 실패: %s", artist_mbid, e.detail)
+            except Exception as e:
+                logger.exception("예상치 못한 오류로 아티스트 (MBID: %s) 탐색 실패: %s", artist_mbid, e)
+            finally:
+                # 탐색 완료 표시와 진행 중 목록 정리는 앞선 페이지들이 모두 저장된 뒤 writer가 수행합니다.
+                self._write_queue.put(done_job)
+
+    def _fetch_artist(self, artist_mbid: str) -> _ArtistDoneJob:
+        planner = self.service._plan_artist_fetch(artist_mbid, self.artist_song_limit, self.page_limit)
+        try:
+            artist_name = self.service._fetch_artist_name(artist_mbid, usage=planner.usage)
+            imported_songs_count = 0
+
+            # 목표 DB 크기에 도달해도 이미 시작한 아티스트는 끝까지 처리합니다.
+            while True:
+                if self.cancel_event.is_set():
+                    logger.info("탐색 취소로 아티스트 (MBID: %s) 수집을 중단합니다.", artist_mbid)
+                    return _ArtistDoneJob(artist_mbid, artist_name, imported_songs_count, cancelled=True,
+                                          fetch_report=planner.report())
+                recordings = planner.next_page()
+                if not recordings:
+                    break
+
+                page_job = _PageJob(artist_mbid, self.service._parse_recordings_page(recordings, artist_name))
+                self._write_queue.put(page_job) # 저장 단계가 밀려 있으면 여기서 대기 (backpressure)
+                # 아티스트당 곡 수 제한은 실제로 저장된 곡 수 기준이므로 저장 결과를 기다립니다.
+                # (이 동안 다른 워커들은 계속 다른 아티스트를 수집합니다.)
+                page_job.done.wait()
+                imported_songs_count += page_job.imported_song_count
+                planner.record_imported(page_job.imported_song_count)
+
+                if imported_songs_count >= self.artist_song_limit:
+                    logger.info("Artist song limit reached (%s songs). Moving to next artist.", imported_songs_count)
+                    break
+
+            return _ArtistDoneJob(artist_mbid, artist_name, imported_songs_count, succeeded=True,
+                                  fetch_report=planner.report())
+        finally:
+            self._record_fetch_report(planner.report())
+
+    def _record_fetch_report(self, report: Dict[str, Any]):
+        self.service._log_fetch_report(report)
+        with self._lock:
+            for key in self._fetch_totals:
+                self._fetch_totals[key] += report[key]
+
+    # --- 저장 단계 ---
+
+    def _writer(self):
+        db = SessionLocal()
+        try:
+            while True:
+                job = self._write_queue.get()
+                if job is None:
+                    return
+                try:
+                    if isinstance(job, _PageJob):
+                        self._write_page(db, job)
+                    else:
+                        self._write_artist_done(db, job)
+                except Exception as e:
+                    logger.exception("저장 단계 오류 (MBID: %s): %s", job.artist_mbid, e)
+                    db.rollback()
+                finally:
+                    if isinstance(job, _PageJob):
+                        job.done.set()
+                    self._report_progress()
+        finally:
+            db.close()
+
+    def _write_page(self, db, job: _PageJob):
+        page_result = batch_writer.write_song_page(db, job.parsed_songs, self.service.person_cache)
+        job.imported_song_count = page_result["imported_song_count"]
+        self.imported_song_count += job.imported_song_count
+        self.pages_written += 1
+        if page_result["failed_song_mbids"]:
+            logger.warning("저장 실패 곡 %s개: %s", len(page_result['failed_song_mbids']), page_result['failed_song_mbids'])
+
+        candidate_mbids = [mbid for mbid in page_result["person_mbids"] if mbid not in self.known_explored_mbids]
+        # 방금 저장된 곡까지 반영된 통계로 우선순위를 계산합니다. (FIFO 정책은 DB 조회 없이 0점)
+        priorities = self.scheduler.score_candidates(db, candidate_mbids)
+
+        with self._queue_changed:
+            # 새 MBID는 추가하고, 이미 대기 중인 MBID는 우선순위를 갱신합니다.
+            # (탐색 중/완료된 MBID는 frontier가 자동으로 제외합니다.)
+            self.frontier.push(priorities)
+            metrics.FRONTIER_SIZE.set(len(self.frontier))
+            self._queue_changed.notify_all()
+
+    def _write_artist_done(self, db, job: _ArtistDoneJob):
+        succeeded = False
+        try:
+            if not job.succeeded:
+                return
+            self.service._mark_artist_explored(db, job.artist_mbid)
+            db.commit()
+            metrics.ARTISTS_EXPLORED.inc()
+            with self._lock:
+                self.known_explored_mbids.add(job.artist_mbid)
+                self.results.append({
+                    "artist_name": job.artist_name,
+                    "artist_mbid": job.artist_mbid,
+                    "imported_song_count": job.imported_song_count,
+                    "fetch": job.fetch_report,
+                })
+            succeeded = True
+            logger.info(
+                "아티스트 '%s' (MBID: %s) 탐색 완료. (%s곡)", job.artist_name, job.artist_mbid, job.imported_song_count,
+                extra={"artist_mbid": job.artist_mbid, "songs": job.imported_song_count},
+            )
+        finally:
+            self._finish_artist(job.artist_mbid, succeeded, cancelled=job.cancelled)
+
+    # --- 진행 상황 ---
+
+    def progress(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "artists_processed": len(self.results),
+                "artists_in_progress": len(self._in_progress),
+                "songs_imported": self.imported_song_count,
+                "pages_written": self.pages_written,
+                "queue_length": len(self.frontier),
+            }
+
+    def fetch_savings(self) -> Dict[str, int]:
+        """모든 아티스트의 MusicBrainz 요청 수/응답 크기와 요청 계획으로 절약한 양(추정)의 합계"""
+        with self._lock:
+            return dict(self._fetch_totals)
+
+    def _report_progress(self):
+        """저장 단계가 작업 하나를 끝낼 때마다 호출됩니다. (writer 스레드)"""
+        if self.on_progress is not None:
+            self.on_progress(self.progress())
+
+    # --- 실행 ---
+
+    def run(self) -> List[Dict[str, Any]]:
+        """큐가 비거나 목표 DB 크기에 도달할 때까지 탐색합니다. 아티스트별 결과 목록을 반환합니다."""
+        writer_thread = threading.Thread(target=self._writer, name="exploration-writer", daemon=True)
+        writer_thread.start()
+
+        fetch_threads = [
+            threading.Thread(target=self._fetch_worker, name=f"exploration-fetch-{i}", daemon=True)
+            for i in range(self.fetch_workers)
+        ]
+        for thread in fetch_threads:
+            thread.start()
+        for thread in fetch_threads:
+            thread.join()
+
+        self._write_queue.put(None) # 남은 작업을 모두 저장한 뒤 writer 종료
+        writer_thread.join()
+        self._report_progress()
+        return self.results
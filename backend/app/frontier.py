@@ -0,0 +1,212 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTIER_FILE = os.path.join(CURRENT_DIR, "..", "..", "logs", "exploration_frontier.db")
+LEGACY_QUEUE_FILE = os.path.join(CURRENT_DIR, "..", "..", "logs", "exploration_queue.json")
+
+# 항목 상태
+PENDING = 0 # 탐색 대기
+CLAIMED = 1 # 워커가 탐색 중 (비정상 종료 시 재시작하면 PENDING으로 복구)
+DONE = 2 # 탐색 완료
+FAILED = 3 # 탐색 실패 (기존 큐와 동일하게 다시 시도하지 않음)
+
+
+class ExplorationFrontier:
+    """
+    탐색 큐(frontier)를 SQLite에 저장하는 내구성 있는 구조입니다.
+
+    - 한 번이라도 추가된 MBID는 메모리의 set으로 관리하여 중복 확인이 O(1)입니다.
+    - 변경은 행 단위 INSERT/UPDATE로만 기록하므로 큐 전체를 다시 쓰지 않습니다. (WAL 모드)
+    - 재시작 시 탐색 중(CLAIMED)이던 항목은 대기(PENDING)로 되돌려 이어서 탐색합니다.
+    - priority가 높은 항목부터, 같으면 추가된 순서(FIFO)대로 꺼냅니다.
+    """
+
+    def __init__(self, path: str = FRONTIER_FILE, legacy_queue_file: Optional[str] = LEGACY_QUEUE_FILE):
+        self.path = path
+        self._lock = threading.RLock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                mbid TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                priority REAL NOT NULL DEFAULT 0,
+                state INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_frontier_pending ON frontier (state, priority DESC, seq)")
+        # 비정상 종료 복구: 탐색 중이던 항목을 대기 상태로 되돌림
+        self._conn.execute("UPDATE frontier SET state = ? WHERE state = ?", (PENDING, CLAIMED))
+        self._conn.commit()
+
+        self._known: Set[str] = {row[0] for row in self._conn.execute("SELECT mbid FROM frontier")}
+        self._refresh_pending_count()
+        self._next_seq = (self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM frontier").fetchone()[0]) + 1
+
+        if legacy_queue_file:
+            self._migrate_legacy_queue(legacy_queue_file)
+
+    def _migrate_legacy_queue(self, legacy_queue_file: str):
+        """이전 버전의 exploration_queue.json이 있으면 한 번만 가져옵니다."""
+        if not os.path.exists(legacy_queue_file):
+            return
+        with open(legacy_queue_file, 'r', encoding='utf-8') as f:
+            legacy_queue = json.load(f)
+        added = self.add_many(legacy_queue)
+        os.replace(legacy_queue_file, legacy_queue_file + ".migrated")
+        logger.info("기존 큐 파일에서 %s개 항목을 가져왔습니다: %s", added, legacy_queue_file)
+
+    def __len__(self) -> int:
+        """탐색 대기 중인 항목 수"""
+        return self._pending_count
+
+    def __contains__(self, mbid: str) -> bool:
+        """한 번이라도 추가된 MBID인지 확인합니다. (대기/탐색 중/완료/실패 모두 포함)"""
+        return mbid in self._known
+
+    def add(self, mbid: str, priority: float = 0.0) -> bool:
+        return self.add_many([mbid], priority) == 1
+
+    def add_many(self, mbids: Iterable[str], priority: float = 0.0) -> int:
+        """새 MBID들을 대기 상태로 추가합니다. 이미 알고 있는 MBID는 무시합니다. 추가된 개수를 반환합니다."""
+        with self._lock:
+            rows = []
+            now = time.time()
+            for mbid in mbids:
+                if not mbid or mbid in self._known:
+                    continue
+                self._known.add(mbid)
+                rows.append((mbid, self._next_seq, priority, PENDING, now))
+                self._next_seq += 1
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO frontier (mbid, seq, priority, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.commit()
+                self._pending_count += len(rows)
+            return len(rows)
+
+    def push(self, priorities: Dict[str, float]) -> int:
+        """
+        {mbid: priority}를 반영합니다. 새 MBID는 해당 우선순위로 추가하고,
+        이미 대기 중인 MBID는 우선순위만 갱신합니다. 새로 추가된 개수를 반환합니다.
+        """
+        with self._lock:
+            rows = []
+            updates = []
+            now = time.time()
+            for mbid, priority in priorities.items():
+                if not mbid:
+                    continue
+                if mbid in self._known:
+                    updates.append((priority, mbid, PENDING))
+                    continue
+                self._known.add(mbid)
+                rows.append((mbid, self._next_seq, priority, PENDING, now))
+                self._next_seq += 1
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO frontier (mbid, seq, priority, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._pending_count += len(rows)
+            if updates:
+                self._conn.executemany("UPDATE frontier SET priority = ? WHERE mbid = ? AND state = ?", updates)
+            if rows or updates:
+                self._conn.commit()
+            return len(rows)
+
+    def discovered_count(self) -> int:
+        """한 번이라도 발견된 MBID 수"""
+        return len(self._known)
+
+    def pop(self) -> Optional[str]:
+        """우선순위가 가장 높은 대기 항목을 꺼내 탐색 중(CLAIMED) 상태로 바꿉니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mbid FROM frontier WHERE state = ? ORDER BY priority DESC, seq LIMIT 1", (PENDING,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._set_state([row[0]], CLAIMED)
+            self._pending_count -= 1
+            return row[0]
+
+    def mark_done(self, mbid: str):
+        self.mark_done_many([mbid])
+
+    def mark_done_many(self, mbids: Iterable[str]):
+        """탐색 완료로 표시합니다. 처음 보는 MBID는 완료 상태로 기록하여 다시 추가되지 않게 합니다."""
+        with self._lock:
+            mbids = [mbid for mbid in mbids if mbid]
+            new_mbids = [mbid for mbid in mbids if mbid not in self._known]
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO frontier (mbid, seq, priority, state, updated_at) VALUES (?, ?, 0, ?, ?)",
+                [(mbid, self._next_seq + i, DONE, now) for i, mbid in enumerate(new_mbids)],
+            )
+            self._next_seq += len(new_mbids)
+            self._known.update(new_mbids)
+            # 대기 중이던 항목이 바로 완료되는 경우만 대기 수에서 뺍니다. (전체 COUNT 없이)
+            cursor = self._conn.executemany(
+                "UPDATE frontier SET state = ?, updated_at = ? WHERE mbid = ? AND state = ?",
+                [(DONE, now, mbid, PENDING) for mbid in mbids],
+            )
+            self._pending_count -= cursor.rowcount
+            self._set_state(mbids, DONE)
+
+    def mark_failed(self, mbid: str):
+        with self._lock:
+            self._set_state([mbid], FAILED)
+
+    def release(self, mbid: str):
+        """탐색 중이던 항목을 다시 대기 상태로 되돌립니다. (탐색 취소 시)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE frontier SET state = ?, updated_at = ? WHERE mbid = ? AND state = ?",
+                (PENDING, time.time(), mbid, CLAIMED),
+            )
+            self._conn.commit()
+            self._pending_count += cursor.rowcount
+
+    def requeue(self, mbid: str) -> bool:
+        """완료/실패 처리된 항목(또는 새 항목)을 다시 대기 상태로 넣습니다. (시드 아티스트 재지정 시)"""
+        with self._lock:
+            if mbid not in self._known:
+                return self.add(mbid)
+            cursor = self._conn.execute(
+                "UPDATE frontier SET state = ?, updated_at = ? WHERE mbid = ? AND state IN (?, ?)",
+                (PENDING, time.time(), mbid, DONE, FAILED),
+            )
+            self._conn.commit()
+            self._pending_count += cursor.rowcount
+            return cursor.rowcount == 1
+
+    def _refresh_pending_count(self):
+        self._pending_count = self._conn.execute(
+            "SELECT COUNT(*) FROM frontier WHERE state = ?", (PENDING,)
+        ).fetchone()[0]
+
+    def _set_state(self, mbids, state: int):
+        now = time.time()
+        self._conn.executemany(
+            "UPDATE frontier SET state = ?, updated_at = ? WHERE mbid = ?",
+            [(state, now, mbid) for mbid in mbids],
+        )
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,13 @@
 import os
+import json
+import logging
 import requests
 from dotenv import load_dotenv
 
+from .http_cache import HTTP_CACHE_OFFLINE, response_cache
+
+logger = logging.getLogger(__name__)
+
 # uvicorn이 실행되는 'backend' 디렉토리의 .env 파일을 자동으로 찾아서 로드합니다.
 load_dotenv()
 
@@ -10,7 +16,7 @@ API_BASE_URL = "https://api.genius.com"
 
 if not GENIUS_API_TOKEN:
     # .env 파일이 없거나, 변수가 설정되지 않은 경우를 대비한 경고
-    print("Warning: GENIUS_ACCESS_TOKEN not found. Please ensure a .env file exists in the 'backend' directory with the token.")
+    logger.warning("GENIUS_ACCESS_TOKEN not found. Please ensure a .env file exists in the 'backend' directory with the token.")
     # raise ValueError("GENIUS_ACCESS_TOKEN not found in environment variables.")
 
 headers = {'Authorization': f'Bearer {GENIUS_API_TOKEN}'}
@@ -27,7 +33,7 @@ def search_song(query: str):
         response.raise_for_status()  # 2xx 상태 코드가 아닐 경우 예외 발생
         return response.json()
     except requests.exceptions.RequestException as e:
-        print(f"Error searching Genius API: {e}")
+        logger.warning("Error searching Genius API: %s", e)
         return None
 
 def get_song_details(song_id: int):
@@ -37,12 +43,30 @@ def get_song_details(song_id: int):
 
     song_url = f"{API_BASE_URL}/songs/{song_id}"
     params = {'text_format': 'dom'} # 'dom', 'html', 'plain'
+
+    # 로컬 응답 캐시 확인 (만료되지 않았으면 네트워크 요청 생략)
+    cached = response_cache.lookup(song_url, params) if response_cache else None
+    if cached and (cached.is_fresh or HTTP_CACHE_OFFLINE):
+        return json.loads(cached.body)
+    if response_cache and HTTP_CACHE_OFFLINE:
+        logger.debug("Offline mode: Genius song %s is not cached.", song_id)
+        return None
+
+    request_headers = dict(headers)
+    if cached:
+        request_headers.update(cached.conditional_headers())
     try:
-        response = requests.get(song_url, params=params, headers=headers, timeout=5)
+        response = requests.get(song_url, params=params, headers=request_headers, timeout=5)
+        if response.status_code == 304 and cached:
+            response_cache.revalidated(song_url, "genius:song", params)
+            return json.loads(cached.body)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        if response_cache:
+            response_cache.store(song_url, "genius:song", response.content, response.headers, params)
+        return data
     except requests.exceptions.RequestException as e:
-        print(f"Error getting song details from Genius API: {e}")
+        logger.warning("Error getting song details from Genius API: %s", e)
         return None
 
 def get_artist_songs(artist_id: int, page: int = 1):
@@ -57,5 +81,5 @@ def get_artist_songs(artist_id: int, page: int = 1):
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
-        print(f"Error getting artist songs from Genius API: {e}")
+        logger.warning("Error getting artist songs from Genius API: %s", e)
         return None
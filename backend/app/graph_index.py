@@ -0,0 +1,283 @@
+import logging
+import threading
+import time
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from . import models
+from .crud import IN_QUERY_CHUNK_SIZE
+from .roles import get_filter_role_ids, get_role_names
+
+logger = logging.getLogger(__name__)
+
+GRAPH_INDEX_REFRESH_SECONDS = 60 # 데이터가 바뀌어도 인덱스를 다시 만드는 최소 간격 (수집 중 매 페이지마다 재생성 방지)
+MAX_HOPS = 4
+MAX_NODES = 2000
+DEFAULT_MAX_NODES = 200
+DEFAULT_FANOUT = 25
+
+SONG = "song"
+PERSON = "person"
+
+
+class _Adjacency:
+    """한쪽 노드(곡 또는 인물)에서 반대쪽 노드로 가는 CSR(Compressed Sparse Row) 인접 배열"""
+
+    def __init__(self, node_count: int, edges: List[Tuple[int, int, int]], neighbour_degree: array):
+        # edges: (출발 인덱스, 도착 인덱스, 역할 ID)
+        # 각 노드의 이웃은 이웃의 연결 수가 많은 순으로 정렬해 두어, fan-out 제한 시 허브를 먼저 고릅니다.
+        edges.sort(key=lambda edge: (edge[0], -neighbour_degree[edge[1]], edge[1]))
+        self.offsets = array("l", [0] * (node_count + 1))
+        self.targets = array("l", (edge[1] for edge in edges))
+        self.roles = array("l", (edge[2] for edge in edges))
+        for source, _, _ in edges:
+            self.offsets[source + 1] += 1
+        for i in range(node_count):
+            self.offsets[i + 1] += self.offsets[i]
+
+    def neighbours(self, index: int, allowed_roles: Optional[Set[int]]) -> Iterable[Tuple[int, int]]:
+        for position in range(self.offsets[index], self.offsets[index + 1]):
+            role_id = self.roles[position]
+            if allowed_roles is None or role_id in allowed_roles:
+                yield self.targets[position], role_id
+
+
+class GraphIndex:
+    """
+    contributions 테이블로 만든 곡-인물 이분 그래프의 메모리 인덱스입니다.
+
+    DB ID 대신 0부터 시작하는 연속 인덱스를 사용하고, 인접 목록은 `array` 기반 CSR 배열로 저장합니다.
+    한 번 만든 인덱스는 읽기 전용이며, 데이터가 바뀌면 새 인덱스를 만들어 교체합니다.
+    """
+
+    def __init__(self, rows: List[Tuple[int, int, int]], role_names: Dict[int, str]):
+        self.song_ids: List[int] = []
+        self.person_ids: List[int] = []
+        self.song_index: Dict[int, int] = {}
+        self.person_index: Dict[int, int] = {}
+        self.role_names = role_names # {roles.id: 표준 역할 이름} (간선 라벨용)
+
+        edges: List[Tuple[int, int, int]] = [] # (곡 인덱스, 인물 인덱스, 역할 ID)
+        for song_id, person_id, role_id in rows:
+            song = self.song_index.get(song_id)
+            if song is None:
+                song = self.song_index[song_id] = len(self.song_ids)
+                self.song_ids.append(song_id)
+            person = self.person_index.get(person_id)
+            if person is None:
+                person = self.person_index[person_id] = len(self.person_ids)
+                self.person_ids.append(person_id)
+            edges.append((song, person, role_id))
+
+        song_degree = array("l", [0] * len(self.song_ids))
+        person_degree = array("l", [0] * len(self.person_ids))
+        for song, person, _ in edges:
+            song_degree[song] += 1
+            person_degree[person] += 1
+
+        self.song_to_persons = _Adjacency(len(self.song_ids), list(edges), person_degree)
+        self.person_to_songs = _Adjacency(
+            len(self.person_ids), [(person, song, role_id) for song, person, role_id in edges], song_degree
+        )
+        self.edge_count = len(edges)
+
+    def traverse(self, root_type: str, root_id: int, hops: int, fanout: List[int],
+                 max_nodes: int, allowed_roles: Optional[Set[int]]) -> Dict[str, Any]:
+        """
+        루트에서 BFS로 hops 단계까지 이웃을 찾습니다. (곡 → 인물, 인물 → 곡이 각각 한 단계)
+        fanout[h]: h번째 단계에서 노드 하나당 펼칠 최대 이웃 수
+        max_nodes: 결과 노드 수 상한 (루트 포함)
+        """
+        root_key = (root_type, self.song_index[root_id] if root_type == SONG else self.person_index[root_id])
+        node_hops: Dict[Tuple[str, int], int] = {root_key: 0}
+        frontier = [root_key]
+        truncated = False
+
+        for hop in range(hops):
+            limit = fanout[min(hop, len(fanout) - 1)]
+            next_frontier = []
+            for node_type, index in frontier:
+                adjacency = self.song_to_persons if node_type == SONG else self.person_to_songs
+                neighbour_type = PERSON if node_type == SONG else SONG
+                expanded = 0
+                for neighbour, _ in adjacency.neighbours(index, allowed_roles):
+                    key = (neighbour_type, neighbour)
+                    if key in node_hops:
+                        continue
+                    if expanded >= limit:
+                        break
+                    if len(node_hops) >= max_nodes:
+                        truncated = True
+                        break
+                    node_hops[key] = hop + 1
+                    next_frontier.append(key)
+                    expanded += 1
+                if truncated:
+                    break
+            frontier = next_frontier
+            if truncated or not frontier:
+                break
+
+        # 포함된 노드 사이의 모든 간선 (역할은 간선 하나에 묶음)
+        edge_roles: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        for (node_type, index) in node_hops:
+            if node_type != PERSON:
+                continue
+            for song, role_id in self.person_to_songs.neighbours(index, allowed_roles):
+                if (SONG, song) in node_hops:
+                    edge_roles[(self.song_ids[song], self.person_ids[index])].append(self.role_names.get(role_id, ""))
+
+        return {
+            "song_hops": {self.song_ids[i]: h for (t, i), h in node_hops.items() if t == SONG},
+            "person_hops": {self.person_ids[i]: h for (t, i), h in node_hops.items() if t == PERSON},
+            "edges": edge_roles,
+            "truncated": truncated,
+        }
+
+
+class GraphIndexHolder:
+    """
+    GraphIndex를 필요할 때 만들고, 데이터가 바뀌었으면 다시 만듭니다. (스레드 안전)
+
+    기여 관계를 쓰는 쪽(batch_writer 등)이 커밋 후 `invalidate()`로 세대(generation)를 올리면,
+    다음 요청은 기존 인덱스를 그대로 받고 새 인덱스는 백그라운드 스레드에서 만들어집니다.
+    완성된 인덱스는 참조 교체 한 번으로 바뀌므로, 생성 중에도 조회 요청이 잠금을 기다리지 않습니다.
+    인덱스가 아직 없을 때(첫 요청)만 요청 스레드에서 직접 만듭니다.
+    """
+
+    def __init__(self, refresh_seconds: float = GRAPH_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock() # 아래 상태 필드만 보호 (인덱스 생성 중에는 잡지 않음)
+        self._build_lock = threading.Lock() # 인덱스 생성은 한 번에 하나만
+        self._index: Optional[GraphIndex] = None
+        self._generation = 0
+        self._built_generation = -1
+        self._built_at = 0.0
+        self._rebuilding = False
+
+    def invalidate(self):
+        """기여 관계가 바뀌었음을 알립니다. (다음 조회 때 백그라운드 재생성)"""
+        with self._lock:
+            self._generation += 1
+
+    def get(self, db: Session) -> GraphIndex:
+        with self._lock:
+            index = self._index
+            start_rebuild = (
+                index is not None and self._built_generation != self._generation and not self._rebuilding
+                and time.monotonic() - self._built_at >= self.refresh_seconds
+            )
+            if start_rebuild:
+                self._rebuilding = True
+        if index is None:
+            return self._build(db)
+        if start_rebuild:
+            threading.Thread(
+                target=self._rebuild_in_background, args=(db.get_bind(),), name="graph-index-rebuild", daemon=True
+            ).start()
+        return index
+
+    def _rebuild_in_background(self, bind):
+        try:
+            with Session(bind) as db:
+                self._build(db)
+        except Exception:
+            logger.exception("그래프 인덱스 재생성 실패 (기존 인덱스를 계속 사용합니다)")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def _build(self, db: Session) -> GraphIndex:
+        with self._build_lock:
+            with self._lock:
+                generation = self._generation
+                if self._index is not None and self._built_generation == generation:
+                    return self._index # 기다리는 동안 다른 스레드가 만들었음
+
+            started = time.perf_counter()
+            rows = db.query(
+                models.Contribution.song_id, models.Contribution.person_id, models.Contribution.role_id
+            ).all()
+            index = GraphIndex(rows, get_role_names(db))
+            with self._lock:
+                # 생성 중에 올라간 세대는 그대로 남아 다음 조회 때 다시 만들어집니다.
+                self._index = index
+                self._built_generation = generation
+                self._built_at = time.monotonic()
+            logger.info(
+                "그래프 인덱스 생성: 곡 %s개, 인물 %s명, 간선 %s개 (%.2fs)", len(index.song_ids),
+                len(index.person_ids), index.edge_count, time.perf_counter() - started,
+            )
+            return index
+
+
+graph_index = GraphIndexHolder()
+
+
+def _load_by_ids(db: Session, model, ids: List[int]) -> Dict[int, Any]:
+    loaded = {}
+    for start in range(0, len(ids), IN_QUERY_CHUNK_SIZE):
+        chunk = ids[start:start + IN_QUERY_CHUNK_SIZE]
+        for obj in db.query(model).filter(model.id.in_(chunk)).all():
+            loaded[obj.id] = obj
+    return loaded
+
+
+def get_neighbourhood(db: Session, root_type: str, mbid: str, hops: int = 2,
+                      fanout: Optional[List[int]] = None, roles: Optional[List[str]] = None,
+                      max_nodes: int = DEFAULT_MAX_NODES) -> Dict[str, Any]:
+    """
+    곡 또는 인물(MBID)의 k-hop 이웃 그래프를 반환합니다.
+    hops=2인 인물 조회는 `crud.get_collaboration_details_by_mbid`의 협업자/협업 곡과 같은 범위입니다.
+    """
+    if root_type not in (SONG, PERSON):
+        raise HTTPException(status_code=400, detail="type은 'song' 또는 'person'이어야 합니다.")
+    if not 1 <= hops <= MAX_HOPS:
+        raise HTTPException(status_code=400, detail=f"hops는 1~{MAX_HOPS} 사이여야 합니다.")
+    fanout = fanout or [DEFAULT_FANOUT]
+    if any(limit < 1 for limit in fanout):
+        raise HTTPException(status_code=400, detail="fanout 값은 1 이상이어야 합니다.")
+    max_nodes = max(1, min(max_nodes, MAX_NODES))
+
+    root_model = models.Song if root_type == SONG else models.Person
+    root = db.query(root_model).filter(root_model.mbid == mbid).first()
+    if not root:
+        raise HTTPException(status_code=404, detail=f"{root_type} with given MBID not found in DB.")
+
+    index = graph_index.get(db)
+    root_indexed = root.id in (index.song_index if root_type == SONG else index.person_index)
+    if not root_indexed:
+        # 기여 관계가 없는 노드 (또는 인덱스 생성 이후 추가된 노드)
+        result = {"song_hops": {}, "person_hops": {}, "edges": {}, "truncated": False}
+        (result["song_hops"] if root_type == SONG else result["person_hops"])[root.id] = 0
+    else:
+        # 역할 필터는 roles.base_role 인덱스로 role_id 집합을 찾아 간선의 역할 ID와 비교합니다.
+        allowed_roles = get_filter_role_ids(db, roles) if roles else None
+        result = index.traverse(root_type, root.id, hops, fanout, max_nodes, allowed_roles)
+
+    songs = _load_by_ids(db, models.Song, list(result["song_hops"]))
+    persons = _load_by_ids(db, models.Person, list(result["person_hops"]))
+    nodes = [
+        {"type": SONG, "id": song_id, "mbid": songs[song_id].mbid, "label": songs[song_id].title,
+         "hop": hop, "youtube_url": songs[song_id].youtube_url}
+        for song_id, hop in result["song_hops"].items() if song_id in songs
+    ] + [
+        {"type": PERSON, "id": person_id, "mbid": persons[person_id].mbid, "label": persons[person_id].name,
+         "hop": hop, "image_url": persons[person_id].image_url}
+        for person_id, hop in result["person_hops"].items() if person_id in persons
+    ]
+    nodes.sort(key=lambda node: node["hop"])
+    edges = [
+        {"song_id": song_id, "person_id": person_id, "roles": edge_roles}
+        for (song_id, person_id), edge_roles in result["edges"].items()
+    ]
+    return {
+        "root": {"type": root_type, "id": root.id, "mbid": root.mbid},
+        "nodes": nodes,
+        "edges": edges,
+        "truncated": result["truncated"],
+    }
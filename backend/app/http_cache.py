@@ -0,0 +1,190 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_PATH = os.path.join(CURRENT_DIR, "..", "..", "logs", "http_cache.db")
+
+HTTP_CACHE_PATH = os.getenv("HTTP_CACHE_PATH", DEFAULT_CACHE_PATH)
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") != "0"
+# 오프라인 모드: 네트워크 없이 캐시에 저장된 응답만 사용합니다. (재현 가능한 로컬 실행/테스트용)
+HTTP_CACHE_OFFLINE = os.getenv("HTTP_CACHE_OFFLINE", "0") == "1"
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(2 * 1024 ** 3))) # 기본 2GB (압축 후 크기)
+EVICTION_TARGET_RATIO = 0.9 # 용량 초과 시 최대 용량의 90%까지 줄입니다.
+EVICTION_CHECK_INTERVAL = 100 # 저장 N회마다 전체 용량을 확인합니다.
+
+DAY_SECONDS = 24 * 60 * 60
+# 엔드포인트별 TTL (초)
+ENDPOINT_TTLS: Dict[str, int] = {
+    "musicbrainz:artist-search": 1 * DAY_SECONDS,
+    "musicbrainz:artist": 30 * DAY_SECONDS,
+    "musicbrainz:recording-browse": 7 * DAY_SECONDS,
+    "musicbrainz:recording": 30 * DAY_SECONDS,
+    "musicbrainz:release": 30 * DAY_SECONDS,
+    "genius:song": 30 * DAY_SECONDS,
+}
+DEFAULT_TTL_SECONDS = 7 * DAY_SECONDS
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    is_fresh: bool
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """조건부 재검증(If-None-Match / If-Modified-Since) 요청 헤더를 만듭니다."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """쿼리 파라미터 순서와 호스트 대소문자에 관계없이 같은 요청이 같은 키를 갖도록 URL을 정규화합니다."""
+    parts = urlsplit(url)
+    query: List[Tuple[str, str]] = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), str(v)) for k, v in params.items() if v is not None)
+    query.sort()
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    return hashlib.sha256(normalize_url(url, params).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite에 zlib 압축 본문을 저장하는 내용 주소 기반(content-addressed) HTTP 응답 캐시입니다.
+
+    - 키: 정규화된 URL + 쿼리의 SHA-256
+    - 엔드포인트별 TTL, 크기 기준 LRU 삭제
+    - 업스트림이 ETag/Last-Modified를 주는 경우 만료된 항목을 조건부 요청으로 재검증
+    """
+
+    def __init__(self, path: str = HTTP_CACHE_PATH, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._puts_since_check = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    endpoint TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_last_access ON responses (last_access)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[CachedResponse]:
+        """캐시된 응답을 반환합니다. 만료된 항목도 재검증/오프라인 용도로 반환합니다. (is_fresh로 구분)"""
+        key = cache_key(url, params)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+
+        body, etag, last_modified, expires_at = row
+        return CachedResponse(zlib.decompress(body), etag, last_modified, expires_at > now)
+
+    def store(self, url: str, endpoint: str, body: bytes, headers: Optional[Dict[str, str]] = None,
+              params: Optional[Dict[str, Any]] = None):
+        """응답 본문을 압축하여 저장합니다."""
+        headers = headers or {}
+        compressed = zlib.compress(body)
+        now = time.time()
+        ttl = ENDPOINT_TTLS.get(endpoint, DEFAULT_TTL_SECONDS)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (key, url, endpoint, body, size, etag, last_modified, fetched_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (cache_key(url, params), normalize_url(url, params), endpoint, compressed, len(compressed),
+                 headers.get("ETag"), headers.get("Last-Modified"), now, now + ttl, now),
+            )
+            conn.commit()
+            self._puts_since_check += 1
+            if self._puts_since_check >= EVICTION_CHECK_INTERVAL:
+                self._puts_since_check = 0
+                self._evict(conn)
+
+    def revalidated(self, url: str, endpoint: str, params: Optional[Dict[str, Any]] = None):
+        """304 Not Modified 응답을 받은 항목의 만료 시각을 갱신합니다."""
+        now = time.time()
+        ttl = ENDPOINT_TTLS.get(endpoint, DEFAULT_TTL_SECONDS)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE responses SET fetched_at = ?, expires_at = ?, last_access = ? WHERE key = ?",
+                (now, now + ttl, now, cache_key(url, params)),
+            )
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다. (락 안에서 호출)"""
+        total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+        target_size = self.max_bytes * EVICTION_TARGET_RATIO
+        freed = 0
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC"):
+            if total_size - freed <= target_size:
+                break
+            victims.append((key,))
+            freed += size
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        conn.commit()
+        logger.info("캐시 용량 초과로 %s개 항목 삭제 (%s bytes)", len(victims), freed)
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+
+response_cache = ResponseCache() if HTTP_CACHE_ENABLED else None
@@ -0,0 +1,190 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import crud
+
+# 탐색 세션 하나가 수 GB까지 커져도 메모리가 무한히 늘지 않도록 캐시 크기를 제한합니다.
+PERSON_CACHE_MAX_ENTRIES = 200_000
+
+
+class CachedPerson(NamedTuple):
+    """세션과 무관하게 재사용할 수 있는 Person 식별 정보 (ORM 객체 대신 보관)."""
+    id: int
+    name: str
+    mbid: Optional[str]
+
+
+class PersonIdentityCache:
+    """
+    MBID와 이름으로 Person을 찾는 프로세스 내 Identity Map입니다.
+    이름은 `crud.get_person_by_name`과 같은 정확 일치로 비교하므로, 캐시 적중 여부(LRU 제거)와 관계없이
+    DB 조회와 항상 같은 Person이 선택됩니다.
+
+    - `prefetch`: 한 페이지 분량의 기여자들을 `IN (...)` 쿼리로 한 번에 로드합니다.
+    - `transaction`: 트랜잭션 안에서 새로 생성한 Person을 따로 보관하다가 커밋 후에만 공유 캐시에 넣습니다.
+    - LRU 방식으로 `max_entries`를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+
+    여러 writer(API 요청, 탐색 작업, 덤프 가져오기)가 같은 캐시를 공유하므로,
+    공유 캐시에는 커밋된 Person만 들어갑니다. (다른 writer의 롤백이 이 캐시에 영향을 주지 않음)
+    """
+
+    def __init__(self, max_entries: int = PERSON_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, CachedPerson]" = OrderedDict()
+        self._by_mbid: Dict[str, int] = {}
+        self._by_name: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def transaction(self) -> "PersonCacheTransaction":
+        """DB 트랜잭션 하나에 대응하는 범위를 만듭니다. (`with` 블록을 예외로 벗어나면 자동 롤백)"""
+        return PersonCacheTransaction(self)
+
+    def get(self, mbid: Optional[str], name: Optional[str],
+            transaction: Optional["PersonCacheTransaction"] = None) -> Optional[CachedPerson]:
+        """
+        기존 CRUD와 동일한 우선순위(MBID → 이름)로 캐시에서 Person을 찾습니다.
+        transaction을 주면 그 트랜잭션에서 만든 (아직 커밋 전인) Person도 함께 찾습니다.
+        """
+        with self._lock:
+            person = None
+            if mbid:
+                person = self._find(mbid, None, transaction)
+            if person is None and name:
+                person = self._find(None, name, transaction)
+
+            if person is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if person.id in self._entries:
+                self._entries.move_to_end(person.id)
+            return person
+
+    def add(self, person: CachedPerson) -> CachedPerson:
+        """커밋된 Person을 캐시에 추가합니다."""
+        with self._lock:
+            if person.id in self._entries:
+                self._remove(person.id)
+            self._entries[person.id] = person
+            if person.mbid:
+                self._by_mbid[person.mbid] = person.id
+            if person.name:
+                self._by_name[person.name] = person.id
+            self._evict()
+            return person
+
+    def add_model(self, db_person) -> CachedPerson:
+        """ORM Person 객체(id가 할당된 커밋된 행)를 캐시에 추가합니다."""
+        return self.add(CachedPerson(db_person.id, db_person.name, db_person.mbid))
+
+    def prefetch(self, db: Session, keys: Iterable[Tuple[Optional[str], Optional[str]]]) -> int:
+        """
+        (mbid, name) 목록 중 캐시에 없는 항목만 모아서 DB에서 일괄 로드합니다.
+        반환값은 새로 로드된 Person 수입니다. (트랜잭션에서 쓰기 전에 호출하여 커밋된 행만 읽음)
+        """
+        missing_mbids = set()
+        missing_names = set()
+        with self._lock:
+            for mbid, name in keys:
+                if mbid and mbid in self._by_mbid:
+                    continue
+                if mbid:
+                    missing_mbids.add(mbid)
+                # MBID로 찾지 못하면 이름으로 다시 찾으므로 이름도 함께 조회합니다.
+                if name and name not in self._by_name:
+                    missing_names.add(name)
+
+        if not missing_mbids and not missing_names:
+            return 0
+
+        persons = crud.get_persons_by_mbids_or_names(db, mbids=missing_mbids, names=missing_names)
+        for db_person in persons:
+            self.add_model(db_person)
+        return len(persons)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_mbid.clear()
+            self._by_name.clear()
+
+    def _find(self, mbid: Optional[str], name: Optional[str],
+              transaction: Optional["PersonCacheTransaction"]) -> Optional[CachedPerson]:
+        """(락 안에서 호출) 트랜잭션의 새 Person을 먼저, 그다음 공유 캐시를 찾습니다."""
+        if transaction is not None:
+            person = transaction._by_mbid.get(mbid) if mbid else transaction._by_name.get(name)
+            if person is not None:
+                return person
+        person_id = self._by_mbid.get(mbid) if mbid else self._by_name.get(name)
+        return self._entries[person_id] if person_id is not None else None
+
+    def _remove(self, person_id: int):
+        person = self._entries.pop(person_id, None)
+        if not person:
+            return
+        if person.mbid and self._by_mbid.get(person.mbid) == person_id:
+            del self._by_mbid[person.mbid]
+        if person.name and self._by_name.get(person.name) == person_id:
+            del self._by_name[person.name]
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+
+class PersonCacheTransaction:
+    """
+    DB 트랜잭션 하나에서 새로 생성(또는 조회)한 Person들입니다. writer마다 따로 만듭니다.
+
+    사용법:
+        with person_cache.transaction() as transaction:
+            ... INSERT 후 transaction.add_model(db_person) ...
+            db.commit()
+            transaction.commit() # 이때 공유 캐시에 추가
+    `commit()` 전에 블록을 벗어나면(예외 포함) 보관한 항목은 버려집니다.
+    """
+
+    def __init__(self, cache: PersonIdentityCache):
+        self.cache = cache
+        self._persons: List[CachedPerson] = []
+        self._by_mbid: Dict[str, CachedPerson] = {}
+        self._by_name: Dict[str, CachedPerson] = {}
+
+    def __enter__(self) -> "PersonCacheTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.rollback()
+
+    def get(self, mbid: Optional[str], name: Optional[str]) -> Optional[CachedPerson]:
+        return self.cache.get(mbid, name, transaction=self)
+
+    def add_model(self, db_person) -> CachedPerson:
+        """ORM Person 객체(id가 할당된 상태)를 이 트랜잭션에 보관합니다."""
+        person = CachedPerson(db_person.id, db_person.name, db_person.mbid)
+        self._persons.append(person)
+        if person.mbid:
+            self._by_mbid[person.mbid] = person
+        if person.name:
+            self._by_name[person.name] = person
+        return person
+
+    def commit(self):
+        """DB 커밋이 성공한 뒤 호출합니다. 보관한 Person을 공유 캐시에 추가합니다."""
+        for person in self._persons:
+            self.cache.add(person)
+        self.rollback()
+
+    def rollback(self):
+        """보관한 Person을 버립니다. (공유 캐시에는 아무 영향 없음)"""
+        self._persons.clear()
+        self._by_mbid.clear()
+        self._by_name.clear()
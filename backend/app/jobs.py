@@ -0,0 +1,195 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from . import musicbrainz_api
+from .database import db_file_size_bytes, engine
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = 1 # 작업들은 DB 쓰기 연결과 frontier/API Rate Limit을 공유하므로 종류에 관계없이 한 번에 하나만 실행합니다.
+JOB_HISTORY_LIMIT = 50 # 끝난 작업 기록을 메모리에 보관할 최대 개수
+
+# 작업 상태
+PENDING = "pending"
+RUNNING = "running"
+CANCELLING = "cancelling" # 취소 요청됨, 진행 중인 페이지 저장을 마무리하는 중
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+FAILED = "failed"
+ACTIVE_STATES = {PENDING, RUNNING, CANCELLING}
+
+
+class JobConflictError(Exception):
+    """다른 작업이 이미 실행(대기) 중일 때 발생합니다."""
+
+    def __init__(self, job: "Job"):
+        super().__init__(f"이미 실행 중인 {job.kind} 작업이 있습니다. (job_id: {job.id})")
+        self.job = job
+
+
+def _db_size_bytes() -> int:
+    return db_file_size_bytes(engine.url.database) if engine.dialect.name == "sqlite" else 0
+
+
+class Job:
+    """백그라운드 작업 하나의 상태와 진행 상황입니다. 진행 상황은 작업 스레드가, 조회는 API 스레드가 합니다."""
+
+    def __init__(self, kind: str, params: Dict[str, Any]):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = PENDING
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.cancel_event = threading.Event()
+        self._progress: Dict[str, Any] = {}
+        self._request_count_at_start = 0
+        self._request_count_at_finish: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def update_progress(self, progress: Dict[str, Any]):
+        with self._lock:
+            self._progress = dict(progress)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self.finished_at or time.time()
+            elapsed = now - self.started_at if self.started_at else 0.0
+            if self.started_at is None:
+                requests_made = 0
+            elif self._request_count_at_finish is not None:
+                requests_made = self._request_count_at_finish - self._request_count_at_start
+            else:
+                requests_made = musicbrainz_api.rate_limiter.acquired_count - self._request_count_at_start
+            progress = dict(self._progress)
+            progress.update({
+                "db_size_bytes": _db_size_bytes(),
+                "requests": requests_made,
+                "requests_per_second": round(requests_made / elapsed, 3) if elapsed > 0 else 0.0,
+            })
+            return {
+                "job_id": self.id,
+                "kind": self.kind,
+                "status": self.status,
+                "params": self.params,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "elapsed_seconds": round(elapsed, 3),
+                "progress": progress,
+                "result": self.result,
+                "error": self.error,
+            }
+
+    def _mark_started(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._request_count_at_start = musicbrainz_api.rate_limiter.acquired_count
+            if self.status == PENDING:
+                self.status = RUNNING
+
+    def _mark_finished(self, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        with self._lock:
+            self.finished_at = time.time()
+            self._request_count_at_finish = musicbrainz_api.rate_limiter.acquired_count
+            self.status = status
+            self.result = result
+            self.error = error
+
+
+class JobRegistry:
+    """
+    오래 걸리는 작업(탐색 큐 실행)을 전용 스레드 풀에서 실행하고 상태를 관리합니다.
+
+    - `submit()`은 작업을 등록하고 바로 반환합니다. HTTP 요청은 작업이 끝날 때까지 기다리지 않습니다.
+    - 작업은 종류에 관계없이 한 번에 하나만 받습니다. (다른 작업이 실행/대기 중이면 JobConflictError)
+      워커가 하나뿐이므로, 받아 두기만 하고 앞 작업이 끝날 때까지 대기시키지 않습니다.
+    - 작업 함수는 `job.cancel_event`를 확인해 스스로 멈추고, `job.update_progress()`로 진행 상황을 알립니다.
+    - 작업 기록은 메모리에만 보관합니다. (서버를 재시작하면 사라지며, 탐색 큐 자체는 frontier에 남습니다.)
+    """
+
+    def __init__(self, max_workers: int = JOB_WORKERS, history_limit: int = JOB_HISTORY_LIMIT):
+        self.history_limit = history_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, params: Dict[str, Any], target: Callable[[Job], Dict[str, Any]]) -> Job:
+        """target(job)을 백그라운드에서 실행합니다. target은 결과 dict를 반환합니다. ({"status": ..., ...})"""
+        with self._lock:
+            active = next((job for job in self._jobs.values() if job.status in ACTIVE_STATES), None)
+            if active is not None:
+                raise JobConflictError(active)
+            job = Job(kind, params)
+            self._jobs[job.id] = job
+            self._trim_history()
+        self._executor.submit(self._run, job, target)
+        logger.info("작업 등록: %s (job_id: %s)", kind, job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """최근 작업부터 반환합니다."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """작업 취소를 요청합니다. 작업은 진행 중인 페이지를 저장한 뒤 멈춥니다."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.cancel_event.set()
+        with job._lock:
+            if job.status in (PENDING, RUNNING):
+                job.status = CANCELLING
+        logger.info("작업 취소 요청: %s (job_id: %s)", job.kind, job.id)
+        return job
+
+    def shutdown(self):
+        """실행 중인 작업에 취소를 요청하고 끝날 때까지 기다립니다. (서버 종료 시)"""
+        for job in self.list():
+            if job.status in ACTIVE_STATES:
+                job.cancel_event.set()
+        self._executor.shutdown(wait=True)
+
+    def _run(self, job: Job, target: Callable[[Job], Dict[str, Any]]):
+        if job.cancel_event.is_set():
+            job._mark_finished(CANCELLED)
+            return
+        job._mark_started()
+        logger.info("작업 시작: %s (job_id: %s)", job.kind, job.id)
+        try:
+            result = target(job)
+        except Exception as e:
+            job._mark_finished(FAILED, error=str(e))
+            logger.exception("작업 실패: %s (job_id: %s): %s", job.kind, job.id, e)
+            return
+
+        result_status = (result or {}).get("status")
+        if result_status == "failed":
+            job._mark_finished(FAILED, result=result, error=result.get("message"))
+        elif result_status == "cancelled" or job.cancel_event.is_set():
+            job._mark_finished(CANCELLED, result=result)
+        else:
+            job._mark_finished(COMPLETED, result=result)
+        logger.info("작업 종료: %s (job_id: %s, 상태: %s)", job.kind, job.id, job.status)
+
+    def _trim_history(self):
+        """(락 안에서 호출) 끝난 작업 기록이 너무 많으면 오래된 것부터 지웁니다."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.status not in ACTIVE_STATES]
+        for job_id in finished[:max(0, len(self._jobs) - self.history_limit)]:
+            del self._jobs[job_id]
+
+
+job_registry = JobRegistry()
@@ -0,0 +1,99 @@
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+from . import metrics
+
+# 로그 설정 (환경 변수)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper() # DEBUG로 두면 CRUD 호출/곡 파싱/응답 미리보기 같은 호출 단위 로그도 출력
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text") # text 또는 json (한 줄에 JSON 객체 하나)
+LOG_FILE = os.getenv("LOG_FILE") # 지정하면 stdout 대신 이 파일에 기록
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000")) # 기록 스레드가 밀릴 때 버퍼링할 최대 레코드 수
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+# LogRecord 기본 속성. 이 밖의 속성은 `extra=`로 넘긴 필드로 보고 JSON에 그대로 넣습니다.
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드 하나를 JSON 한 줄로 출력합니다. (ts, level, logger, message, thread + extra 필드)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐가 가득 차면 INFO 이하 레코드는 기다리지 않고 버립니다. (로그 때문에 수집 스레드가 멈추지 않도록)
+    WARNING 이상은 버리지 않고 호출한 스레드에서 fallback 핸들러로 바로 기록합니다.
+    버린 레코드 수는 `starlight_log_records_dropped_total` 지표로 셉니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue, fallback: logging.Handler):
+        super().__init__(log_queue)
+        self.fallback = fallback
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                self.fallback.handle(record) # 핸들러 락으로 기록 스레드의 쓰기와 겹치지 않음
+            else:
+                metrics.LOG_RECORDS_DROPPED.inc(level=record.levelname)
+
+
+def setup_logging(level: str = LOG_LEVEL, log_format: str = LOG_FORMAT, log_file: Optional[str] = LOG_FILE):
+    """
+    루트 로거에 큐 핸들러를 붙입니다. (여러 번 호출해도 한 번만 설정)
+    호출한 스레드는 메시지에 인자를 합쳐(`QueueHandler.prepare`) 큐에 넣기만 하고,
+    시각/JSON 포맷팅과 stdout/파일 쓰기는 별도 스레드(QueueListener)가 합니다.
+    레벨보다 낮은 로그는 `logger.debug("...", 인자)` 호출 시점에 바로 버려지므로 문자열도 만들지 않습니다.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+    if log_format not in ("text", "json"):
+        raise ValueError(f"알 수 없는 LOG_FORMAT: {log_format} (사용 가능: text, json)")
+
+    output = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+    root = logging.getLogger()
+    root.setLevel(level)
+    _queue_handler = _DroppingQueueHandler(log_queue, output)
+    root.addHandler(_queue_handler)
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """큐 핸들러를 떼고, 큐에 남은 레코드를 모두 기록한 뒤 기록 스레드를 멈춥니다."""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = _queue_handler = None
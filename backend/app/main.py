@@ -1,17 +1,46 @@
-from fastapi import Depends, FastAPI, HTTPException
+import json
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
 
-from . import crud, models, schemas, genius_api
-from .database import SessionLocal, engine
+from . import (
+    collaborators, crud, graph_index, metrics, migrations, models, request_timing, schemas, genius_api, search_index,
+)
+from .api_cache import SEARCH_TAG, api_cache, person_tag, song_tag
+from .database import ReadSessionLocal, SessionLocal, engine, read_engine
+from .jobs import JobConflictError, job_registry
+from .logging_config import setup_logging, shutdown_logging
 from .services import musicdata_service
 
-# 데이터베이스 테이블 생성
+logger = logging.getLogger(__name__)
+
+# 로그 레벨/형식을 설정합니다. (마이그레이션 로그부터 큐 핸들러로 출력)
+setup_logging()
+
+# 데이터베이스 테이블 생성 후, 기존 DB의 스키마 변경(마이그레이션)을 적용합니다.
 models.Base.metadata.create_all(bind=engine)
+migrations.run_migrations(engine)
+
+# 기존 DB에 협업 쌍 테이블/검색 색인이 비어 있으면 한 번 채웁니다.
+with SessionLocal() as _db:
+    collaborators.ensure_collaborator_pairs(_db)
+    search_index.ensure_search_index(_db)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 서버 종료 시 실행 중인 탐색 작업에 취소를 요청하고, 받은 페이지까지 저장되기를 기다립니다.
+    job_registry.shutdown()
+    shutdown_logging()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # --- CORS 미들웨어 설정 ---
 origins = [
@@ -25,7 +54,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메소드 허용
     allow_headers=["*"],  # 모든 HTTP 헤더 허용
+    expose_headers=["X-Next-Cursor", "Server-Timing"],  # 페이지네이션 커서, 요청 계측 (SERVER_TIMING_HEADER=1)
 )
+
+# --- 요청 계측: 라우트별 응답 시간, 요청당 SQL 수/시간, 느린 요청 로그 ---
+request_timing.install(app, engine, read_engine)
 # -------------------------
 
 
@@ -38,6 +71,15 @@ def get_db():
         db.close()
 
 
+# 조회 전용 API용 세션 (탐색 작업의 쓰기 연결과 분리된 연결 풀 사용)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 # @app.post("/songs/", response_model=schemas.SongResponse)
 # def create_song(song: schemas.SongCreate, db: Session = Depends(get_db)):
 #     # 참고: 이미 존재하는 노래인지 확인하는 로직을 추가할 수 있습니다.
@@ -47,9 +89,10 @@ def get_db():
 
 # --- MusicBrainz Service Endpoints ---
 @app.post("/import/artist-by-name")
-def import_artist_by_name(request: schemas.ArtistImportRequest, db: Session = Depends(get_db)):
+def import_artist_by_name(request: schemas.ArtistImportRequest):
     """
     아티스트 이름으로 MusicBrainz에서 모든 릴리즈를 가져와 데이터베이스에 저장합니다.
+    profile=true면 가져오기 동안의 단계별 소요 시간과 샘플링 프로파일 요약을 함께 반환합니다. (전체 스택은 logs/profiles/)
     """
     try:
         # artist_mbid가 제공되면 그걸 사용, 아니면 artist_name으로 검색
@@ -64,8 +107,13 @@ def import_artist_by_name(request: schemas.ArtistImportRequest, db: Session = De
         if not artist_mbid_to_use:
             raise HTTPException(status_code=400, detail="아티스트 이름 또는 MBID가 필요합니다.")
 
-        result = musicdata_service.import_artist_by_mbid(db=db, artist_mbid=artist_mbid_to_use, known_explored_mbids=set(), queue=[]) # 큐는 여기서 관리하지 않음
-        return result
+        if not request.profile:
+            return musicdata_service.import_artist_by_mbid(artist_mbid=artist_mbid_to_use)
+
+        # 프로파일링: 이 요청 스레드의 스택을 샘플링하고, 단계별 소요 시간과 함께 결과에 붙입니다.
+        with metrics.profile_section(f"artist-{artist_mbid_to_use}") as profile:
+            result = musicdata_service.import_artist_by_mbid(artist_mbid=artist_mbid_to_use)
+        return dict(result, profile=profile)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -75,51 +123,148 @@ def import_artist_by_name(request: schemas.ArtistImportRequest, db: Session = De
         )
 
 # --- Exploration Queue Endpoints ---
-@app.post("/import/explore-queue")
-def start_exploration_queue(request: schemas.ExplorationQueueRequest):
+@app.post("/import/explore-queue", status_code=202, response_model=schemas.JobResponse)
+async def start_exploration_queue(request: schemas.ExplorationQueueRequest):
     """
-    MusicBrainz 데이터를 '연쇄 반응' 방식으로 탐색하여 DB에 저장합니다.
+    MusicBrainz 데이터를 '연쇄 반응' 방식으로 탐색하여 DB에 저장하는 백그라운드 작업을 시작합니다.
+    작업 ID를 바로 반환하며, 진행 상황은 GET /jobs/{job_id}, 취소는 POST /jobs/{job_id}/cancel로 합니다.
     """
-    print(f"[LOG] start_exploration_queue 엔드포인트 호출됨.")
-    print(f"[LOG] 요청 파라미터: initial_artist_name={request.initial_artist_name}, initial_artist_mbid={request.initial_artist_mbid}, max_data_gb={request.max_data_gb}")
+    logger.info("start_exploration_queue 엔드포인트 호출됨.")
+    logger.info(
+        "요청 파라미터: initial_artist_name=%s, initial_artist_mbid=%s, max_data_gb=%s",
+        request.initial_artist_name, request.initial_artist_mbid, request.max_data_gb,
+    )
 
     if not request.initial_artist_name and not request.initial_artist_mbid:
-        print("[LOG] 오류: 초기 아티스트 이름 또는 MBID가 필요합니다.")
+        logger.warning("오류: 초기 아티스트 이름 또는 MBID가 필요합니다.")
         raise HTTPException(status_code=400, detail="초기 아티스트 이름 또는 MBID가 필요합니다.")
 
-    try:
-        result = musicdata_service.run_exploration_queue(
+    def run(job):
+        return musicdata_service.run_exploration_queue(
             initial_artist_name=request.initial_artist_name,
             initial_artist_mbid=request.initial_artist_mbid,
-            max_data_gb=request.max_data_gb
+            max_data_gb=request.max_data_gb,
+            fetch_workers=request.fetch_workers,
+            schedule_policy=request.schedule_policy,
+            cancel_event=job.cancel_event,
+            on_progress=job.update_progress,
         )
-        print(f"[LOG] start_exploration_queue 엔드포인트 완료. 결과: {result['status']}")
-        return result
-    except HTTPException as e:
-        print(f"[LOG] 탐색 큐 실행 중 HTTPException 발생: {e.detail}")
-        raise e
-    except Exception as e:
-        print(f"[LOG] 탐색 큐 실행 중 예상치 못한 오류 발생: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"탐색 큐 실행 중 오류 발생: {e}"
+
+    try:
+        job = job_registry.submit("exploration", request.model_dump(), run)
+    except JobConflictError as e:
+        logger.error("탐색 작업 시작 실패: %s", e)
+        raise HTTPException(status_code=409, detail={"message": str(e), "job_id": e.job.id})
+    logger.info("start_exploration_queue 엔드포인트 완료. job_id: %s", job.id)
+    return job.to_dict()
+
+
+@app.post("/import/musicbrainz-dump", status_code=202, response_model=schemas.JobResponse)
+async def start_musicbrainz_dump_import(request: schemas.MusicBrainzDumpImportRequest):
+    """
+    서버에 있는 MusicBrainz JSON 덤프 파일에서 시드 아티스트 주변의 곡을 가져오는 백그라운드 작업을 시작합니다.
+    API 호출 없이 대량으로 초기 데이터를 채울 때 사용합니다. (진행 상황/취소는 /jobs 엔드포인트)
+    """
+    logger.info("start_musicbrainz_dump_import 엔드포인트 호출됨: %s", request.model_dump())
+    if not request.seed_artist_mbids and not request.seed_areas:
+        raise HTTPException(status_code=400, detail="seed_artist_mbids 또는 seed_areas가 필요합니다.")
+
+    def run(job):
+        return musicdata_service.import_musicbrainz_dump(
+            **request.model_dump(), cancel_event=job.cancel_event, on_progress=job.update_progress,
         )
 
+    try:
+        job = job_registry.submit("musicbrainz-dump", request.model_dump(), run)
+    except JobConflictError as e:
+        raise HTTPException(status_code=409, detail={"message": str(e), "job_id": e.job.id})
+    return job.to_dict()
+
+
+@app.get("/jobs", response_model=List[schemas.JobResponse])
+async def list_jobs():
+    """최근 백그라운드 작업 목록 (최신순)"""
+    return [job.to_dict() for job in job_registry.list()]
+
+
+@app.get("/jobs/{job_id}", response_model=schemas.JobResponse)
+async def get_job(job_id: str):
+    """작업 상태와 진행 상황 (처리한 아티스트 수, 큐 길이, DB 크기, 초당 요청 수 등)"""
+    job = job_registry.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@app.post("/jobs/{job_id}/cancel", status_code=202, response_model=schemas.JobResponse)
+async def cancel_job(job_id: str):
+    """
+    작업 취소를 요청합니다. 이미 받은 페이지까지 저장한 뒤 멈추며,
+    탐색 중이던 아티스트는 큐의 대기 상태로 돌아가 다음 실행 때 다시 탐색합니다.
+    """
+    job = job_registry.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+def _set_next_cursor(response: Response, items: list, limit: int):
+    """페이지가 가득 찼으면 다음 페이지 요청에 쓸 커서(마지막 id)를 X-Next-Cursor 헤더로 알려줍니다."""
+    if items and len(items) == limit:
+        response.headers["X-Next-Cursor"] = str(items[-1].id)
+
+
+def _ndjson_export(rows_for_session) -> StreamingResponse:
+    """요청 세션과 별개의 세션으로 행을 하나씩 읽어 NDJSON(한 줄에 JSON 하나)으로 스트리밍합니다."""
+    def generate():
+        db = ReadSessionLocal()
+        try:
+            lines = []
+            for row in rows_for_session(db):
+                lines.append(json.dumps(row, ensure_ascii=False, default=str))
+                if len(lines) >= crud.EXPORT_BATCH_SIZE:
+                    yield "\n".join(lines) + "\n" # 행마다 보내지 않고 배치 단위로 전송
+                    lines = []
+            if lines:
+                yield "\n".join(lines) + "\n"
+        finally:
+            db.close()
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 
 @app.get("/songs/", response_model=List[schemas.SongResponse])
-def read_songs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    songs = crud.get_songs(db, skip=skip, limit=limit)
+def read_songs(response: Response, skip: int = 0, limit: int = Query(100, ge=1, le=1000),
+               after_id: Optional[int] = None, include_contributions: bool = True,
+               db: Session = Depends(get_read_db)):
+    """
+    곡 목록. 다음 페이지는 응답 헤더의 X-Next-Cursor 값을 after_id로 넘겨 요청합니다. (skip은 하위 호환용)
+    include_contributions=false이면 기여 관계를 불러오지 않습니다. (contributions는 빈 목록)
+    """
+    songs = crud.get_songs(db, skip=skip, limit=limit, after_id=after_id, include_contributions=include_contributions)
+    _set_next_cursor(response, songs, limit)
+    if not include_contributions:
+        return [schemas.R_Song.model_validate(song) for song in songs]
     return songs
 
 
-@app.get("/songs/mbid/{mbid}/graph-details")
-def get_song_graph_details(mbid: str, db: Session = Depends(get_db)):
-    """(NEW) 특정 곡의 mbid를 받아, 해당 곡과 참여 인물 리스트를 그래프 형식으로 반환합니다."""
-    return crud.get_song_graph_details_by_mbid(db=db, mbid=mbid)
+@app.get("/songs/export")
+def export_songs():
+    """모든 곡(기여 관계 포함)을 NDJSON으로 스트리밍합니다."""
+    return _ndjson_export(crud.iter_songs_for_export)
+
+
+@app.get("/songs/mbid/{mbid}/graph-details", response_model=schemas.SongGraphResponse)
+def get_song_graph_details(mbid: str, request: Request, db: Session = Depends(get_read_db)):
+    """(NEW) 특정 곡의 mbid를 받아, 해당 곡과 참여 인물 리스트를 그래프 형식으로 반환합니다. (캐시 + ETag)"""
+    def compute():
+        result = crud.get_song_graph_details_by_mbid(db=db, mbid=mbid)
+        body = schemas.SongGraphResponse.model_validate(result).model_dump_json().encode()
+        return body, {song_tag(result["main"]["id"])}
+    return api_cache.respond(request, compute)
 
 
 @app.get("/songs/{song_id}", response_model=schemas.SongResponse)
-def read_song(song_id: int, db: Session = Depends(get_db)):
+def read_song(song_id: int, db: Session = Depends(get_read_db)):
     db_song = crud.get_song(db, song_id=song_id)
     if db_song is None:
         raise HTTPException(status_code=404, detail="Song not found")
@@ -127,18 +272,39 @@ def read_song(song_id: int, db: Session = Depends(get_db)):
 
 
 @app.get("/persons/", response_model=List[schemas.PersonResponse])
-def read_persons(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    persons = crud.get_persons(db, skip=skip, limit=limit)
+def read_persons(response: Response, skip: int = 0, limit: int = Query(100, ge=1, le=1000),
+                 after_id: Optional[int] = None, include_contributions: bool = True,
+                 db: Session = Depends(get_read_db)):
+    """
+    인물 목록. 다음 페이지는 응답 헤더의 X-Next-Cursor 값을 after_id로 넘겨 요청합니다. (skip은 하위 호환용)
+    include_contributions=false이면 기여 관계를 불러오지 않습니다. (contributions는 빈 목록)
+    """
+    persons = crud.get_persons(db, skip=skip, limit=limit, after_id=after_id, include_contributions=include_contributions)
+    _set_next_cursor(response, persons, limit)
+    if not include_contributions:
+        return [schemas.Person.model_validate(person) for person in persons]
     return persons
 
 
+@app.get("/persons/export")
+def export_persons():
+    """모든 인물(기여 관계 포함)을 NDJSON으로 스트리밍합니다."""
+    return _ndjson_export(crud.iter_persons_for_export)
+
+
 @app.get("/persons/{person_id}", response_model=schemas.PersonResponse)
-def read_person(person_id: int, db: Session = Depends(get_db)):
+def read_person(person_id: int, db: Session = Depends(get_read_db)):
     db_person = crud.get_person(db, person_id=person_id)
     if db_person is None:
         raise HTTPException(status_code=404, detail="Person not found")
     return db_person
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    """수집기 지표 (Prometheus 텍스트 형식): 단계별 소요 시간 히스토그램, 요청/바이트/재시도/저장 행 수 카운터"""
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.get("/")
 def read_root():
     return {"message": "K-POP 3D Graph API is running."}
@@ -169,13 +335,16 @@ def search_genius_songs(q: str):
 def import_genius_song(request: schemas.GeniusImportRequest, db: Session = Depends(get_db)):
     """Genius API에서 노래를 가져와 데이터베이스에 저장합니다."""
     db_song, _ = crud.import_genius_song_data(db=db, genius_song_id=request.genius_song_id)
+    graph_index.graph_index.invalidate()
     return db_song
 
 
 @app.post("/import/batch/genius_songs", response_model=schemas.BatchImportResponse)
 def import_batch_genius_songs(request: schemas.GeniusBatchImportRequest, db: Session = Depends(get_db)):
     """Genius 노래 ID 리스트를 받아 일괄적으로 데이터베이스에 저장합니다."""
-    return crud.batch_import_genius_songs(db=db, genius_song_ids=request.genius_song_ids)
+    result = crud.batch_import_genius_songs(db=db, genius_song_ids=request.genius_song_ids)
+    graph_index.graph_index.invalidate()
+    return result
 
 
 @app.get("/genius/artists/{artist_id}/songs")
@@ -198,40 +367,80 @@ def get_genius_artist_songs(artist_id: int, page: int = 1):
     
     # --- DEBUG LOGGING ---
     response_to_send = results["response"]
-    print("--- DEBUG: get_genius_artist_songs ---")
-    print(f"Type of response_to_send: {type(response_to_send)}")
+    logger.debug("--- DEBUG: get_genius_artist_songs ---")
+    logger.debug("Type of response_to_send: %s", type(response_to_send))
     # To avoid flooding the log, print only keys or a small part of the data
     if isinstance(response_to_send, dict):
-        print(f"Keys in response_to_send: {response_to_send.keys()}")
-        print(f"Next page: {response_to_send.get('next_page')}")
+        logger.debug("Keys in response_to_send: %s", response_to_send.keys())
+        logger.debug("Next page: %s", response_to_send.get('next_page'))
     else:
-        print(f"Data being sent (first 100 chars): {str(response_to_send)[:100]}")
-    print("--- END DEBUG ---")
+        logger.debug("Data being sent (first 100 chars): %s", str(response_to_send)[:100])
+    logger.debug("--- END DEBUG ---")
     # --- END DEBUG LOGGING ---
 
     return results["response"] # 'songs'와 'next_page' 정보를 모두 포함한 response 객체를 반환
 
 
 
+def _collaboration_cache_entry(result: schemas.CollaborationResponse):
+    return result.model_dump_json().encode(), {person_tag(result.main_artist.id)}
+
+
 @app.get("/artists/mbid/{mbid}/collaboration-details", response_model=schemas.CollaborationResponse)
-def get_artist_collaboration_details_by_mbid(mbid: str, db: Session = Depends(get_db)):
-    """(NEW) 특정 아티스트의 협업자 및 협업 곡 목록을 MBID 기준으로 상세히 반환합니다."""
-    return crud.get_collaboration_details_by_mbid(db=db, mbid=mbid)
+def get_artist_collaboration_details_by_mbid(mbid: str, request: Request, db: Session = Depends(get_read_db)):
+    """(NEW) 특정 아티스트의 협업자 및 협업 곡 목록을 MBID 기준으로 상세히 반환합니다. (캐시 + ETag)"""
+    return api_cache.respond(
+        request, lambda: _collaboration_cache_entry(crud.get_collaboration_details_by_mbid(db=db, mbid=mbid))
+    )
 
 
 @app.get("/artists/genius/{genius_id}/collaboration-details", response_model=schemas.CollaborationResponse)
-def get_artist_collaboration_details(genius_id: int, db: Session = Depends(get_db)):
-    """특정 아티스트의 협업자 및 협업 곡 목록을 상세히 반환합니다."""
-    return crud.get_collaboration_details(db=db, genius_id=genius_id)
+def get_artist_collaboration_details(genius_id: int, request: Request, db: Session = Depends(get_read_db)):
+    """특정 아티스트의 협업자 및 협업 곡 목록을 상세히 반환합니다. (캐시 + ETag)"""
+    return api_cache.respond(
+        request, lambda: _collaboration_cache_entry(crud.get_collaboration_details(db=db, genius_id=genius_id))
+    )
+
+
+@app.get("/graph/neighbourhood", response_model=schemas.GraphNeighbourhoodResponse)
+def get_graph_neighbourhood(
+    type: Literal["song", "person"],
+    mbid: str,
+    hops: int = 2,
+    fanout: str = str(graph_index.DEFAULT_FANOUT),
+    roles: Optional[List[str]] = Query(None),
+    max_nodes: int = graph_index.DEFAULT_MAX_NODES,
+    db: Session = Depends(get_read_db),
+):
+    """
+    곡 또는 인물의 k-hop 이웃 그래프를 한 번에 반환합니다.
+    - fanout: 단계별로 노드 하나당 펼칠 최대 이웃 수 (쉼표로 구분, 예: "20,10". 단계보다 짧으면 마지막 값 반복)
+    - roles: 이 역할의 기여 관계만 따라갑니다. (여러 번 지정 가능, 예: roles=composer&roles=lyricist)
+      한국어/Genius 역할 이름도 표준 역할로 바꿔 비교합니다. (예: roles=작곡 → composer)
+    - max_nodes: 결과 노드 수 상한
+    """
+    try:
+        fanout_limits = [int(limit) for limit in fanout.split(",") if limit.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="fanout은 쉼표로 구분된 정수여야 합니다.")
+    return graph_index.get_neighbourhood(
+        db, type, mbid, hops=hops, fanout=fanout_limits, roles=roles, max_nodes=max_nodes
+    )
 
 
 @app.get("/search", response_model=schemas.SearchResponse)
-def search_db(q: str, db: Session = Depends(get_db)):
+def search_db(q: str, request: Request, db: Session = Depends(get_read_db)):
     """
-    내부 DB에서 아티스트와 곡을 검색합니다. (Autocomplete용)
+    내부 DB에서 아티스트와 곡을 검색합니다. (Autocomplete용, 캐시 + ETag)
     """
     if not q or len(q) < 1:
         return {"results": []}
+    return api_cache.respond(
+        request, lambda: (schemas.SearchResponse.model_validate(_search(db, q)).model_dump_json().encode(), {SEARCH_TAG})
+    )
+
+
+def _search(db: Session, q: str):
 
     results = []
     
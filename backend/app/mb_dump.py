@@ -0,0 +1,267 @@
+import bz2
+import gzip
+import json
+import logging
+import lzma
+import os
+import tarfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from . import batch_writer, models, schemas
+from .musicbrainz_api import loads_json
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# MusicBrainz JSON 데이터 덤프 (https://metabrainz.org/datasets/postgres-dumps#musicbrainz → json-dumps)
+# 엔티티 하나가 한 줄의 JSON이며, `<엔티티>.tar.xz` 안의 `mbdump/<엔티티>` 파일에 들어 있습니다.
+DUMP_PAGE_SIZE = 1000 # write_song_page 한 번에 저장할 곡 수
+DUMP_DEFAULT_HOPS = 2 # 시드 아티스트 → 함께 참여한 아티스트까지
+PROGRESS_EVERY_LINES = 100_000
+IN_QUERY_CHUNK_SIZE = 500
+
+_COMPRESSED_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+def open_dump_lines(path: str, entity: str) -> Iterator[str]:
+    """
+    덤프 파일을 한 줄씩 읽습니다. (파일 전체를 메모리에 올리지 않음)
+    - `*.tar.xz`/`*.tar.gz`/`*.tar.bz2`: 배포 형식 그대로, 압축을 풀지 않고 `mbdump/<entity>` 항목을 스트리밍
+    - `*.xz`/`*.gz`/`*.bz2`: 한 줄에 엔티티 하나인 압축 파일
+    - 그 외: 압축하지 않은 JSON Lines 파일
+    """
+    if ".tar" in os.path.basename(path):
+        with tarfile.open(path, mode="r|*") as archive:
+            for member in archive:
+                if member.isfile() and os.path.basename(member.name) == entity:
+                    # 스트리밍 모드의 tar 항목은 seek할 수 없어 TextIOWrapper 대신 줄 단위로 디코딩합니다.
+                    for raw_line in archive.extractfile(member):
+                        yield raw_line.decode("utf-8")
+                    return
+        raise FileNotFoundError(f"{path}에 '{entity}' 덤프가 없습니다.")
+
+    opener = _COMPRESSED_OPENERS.get(os.path.splitext(path)[1], open)
+    with opener(path, "rt", encoding="utf-8") as dump_file:
+        yield from dump_file
+
+
+def iter_dump_entities(path: str, entity: str) -> Iterator[Dict[str, Any]]:
+    """덤프의 엔티티를 하나씩 dict로 반환합니다. 잘못된 줄은 건너뜁니다."""
+    bad_lines = 0
+    for line_number, line in enumerate(open_dump_lines(path, entity), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield loads_json(line)
+        except json.JSONDecodeError as e:
+            bad_lines += 1
+            logger.warning("%s %s번째 줄 파싱 실패, 건너뜀: %s", entity, line_number, e)
+        if line_number % PROGRESS_EVERY_LINES == 0:
+            logger.info("%s: %s줄 읽음", entity, line_number)
+    if bad_lines:
+        logger.info("%s: 잘못된 줄 %s개를 건너뛰었습니다.", entity, bad_lines)
+
+
+def _credited_artist_ids(recording: Dict[str, Any]) -> Set[str]:
+    return {
+        credit["artist"]["id"] for credit in recording.get("artist-credit", [])
+        if credit.get("artist", {}).get("id")
+    }
+
+
+def _related_artist_ids(recording: Dict[str, Any]) -> Set[str]:
+    return {
+        rel["artist"]["id"] for rel in recording.get("relations", [])
+        if rel.get("target-type") == "artist" and rel.get("artist", {}).get("id")
+    }
+
+
+def _work_ids(recording: Dict[str, Any]) -> Set[str]:
+    return {
+        rel["work"]["id"] for rel in recording.get("relations", [])
+        if rel.get("target-type") == "work" and rel.get("work", {}).get("id")
+    }
+
+
+class DumpImporter:
+    """
+    MusicBrainz JSON 덤프에서 시드 아티스트 주변의 부분 그래프만 골라 DB에 일괄 저장합니다. (API 호출 없음)
+
+    선택 범위: 시드 아티스트의 곡(hop 1) → 그 곡의 참여 아티스트의 곡(hop 2) → ... `hops`단계까지.
+    메모리에는 아티스트/작품 MBID 집합과 저장 대기 중인 곡 한 페이지만 보관하고, 덤프는 여러 번 스트리밍합니다.
+    1. (선택) artist 덤프: 지역 이름(`seed_areas`)으로 시드 아티스트 추가
+    2. recording 덤프 × (hops - 1): 탐색 범위 아티스트 확장 (Artist Credit + 아티스트 직접 관계 기준)
+    3. (work 덤프가 있으면) recording 덤프에서 필요한 작품 MBID 수집 → work 덤프에서 작품의 아티스트 관계 로드
+    4. recording 덤프: 선택된 곡을 `_parse_musicbrainz_recording_to_schema`로 변환해 `batch_writer`로 페이지 단위 저장
+    범위 안의 아티스트는 Artist Credit에 오른 곡이 모두 저장되었으므로 탐색 완료로 표시합니다. (API 탐색에서 다시 수집하지 않음)
+    """
+
+    def __init__(self, service, recording_path: str, work_path: Optional[str] = None,
+                 artist_path: Optional[str] = None, seed_artist_mbids: Iterable[str] = (),
+                 seed_areas: Iterable[str] = (), hops: int = DUMP_DEFAULT_HOPS,
+                 page_size: int = DUMP_PAGE_SIZE, cancel_event: Optional[threading.Event] = None,
+                 on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 session_factory: Callable = SessionLocal):
+        self.service = service
+        self.recording_path = recording_path
+        self.work_path = work_path
+        self.artist_path = artist_path
+        self.seed_artist_mbids = set(seed_artist_mbids)
+        self.seed_areas = {area.casefold() for area in seed_areas}
+        self.hops = max(1, hops)
+        self.page_size = page_size
+        self.cancel_event = cancel_event or threading.Event()
+        self.on_progress = on_progress
+        self.session_factory = session_factory
+
+        self.recordings_scanned = 0
+        self.imported_song_count = 0
+        self.pages_written = 0
+        self.failed_song_count = 0
+
+    def _cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "recordings_scanned": self.recordings_scanned,
+            "songs_imported": self.imported_song_count,
+            "pages_written": self.pages_written,
+        }
+
+    def _report_progress(self):
+        if self.on_progress is not None:
+            self.on_progress(self.progress())
+
+    def _resolve_seeds(self) -> Set[str]:
+        seeds = set(self.seed_artist_mbids)
+        if self.seed_areas and self.artist_path:
+            for artist in iter_dump_entities(self.artist_path, "artist"):
+                areas = (artist.get("area") or {}, artist.get("begin-area") or {})
+                if any((area.get("name") or "").casefold() in self.seed_areas for area in areas):
+                    seeds.add(artist["id"])
+        logger.info("시드 아티스트: %s명", len(seeds))
+        return seeds
+
+    def _expand(self, artists: Set[str]) -> Set[str]:
+        """artists의 곡에 참여한 아티스트를 더한 집합을 반환합니다. (recording 덤프 1회 스트리밍)"""
+        expanded = set(artists)
+        for recording in iter_dump_entities(self.recording_path, "recording"):
+            if self._cancelled():
+                break
+            credited = _credited_artist_ids(recording)
+            if credited & artists:
+                expanded |= credited | _related_artist_ids(recording)
+        return expanded
+
+    def _load_work_relations(self, explored: Set[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """선택된 곡에 연결된 작품의 아티스트 관계(작곡/작사 등)를 {work_id: relations}로 로드합니다."""
+        if not self.work_path:
+            return {}
+        needed: Set[str] = set()
+        for recording in iter_dump_entities(self.recording_path, "recording"):
+            if self._cancelled():
+                return {}
+            if _credited_artist_ids(recording) & explored:
+                needed |= _work_ids(recording)
+
+        relations: Dict[str, List[Dict[str, Any]]] = {}
+        for work in iter_dump_entities(self.work_path, "work"):
+            if self._cancelled():
+                break
+            if work.get("id") in needed:
+                relations[work["id"]] = [
+                    {"target-type": "artist", "type": rel.get("type"), "artist": rel.get("artist", {})}
+                    for rel in work.get("relations", []) if rel.get("target-type") == "artist"
+                ]
+        logger.info("작품 관계 로드: %s/%s개", len(relations), len(needed))
+        return relations
+
+    def _iter_selected_songs(self, explored: Set[str],
+                             work_relations: Dict[str, List[Dict[str, Any]]]) -> Iterator[schemas.CrawledSongData]:
+        for recording in iter_dump_entities(self.recording_path, "recording"):
+            self.recordings_scanned += 1
+            credits = [
+                credit["artist"] for credit in recording.get("artist-credit", [])
+                if credit.get("artist", {}).get("id") in explored
+            ]
+            if not credits:
+                continue
+            for rel in recording.get("relations", []):
+                if rel.get("target-type") == "work" and rel.get("work", {}).get("id") in work_relations:
+                    rel["work"]["relations"] = work_relations[rel["work"]["id"]]
+            parsed_song = self.service._parse_musicbrainz_recording_to_schema(
+                recording, artist_name_context=credits[0].get("name", "Unknown Artist")
+            )
+            if parsed_song:
+                yield parsed_song
+
+    def _write_pages(self, db, songs: Iterator[schemas.CrawledSongData]):
+        page: List[schemas.CrawledSongData] = []
+        for song in songs:
+            page.append(song)
+            if len(page) >= self.page_size:
+                self._write_page(db, page)
+                page = []
+                if self._cancelled():
+                    return
+        if page:
+            self._write_page(db, page)
+
+    def _write_page(self, db, page: List[schemas.CrawledSongData]):
+        page_result = batch_writer.write_song_page(db, page, self.service.person_cache)
+        self.imported_song_count += page_result["imported_song_count"]
+        self.failed_song_count += len(page_result["failed_song_mbids"])
+        self.pages_written += 1
+        self._report_progress()
+
+    def _mark_explored(self, db, mbids: Set[str]):
+        values = list(mbids)
+        for start in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+            chunk = values[start:start + IN_QUERY_CHUNK_SIZE]
+            db.query(models.Person).filter(models.Person.mbid.in_(chunk)).update(
+                {"is_explored": True}, synchronize_session=False
+            )
+        db.commit()
+
+    def run(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        explored = self._resolve_seeds()
+        if not explored:
+            return {"status": "failed", "message": "시드 아티스트가 없습니다. (seed_artist_mbids 또는 seed_areas 필요)"}
+
+        for hop in range(1, self.hops):
+            if self._cancelled():
+                break
+            expanded = self._expand(explored)
+            logger.info("탐색 범위 확장 (%s/%s): 아티스트 %s명 → %s명", hop, self.hops - 1, len(explored), len(expanded))
+            if len(expanded) == len(explored):
+                break
+            explored = expanded
+
+        work_relations = {} if self._cancelled() else self._load_work_relations(explored)
+        db = self.session_factory()
+        try:
+            if not self._cancelled():
+                self._write_pages(db, self._iter_selected_songs(explored, work_relations))
+            if not self._cancelled():
+                self._mark_explored(db, explored)
+        finally:
+            db.close()
+        self._report_progress()
+
+        elapsed = time.perf_counter() - started
+        result = {
+            "status": "cancelled" if self._cancelled() else "completed",
+            "explored_artists": len(explored),
+            "recordings_scanned": self.recordings_scanned,
+            "imported_song_count": self.imported_song_count,
+            "failed_song_count": self.failed_song_count,
+            "elapsed_seconds": round(elapsed, 2),
+            "songs_per_second": round(self.imported_song_count / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+        logger.info("덤프 가져오기 종료: %s", result)
+        return result
@@ -0,0 +1,326 @@
+import bisect
+import os
+import sys
+import threading
+import time
+from collections import Counter as _StackCounter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 수집기 계측: 단계별 소요 시간(히스토그램)과 카운터를 프로세스 메모리에 모아 `/metrics`로 노출합니다.
+# (Prometheus 텍스트 형식, 외부 라이브러리 없음. 값은 서버를 재시작하면 0부터 다시 셉니다.)
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(CURRENT_DIR, "..", "..", "logs", "profiles"))
+PROFILE_SAMPLE_INTERVAL_SECONDS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5")) / 1000
+PROFILE_TOP_STACKS = 20 # 프로파일 결과로 돌려줄 상위 스택 수 (전체는 파일로 저장)
+
+# 수집 단계 (starlight_crawl_stage_seconds의 stage 레이블)
+HTTP_FETCH = "http_fetch" # MusicBrainz 요청 전송 ~ 응답 본문 수신
+RATE_LIMIT_WAIT = "rate_limit_wait" # Rate Limiter 토큰 대기
+JSON_PARSE = "json_parse" # 응답 본문 파싱 (스트리밍 페이지는 첫 곡까지, 나머지는 schema_parse에 포함)
+SCHEMA_PARSE = "schema_parse" # Recording → CrawledSongData 변환
+PERSON_RESOLUTION = "person_resolution" # 기여자 인물 조회/생성
+DB_INSERT = "db_insert" # 곡/역할/기여 관계/협업 쌍/검색 색인 INSERT
+DB_COMMIT = "db_commit"
+STAGES = (HTTP_FETCH, RATE_LIMIT_WAIT, JSON_PARSE, SCHEMA_PARSE, PERSON_RESOLUTION, DB_INSERT, DB_COMMIT)
+
+# 대기/요청(수 초)부터 페이지 파싱(수 ms)까지 담을 수 있는 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터. `inc(amount, **labels)`"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {} if labelnames else {(): 0.0}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(Counter):
+    """현재 값 (큐 길이, DB 크기 등). `set(value, **labels)`"""
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """관측값 분포 (버킷별 개수, 합계, 개수). `observe(value, **labels)`"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 → [버킷별 개수(누적 아님, 마지막은 +Inf), 합계, 개수]
+        self._series: Dict[LabelValues, List[Any]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def totals(self) -> Dict[LabelValues, Tuple[float, int]]:
+        """{레이블 값: (합계, 개수)}"""
+        with self._lock:
+            return {key: (series[1], series[2]) for key, series in self._series.items()}
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            series_items = sorted((key, [list(series[0]), series[1], series[2]]) for key, series in self._series.items())
+        lines = []
+        for key, (bucket_counts, total, count) in series_items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                labels = _format_labels(self.labelnames, key, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        return "\n".join(line for metric in self._metrics.values() for line in metric.render()) + "\n"
+
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS = registry.histogram(
+    "starlight_crawl_stage_seconds", "Time spent in each crawl stage.", ("stage",)
+)
+MUSICBRAINZ_REQUESTS = registry.counter(
+    "starlight_musicbrainz_requests_total", "MusicBrainz HTTP requests by status code ('error': no response).",
+    ("status",),
+)
+MUSICBRAINZ_RESPONSE_BYTES = registry.counter(
+    "starlight_musicbrainz_response_bytes_total", "MusicBrainz response body bytes received."
+)
+MUSICBRAINZ_RETRIES = registry.counter(
+    "starlight_musicbrainz_retries_total", "MusicBrainz request retries by reason (throttle, error).", ("reason",)
+)
+HTTP_CACHE_HITS = registry.counter(
+    "starlight_http_cache_hits_total", "MusicBrainz responses served from the HTTP cache without a request."
+)
+SONGS_IMPORTED = registry.counter("starlight_songs_imported_total", "Songs committed to the database.")
+PERSONS_CREATED = registry.counter("starlight_persons_created_total", "New persons committed to the database.")
+CONTRIBUTIONS_WRITTEN = registry.counter(
+    "starlight_contributions_written_total", "Contribution rows written (duplicates ignored by the database)."
+)
+ARTISTS_EXPLORED = registry.counter("starlight_artists_explored_total", "Artists whose songs were fully imported.")
+FRONTIER_SIZE = registry.gauge("starlight_frontier_size", "Artists waiting in the exploration queue.")
+DB_SIZE_BYTES = registry.gauge("starlight_db_size_bytes", "SQLite database file size seen by the exploration loop.")
+LOG_RECORDS_DROPPED = registry.counter(
+    "starlight_log_records_dropped_total", "Log records below WARNING dropped because the log queue was full.", ("level",)
+)
+
+# API 요청 (request_timing 미들웨어가 기록, route는 라우트 템플릿)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+HTTP_REQUESTS = registry.counter(
+    "starlight_http_requests_total", "API requests by route and status.", ("method", "route", "status")
+)
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "starlight_http_request_seconds", "API request latency until the response headers are ready.", ("method", "route")
+)
+HTTP_REQUEST_QUERIES = registry.histogram(
+    "starlight_http_request_queries", "SQL statements executed per API request.", ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_SQL_SECONDS = registry.histogram(
+    "starlight_http_request_sql_seconds", "Time spent executing SQL per API request.", ("method", "route")
+)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """with 블록의 실행 시간을 해당 단계의 히스토그램에 기록합니다. (예외가 나도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage)
+
+
+def stage_totals() -> Dict[str, float]:
+    """단계별 누적 소요 시간(초). 프로파일 전후 차이로 한 번의 수집에 쓴 시간을 계산할 때 사용합니다."""
+    return {key[0]: total for key, (total, _) in STAGE_SECONDS.totals().items()}
+
+
+def render_prometheus() -> str:
+    return registry.render()
+
+
+# --- 샘플링 프로파일러 ---
+
+class SamplingProfiler:
+    """
+    한 스레드의 호출 스택을 일정 간격으로 샘플링합니다. (`sys._current_frames()`, 대상 스레드는 멈추지 않음)
+    결과는 flamegraph.pl / speedscope에서 열 수 있는 folded 형식(`모듈:함수;모듈:함수 샘플 수`)입니다.
+    모든 함수 호출을 가로채는 cProfile과 달리 부담이 샘플 간격에만 비례하므로 실제 수집 중에도 켤 수 있습니다.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None,
+                 interval_seconds: float = PROFILE_SAMPLE_INTERVAL_SECONDS):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval_seconds = interval_seconds
+        self.stacks: _StackCounter = _StackCounter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _frame_name(frame) -> str:
+        module = frame.f_globals.get("__name__", "?")
+        return f"{module}:{frame.f_code.co_name}"
+
+    def _sample(self):
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                names.append(self._frame_name(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self.sample_count += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sample, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top_functions(self, limit: int = PROFILE_TOP_STACKS) -> List[Dict[str, Any]]:
+        """샘플이 가장 많이 잡힌 함수 (self: 스택 맨 위, total: 스택 어딘가에 있음)"""
+        self_counts: _StackCounter = _StackCounter()
+        total_counts: _StackCounter = _StackCounter()
+        for stack, count in self.stacks.items():
+            names = stack.split(";")
+            self_counts[names[-1]] += count
+            for name in set(names):
+                total_counts[name] += count
+        samples = max(self.sample_count, 1)
+        return [
+            {"function": name, "self_ratio": round(self_counts[name] / samples, 3),
+             "total_ratio": round(total / samples, 3)}
+            for name, total in sorted(total_counts.items(), key=lambda item: (-self_counts[item[0]], -item[1]))[:limit]
+        ]
+
+
+@contextmanager
+def profile_section(name: str) -> Iterator[Dict[str, Any]]:
+    """
+    with 블록(현재 스레드)을 샘플링 프로파일링하고, 끝나면 yield한 dict에 요약을 채웁니다.
+    - elapsed_seconds, samples, stage_seconds(블록 동안 늘어난 단계별 시간: 다른 스레드의 수집 포함), top_functions
+    - folded 스택 전체는 `PROFILE_DIR/<name>-<시각>.folded`에 저장하고 경로를 profile_path로 돌려줍니다.
+    """
+    report: Dict[str, Any] = {}
+    stages_before = stage_totals()
+    profiler = SamplingProfiler()
+    started = time.perf_counter()
+    profiler.start()
+    try:
+        yield report
+    finally:
+        profiler.stop()
+        stages_after = stage_totals()
+        report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        report["samples"] = profiler.sample_count
+        report["stage_seconds"] = {
+            stage: round(stages_after.get(stage, 0.0) - stages_before.get(stage, 0.0), 4) for stage in STAGES
+        }
+        report["top_functions"] = profiler.top_functions()
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        safe_name = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name)
+        path = os.path.join(PROFILE_DIR, f"{safe_name}-{time.strftime('%Y%m%d-%H%M%S')}.folded")
+        with open(path, "w", encoding="utf-8") as profile_file:
+            profile_file.write(profiler.folded())
+        report["profile_path"] = os.path.abspath(path)
@@ -0,0 +1,120 @@
+import logging
+from datetime import datetime, timezone
+from typing import Callable, List, NamedTuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from . import models, roles
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+# --- 마이그레이션 ---
+# `Base.metadata.create_all()`은 없는 테이블만 만들고 기존 테이블의 컬럼/인덱스는 바꾸지 않습니다.
+# 기존 DB를 현재 모델에 맞추는 변경을 여기에 순서대로 추가합니다.
+# create_all로 새로 만든 DB에서도 실행되므로, 각 단계는 이미 적용된 상태면 아무것도 하지 않아야 합니다.
+
+def _intern_contribution_roles(conn: Connection):
+    """
+    contributions.role(문자열)을 roles 테이블의 정수 ID(role_id)로 바꿉니다.
+    기본 키가 바뀌므로 기존 테이블을 contributions_legacy로 옮기고 새 테이블에 복사합니다.
+    (SQLite에서는 DDL이 트랜잭션에 묶이지 않으므로, 중간에 중단되면 다음 실행 때 legacy 테이블에서 이어서 복사합니다.)
+    """
+    inspector = inspect(conn)
+    if "contributions_legacy" not in inspector.get_table_names():
+        columns = {column["name"] for column in inspector.get_columns("contributions")}
+        if "role_id" in columns:
+            return
+        conn.execute(text("ALTER TABLE contributions RENAME TO contributions_legacy"))
+        if conn.dialect.name == "postgresql":
+            # PostgreSQL은 제약 조건 이름이 테이블 이름과 함께 바뀌지 않아 새 테이블의 기본 키와 충돌합니다.
+            conn.execute(text("ALTER TABLE contributions_legacy RENAME CONSTRAINT contributions_pkey TO contributions_legacy_pkey"))
+
+    models.Role.__table__.create(conn, checkfirst=True)
+    models.Contribution.__table__.create(conn, checkfirst=True)
+    conn.execute(text(
+        "INSERT INTO roles (name) SELECT DISTINCT role FROM contributions_legacy "
+        "WHERE role IS NOT NULL AND role NOT IN (SELECT name FROM roles)"
+    ))
+    conn.execute(text(
+        "INSERT INTO contributions (song_id, person_id, role_id) "
+        "SELECT c.song_id, c.person_id, r.id FROM contributions_legacy AS c JOIN roles AS r ON r.name = c.role "
+        "WHERE NOT EXISTS (SELECT 1 FROM contributions AS n "
+        "                  WHERE n.song_id = c.song_id AND n.person_id = c.person_id AND n.role_id = r.id)"
+    ))
+    conn.execute(text("DROP TABLE contributions_legacy"))
+
+
+def _create_model_indexes(*models_with_indexes) -> Callable[[Connection], None]:
+    """모델에 선언된 인덱스 중 없는 것을 만듭니다."""
+    def upgrade(conn: Connection):
+        for model in models_with_indexes:
+            for index in model.__table__.indexes:
+                index.create(conn, checkfirst=True)
+    return upgrade
+
+
+def _canonicalize_roles(conn: Connection):
+    """
+    roles 테이블에 표준 역할 컬럼(base_role, attributes, category)을 추가하고,
+    출처마다 다르게 저장된 같은 역할('작곡'/'composer' 등)을 하나의 role_id로 합칩니다.
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("roles")}
+    for column in models.Role.__table__.columns:
+        if column.name not in columns:
+            conn.execute(text(f"ALTER TABLE roles ADD COLUMN {column.name} {column.type.compile(conn.dialect)}"))
+    merged = roles.canonicalize_roles(conn)
+    for index in models.Role.__table__.indexes:
+        index.create(conn, checkfirst=True)
+    logger.info("역할 %s개를 표준 역할로 합쳤습니다.", merged)
+
+
+def _drop_collaborator_song_ids(conn: Connection):
+    """
+    collaborator_pairs.song_ids(쉼표로 이은 곡 ID 목록)를 삭제합니다.
+    협업 곡은 조회 시 contributions 인덱스로 찾으므로, 쌍마다 점점 길어지는 문자열을 다시 쓸 필요가 없습니다.
+    """
+    inspector = inspect(conn)
+    if "collaborator_pairs" not in inspector.get_table_names():
+        return
+    if "song_ids" in {column["name"] for column in inspector.get_columns("collaborator_pairs")}:
+        conn.execute(text("ALTER TABLE collaborator_pairs DROP COLUMN song_ids"))
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "intern_contribution_roles", _intern_contribution_roles),
+    Migration(2, "contribution_traversal_indexes", _create_model_indexes(models.Contribution, models.Person)),
+    Migration(3, "canonical_roles", _canonicalize_roles),
+    Migration(4, "drop_collaborator_song_ids", _drop_collaborator_song_ids),
+]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """적용되지 않은 마이그레이션을 버전 순서대로 실행합니다. 적용한 버전 목록을 반환합니다."""
+    models.SchemaMigration.__table__.create(engine, checkfirst=True)
+    with engine.connect() as conn:
+        applied = {version for (version,) in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+    newly_applied = []
+    for migration in sorted(MIGRATIONS, key=lambda migration: migration.version):
+        if migration.version in applied:
+            continue
+        logger.info("%04d_%s 적용 중...", migration.version, migration.name)
+        # 마이그레이션과 버전 기록을 한 트랜잭션으로 처리합니다.
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(
+                models.SchemaMigration.__table__.insert(),
+                {"version": migration.version, "name": migration.name, "applied_at": datetime.now(timezone.utc)},
+            )
+        newly_applied.append(migration.version)
+    if newly_applied:
+        logger.info("마이그레이션 %s개 적용 완료: %s", len(newly_applied), newly_applied)
+    return newly_applied
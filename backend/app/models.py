@@ -1,17 +1,40 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Boolean, Index
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from .database import Base
 
 
+class Role(Base):
+    """
+    표준 역할 사전. 기여 관계는 역할 문자열 대신 이 테이블의 정수 ID를 저장합니다.
+    MusicBrainz/Genius/한국어 역할 이름은 `roles.parse_role()`로 표준 역할과 속성으로 나누어 저장합니다.
+    """
+    __tablename__ = 'roles'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False) # 표준 역할 이름 (예: 'instrument (bass, guitar)')
+    base_role = Column(String, index=True) # 속성을 뺀 표준 역할 (예: 'instrument'), 역할 필터에 사용
+    attributes = Column(String, nullable=True) # 정렬된 속성 목록 (예: 'bass, guitar')
+    category = Column(String) # creative / technical / performer
+
+
 class Contribution(Base):
     __tablename__ = 'contributions'
     song_id = Column(Integer, ForeignKey('songs.id'), primary_key=True)
     person_id = Column(Integer, ForeignKey('persons.id'), primary_key=True)
-    role = Column(String, primary_key=True)  # 역할(Role)을 복합 기본 키에 포함
+    role_id = Column(Integer, ForeignKey('roles.id'), primary_key=True)  # 역할(Role)을 복합 기본 키에 포함
 
     song = relationship("Song", back_populates="contributions")
     person = relationship("Person", back_populates="contributions")
+    role_ref = relationship("Role", lazy="joined")
+    role = association_proxy("role_ref", "name")  # 기존 코드/응답 스키마와 호환되는 역할 이름 (읽기 전용)
+
+    __table_args__ = (
+        # 인물 → 참여 곡 조회용. (기본 키는 song_id로 시작하므로 person_id 조건에는 쓰이지 않음)
+        # role_id까지 포함하여 인물의 곡/역할 조회가 테이블을 읽지 않고 인덱스만으로 끝나도록 합니다.
+        Index("ix_contributions_person_song", "person_id", "song_id", "role_id"),
+    )
 
 
 class Song(Base):
@@ -44,3 +67,35 @@ class Person(Base):
 
     # Person이 Contribution 레코드들을 리스트로 가질 수 있도록 관계 설정
     contributions = relationship("Contribution", back_populates="person", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # 탐색 시작 시 '이미 탐색된 아티스트 MBID' 조회와 탐색 범위 집계를 인덱스만으로 처리
+        Index("ix_persons_explored_mbid", "is_explored", "mbid"),
+    )
+
+
+class CollaboratorPair(Base):
+    """
+    두 인물이 함께 참여한 곡 수를 미리 집계해 둔 테이블입니다. (양방향으로 한 행씩 저장)
+    곡이 저장될 때 `collaborators.record_new_contributions()`가 점진적으로 갱신합니다.
+    함께 참여한 곡 목록은 저장하지 않고, 조회 시 `ix_contributions_person_song` 인덱스로 찾습니다.
+    """
+    __tablename__ = "collaborator_pairs"
+
+    person_id = Column(Integer, ForeignKey('persons.id'), primary_key=True)
+    collaborator_id = Column(Integer, ForeignKey('persons.id'), primary_key=True)
+    shared_song_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # 특정 인물의 협업자를 협업 곡 수 순으로 바로 읽기 위한 인덱스
+        Index("ix_collaborator_pairs_person_count", "person_id", "shared_song_count"),
+    )
+
+
+class SchemaMigration(Base):
+    """적용된 스키마 마이그레이션 기록 (`migrations.py` 참고)"""
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime, nullable=False)
@@ -1,65 +1,297 @@
 import requests
+from requests.adapters import HTTPAdapter
+import io
 import json
+import logging
+import os
 import time
-import sys
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Set
 
 from fastapi import HTTPException
 
-BASE_URL = "https://musicbrainz.org/ws/2/"
+# 선택적 JSON 백엔드: 설치되어 있으면 사용합니다. (pip install orjson ijson)
+try:
+    import orjson # 표준 json보다 빠른 파서
+except ImportError:
+    orjson = None
+try:
+    import ijson # Recording 목록을 하나씩 파싱하는 점진적 파서
+except ImportError:
+    ijson = None
+
+from . import metrics
+from .http_cache import HTTP_CACHE_OFFLINE, response_cache
+from .rate_limit import AdaptiveRateLimiter, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = os.getenv("MUSICBRAINZ_BASE_URL", "https://musicbrainz.org/ws/2/") # 로컬 가짜 서버로 바꿀 수 있음 (benchmarks.fake_musicbrainz)
 HEADERS = {
     "User-Agent": "KpopGraphApp/0.1 (contact@kpopgraph.com)", # 실제 이메일 주소로 변경 필요
     "Accept": "application/json"
 }
 MAX_RETRIES = 5
-RETRY_DELAY_SECONDS = 2
-API_CALL_DELAY_SECONDS = 1 # MusicBrainz API Rate Limit (1 req/sec)
+RETRY_DELAY_SECONDS = 2 # 지수 백오프의 기본 대기 시간
+MAX_RETRY_DELAY_SECONDS = 60
+API_CALL_DELAY_SECONDS = 1 / float(os.getenv("MUSICBRAINZ_REQUESTS_PER_SECOND", "1")) # MusicBrainz API Rate Limit (1 req/sec, 로컬 서버에서만 올리세요)
+REQUEST_TIMEOUT_SECONDS = 30
+ESTIMATED_BYTES_PER_RECORDING = 4096 # inc 포함 Recording 응답의 곡당 크기 추정 초깃값 (RecordingFetchPlanner 절약량 계산용)
+CONNECTION_POOL_SIZE = 8 # 탐색 워커 수 이상으로 설정
+THROTTLE_STATUS_CODES = {429, 503} # Rate Limit 초과 응답 (Retry-After 참고)
+RETRYABLE_STATUS_CODES = THROTTLE_STATUS_CODES | {500, 502, 504}
+
+# 모든 호출(여러 탐색 워커 포함)이 공유하는 전역 Rate Limiter
+rate_limiter = AdaptiveRateLimiter(
+    rate=1 / API_CALL_DELAY_SECONDS,
+    capacity=1,
+    backoff_base_seconds=RETRY_DELAY_SECONDS,
+    backoff_max_seconds=MAX_RETRY_DELAY_SECONDS,
+)
+
+def _create_session() -> requests.Session:
+    """Keep-Alive 연결을 재사용하는 공용 HTTP 세션을 만듭니다."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=CONNECTION_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+http_session = _create_session()
+
+MAX_RAW_LOG_CHARS = 500 # 원본 JSON 응답의 최대 로깅 문자 수(바이트)
+
+# Recording 페이지를 점진적으로 파싱할지 여부. auto: ijson의 C 백엔드가 있을 때만 (순수 파이썬 백엔드는 느림)
+STREAMING_JSON = os.getenv("MUSICBRAINZ_STREAMING_JSON", "auto")
+_use_streaming_json = ijson is not None and (
+    STREAMING_JSON == "1" or (STREAMING_JSON == "auto" and ijson.backend in ("yajl2_c", "yajl2_cffi"))
+)
+STREAMING_JSON_MIN_BYTES = 256 * 1024 # 이보다 작은 페이지는 한 번에 파싱 (검사 + 점진적 파싱보다 빠름)
+
+
+def loads_json(body) -> Any:
+    """JSON 문자열/바이트를 파싱합니다. (orjson이 설치되어 있으면 orjson 사용)"""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+class RecordingPage:
+    """
+    inc 포함 Recording browse 응답 한 페이지. Recording을 순서대로 하나씩 반환하는 iterable입니다.
+
+    ijson을 쓸 수 있고 응답이 STREAMING_JSON_MIN_BYTES 이상이면 원본 바이트를 한 번만 훑으면서 Recording을 하나씩 만들므로,
+    페이지 전체를 파이썬 객체로 만들지 않습니다. (최대 메모리: 응답 바이트 + Recording 하나) 아니면 전체를 한 번에 파싱합니다.
+    생성 시 recording-count(MusicBrainz 응답에서 recordings 앞에 있음)와 첫 Recording까지 파싱하므로
+    `count`와 빈 페이지인지(`bool(page)`)를 바로 알 수 있습니다.
+    점진적 파싱 중 뒷부분이 깨져 있으면 순회 도중 ValueError가 발생하므로, 캐시 저장처럼 본문이 올바를 때만 할 일은
+    `after_parsed`로 등록합니다. (끝까지 파싱된 뒤에 호출)
+    """
+
+    def __init__(self, recordings: Iterable[Dict[str, Any]] = (), count: Optional[int] = None,
+                 body: Optional[bytes] = None):
+        self.count = count # 아티스트의 전체 Recording 수 (응답에 없으면 None)
+        self._parsed = body is None
+        self._after_parsed: List[Callable[[], None]] = []
+        self._recordings = self._stream(body) if body is not None else iter(recordings)
+        self._first = next(self._recordings, None)
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "RecordingPage":
+        if not _use_streaming_json or len(body) < STREAMING_JSON_MIN_BYTES:
+            data = loads_json(body)
+            return cls(data.get("recordings", []), data.get("recording-count"))
+        return cls(count=cls._read_count(body), body=body)
+
+    @staticmethod
+    def _read_count(body: bytes) -> Optional[int]:
+        """recordings 앞의 recording-count만 읽고 멈춥니다. (본문 앞부분의 토큰 몇 개만 파싱)"""
+        try:
+            for prefix, event, value in ijson.parse(io.BytesIO(body)):
+                if prefix == "recording-count" and event == "number":
+                    return value
+                if prefix == "recordings":
+                    return None
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        return None
+
+    def _stream(self, body: bytes) -> Iterator[Dict[str, Any]]:
+        """recordings의 항목을 하나씩 만들어 반환합니다. 본문 전체를 한 번만 훑습니다."""
+        try:
+            yield from ijson.items(io.BytesIO(body), "recordings.item", use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        self._finish()
+
+    def _finish(self):
+        self._parsed = True
+        callbacks, self._after_parsed = self._after_parsed, []
+        for callback in callbacks:
+            callback()
+
+    def after_parsed(self, callback: Callable[[], None]):
+        """본문 전체가 올바르게 파싱되면 callback을 호출합니다. (이미 파싱되었으면 바로 호출)"""
+        if self._parsed:
+            callback()
+        else:
+            self._after_parsed.append(callback)
+
+    def __bool__(self) -> bool:
+        return self._first is not None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._first is None:
+            return
+        first, self._first = self._first, None
+        yield first
+        yield from self._recordings
+
+
+def _store_when_parsed(data: Any, url: str, cache_endpoint: str, response: requests.Response):
+    """응답을 캐시에 저장합니다. 점진적으로 파싱되는 페이지는 끝까지 올바르게 파싱된 뒤에 저장합니다."""
+    def store():
+        response_cache.store(url, cache_endpoint, response.content, response.headers)
+
+    if isinstance(data, RecordingPage):
+        data.after_parsed(store)
+    else:
+        store()
+
+
+def _raw_preview(body: bytes) -> str:
+    """로그용 응답 미리보기. 파싱한 객체를 다시 직렬화하지 않고 원본 바이트 앞부분만 디코딩합니다."""
+    return body[:MAX_RAW_LOG_CHARS].decode("utf-8", errors="replace")
+
+
+class FetchUsage:
+    """MusicBrainz에 실제로 보낸 요청 수와 내려받은 응답 본문 크기(바이트)를 셉니다. (캐시 응답 제외)"""
 
-MAX_RAW_LOG_CHARS = 500 # 원본 JSON 응답의 최대 로깅 문자 수
+    def __init__(self):
+        self.requests = 0
+        self.bytes = 0
+
+    def record(self, response: requests.Response):
+        self.requests += 1
+        self.bytes += len(response.content)
+
+
+def _make_api_call(url: str, entity_type: str = "데이터", cache_endpoint: Optional[str] = None,
+                   usage: Optional[FetchUsage] = None) -> Dict[str, Any]:
+    """MusicBrainz API를 호출하고 응답 JSON 전체를 파싱해 반환합니다. (`_fetch_body` 참고)"""
+    return _fetch_body(url, entity_type, cache_endpoint, usage, parse=loads_json)
+
+
+def _fetch_body(url: str, entity_type: str, cache_endpoint: Optional[str], usage: Optional[FetchUsage],
+                parse: Callable[[bytes], Any]) -> Any:
+    """
+    MusicBrainz API 호출을 수행하고, 실패 시 재시도 로직을 포함합니다. 응답 본문(bytes)을 parse에 넘긴 결과를 반환합니다.
+
+    - cache_endpoint가 주어지면 로컬 응답 캐시(`http_cache`)를 먼저 확인합니다.
+      (만료되지 않은 응답은 네트워크 없이 반환, 만료된 응답은 가능하면 조건부 요청으로 재검증)
+    - 요청은 공용 토큰 버킷(`rate_limiter`)에서 토큰을 받는 즉시 시작합니다.
+    - 503/429 응답은 `Retry-After`를 따르고, 없으면 지수 백오프 + 지터로 모든 워커를 잠시 멈춥니다.
+    - 연결 오류와 5xx 응답은 지수 백오프 + 지터 후 재시도합니다.
+    - parse가 ValueError(JSONDecodeError 포함)를 내면 500으로 처리하며, 이 응답은 캐시에 저장하지 않습니다.
+      (점진적으로 파싱되는 `RecordingPage`는 끝까지 파싱된 뒤에 저장)
+    """
+    use_cache = response_cache is not None and cache_endpoint is not None
+    cached = response_cache.lookup(url) if use_cache else None
+    if cached and (cached.is_fresh or HTTP_CACHE_OFFLINE):
+        logger.debug("[%s] 캐시된 응답 사용: %s", entity_type, url)
+        metrics.HTTP_CACHE_HITS.inc()
+        with metrics.timed(metrics.JSON_PARSE):
+            return parse(cached.body)
+    if use_cache and HTTP_CACHE_OFFLINE:
+        raise HTTPException(
+            status_code=503,
+            detail=f"오프라인 모드: 캐시에 없는 MusicBrainz 요청입니다. ({url})"
+        )
+    request_headers = cached.conditional_headers() if cached else {}
 
-def _make_api_call(url: str, entity_type: str = "데이터") -> Dict[str, Any]:
-    """MusicBrainz API 호출을 수행하고, 실패 시 재시도 로직을 포함합니다."""
     response_data = None
     for attempt in range(MAX_RETRIES):
+        is_last_attempt = attempt >= MAX_RETRIES - 1
+        response = None
         try:
-            print(f"[{entity_type}] API 호출 (시도 {attempt + 1}/{MAX_RETRIES}): {url}")
-            response = requests.get(url, headers=HEADERS)
+            waited = rate_limiter.acquire() # API Rate Limit 준수 (토큰이 생기는 즉시 요청)
+            metrics.STAGE_SECONDS.observe(waited, stage=metrics.RATE_LIMIT_WAIT)
+            logger.debug("[%s] API 호출 (시도 %s/%s): %s", entity_type, attempt + 1, MAX_RETRIES, url)
+            try:
+                with metrics.timed(metrics.HTTP_FETCH):
+                    response = http_session.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT_SECONDS)
+            except requests.exceptions.RequestException:
+                metrics.MUSICBRAINZ_REQUESTS.inc(status="error")
+                raise
+            metrics.MUSICBRAINZ_REQUESTS.inc(status=response.status_code)
+            metrics.MUSICBRAINZ_RESPONSE_BYTES.inc(len(response.content))
+            if usage is not None:
+                usage.record(response)
+
+            if response.status_code == 304 and cached:
+                # 변경 없음: 캐시된 본문을 그대로 사용하고 만료 시각만 갱신
+                rate_limiter.record_success()
+                response_cache.revalidated(url, cache_endpoint)
+                logger.debug("[%s] 캐시 재검증 완료 (304 Not Modified)", entity_type)
+                with metrics.timed(metrics.JSON_PARSE):
+                    response_data = parse(cached.body)
+                break
+
+            if response.status_code in THROTTLE_STATUS_CODES and not is_last_attempt:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = rate_limiter.record_throttle(attempt, retry_after=retry_after)
+                metrics.MUSICBRAINZ_RETRIES.inc(reason="throttle")
+                logger.warning(
+                    "[%s] 서버 스로틀링 (%s). %.1f초 후 재시도... (현재 속도: %.2f req/s)",
+                    entity_type, response.status_code, delay, rate_limiter.rate,
+                )
+                continue
+
             response.raise_for_status() # HTTP 오류 발생 시 예외 발생 (4xx, 5xx)
-            response_data = response.json()
-            print(f"[{entity_type}] API 호출 성공!")
-            # 원본 JSON 응답의 일부를 로그에 기록
-            print(f"[{entity_type}] 원본 응답 (일부): {json.dumps(response_data, ensure_ascii=False)[:MAX_RAW_LOG_CHARS]}...")
+            with metrics.timed(metrics.JSON_PARSE):
+                response_data = parse(response.content)
+            rate_limiter.record_success()
+            if use_cache:
+                _store_when_parsed(response_data, url, cache_endpoint, response)
+            if logger.isEnabledFor(logging.DEBUG):
+                # 원본 JSON 응답의 일부를 로그에 기록 (미리보기 디코딩은 DEBUG일 때만)
+                logger.debug(
+                    "[%s] API 호출 성공! (%s bytes) 원본 응답 (일부): %s...",
+                    entity_type, len(response.content), _raw_preview(response.content),
+                    extra={"url": url, "status": response.status_code, "bytes": len(response.content)},
+                )
             break # 성공했으므로 루프 탈출
         except requests.exceptions.RequestException as e:
-            print(f"[{entity_type}] API 요청 에러 발생: {e}")
-            if attempt < MAX_RETRIES - 1:
-                print(f"{RETRY_DELAY_SECONDS}초 후 재시도...")
-                time.sleep(RETRY_DELAY_SECONDS)
+            logger.warning("[%s] API 요청 에러 발생: %s", entity_type, e)
+            status_code = response.status_code if response is not None else None
+            # 429를 제외한 4xx는 재시도해도 결과가 같으므로 바로 실패 처리합니다.
+            is_retryable = status_code is None or status_code in RETRYABLE_STATUS_CODES
+            if is_retryable and not is_last_attempt:
+                delay = rate_limiter.backoff_delay(attempt)
+                metrics.MUSICBRAINZ_RETRIES.inc(reason="error")
+                logger.warning("%.1f초 후 재시도...", delay)
+                time.sleep(delay)
             else:
-                print(f"[{entity_type}] 최대 재시도 횟수 {MAX_RETRIES}회를 초과했습니다. 종료합니다.")
+                if is_retryable:
+                    logger.error("[%s] 최대 재시도 횟수 %s회를 초과했습니다. 종료합니다.", entity_type, MAX_RETRIES)
                 raise HTTPException(
                     status_code=503,
                     detail=f"MusicBrainz API 통신 중 에러 발생: {e}"
                 )
-        except json.JSONDecodeError as e:
-            print(f"[{entity_type}] JSON 디코딩 에러 발생: {e}")
-            if response:
-                print(f"응답 내용: {response.text[:500]}")
+        except ValueError as e: # JSONDecodeError, orjson.JSONDecodeError, ijson.JSONError
+            logger.error("[%s] JSON 디코딩 에러 발생: %s", entity_type, e)
+            if response is not None:
+                logger.error("응답 내용: %s", _raw_preview(response.content))
             raise HTTPException(
                 status_code=500,
                 detail=f"MusicBrainz API 응답 파싱 중 에러 발생: {e}"
             )
         except Exception as e:
-            print(f"[{entity_type}] 예상치 못한 에러 발생: {e}")
+            logger.exception("[%s] 예상치 못한 에러 발생: %s", entity_type, e)
             raise HTTPException(
                 status_code=500,
                 detail=f"MusicBrainz API 호출 중 예상치 못한 에러 발생: {e}"
             )
-        finally:
-            # API Rate Limit 준수 (성공 여부와 관계없이)
-            time.sleep(API_CALL_DELAY_SECONDS) 
             
-    if not response_data:
+    if response_data is None:
         raise HTTPException(
             status_code=500,
             detail=f"MusicBrainz API에서 {entity_type} 데이터를 가져오는 데 실패했습니다."
@@ -71,62 +303,186 @@ def search_artist(query: str) -> Optional[Dict[str, Any]]:
     """
     아티스트 이름으로 MusicBrainz에서 검색하고, 가장 일치하는 아티스트 정보를 반환합니다.
     """
-    print(f"[LOG][MusicBrainz] search_artist 호출: query='{query}'")
+    logger.debug("search_artist 호출: query='%s'", query)
     url = f"{BASE_URL}artist/?query={query}&fmt=json"
-    result = _make_api_call(url, entity_type="아티스트 검색")
+    result = _make_api_call(url, entity_type="아티스트 검색", cache_endpoint="musicbrainz:artist-search")
     
     if result and result.get('artists'):
         # 가장 일치도가 높은 첫 번째 아티스트 선택
         artist = result['artists'][0]
-        print(f"[LOG][MusicBrainz] search_artist 결과: {artist.get('name')} ({artist.get('id')})")
+        logger.debug("search_artist 결과: %s (%s)", artist.get('name'), artist.get('id'))
         return artist
-    print(f"[LOG][MusicBrainz] search_artist 결과 없음.")
+    logger.debug("search_artist 결과 없음.")
     return None
 
-def get_artist_by_mbid(mbid: str) -> Optional[Dict[str, Any]]:
+def get_artist_by_mbid(mbid: str, include_releases: bool = True,
+                       usage: Optional[FetchUsage] = None) -> Optional[Dict[str, Any]]:
     """
     아티스트의 MBID로 상세 정보와 함께 모든 릴리즈(앨범 등) 정보를 가져옵니다.
+    include_releases=False이면 릴리즈 목록 없이 기본 정보(이름 등)만 가져옵니다. (응답이 훨씬 작음)
     """
-    print(f"[LOG][MusicBrainz] get_artist_by_mbid 호출: mbid='{mbid}'")
+    logger.debug("get_artist_by_mbid 호출: mbid='%s', include_releases=%s", mbid, include_releases)
     # 'releases' 인자를 포함하여 해당 아티스트의 모든 릴리즈 정보를 함께 요청합니다.
-    url = f"{BASE_URL}artist/{mbid}?inc=releases&fmt=json"
-    result = _make_api_call(url, entity_type="아티스트 상세 정보")
+    inc = "inc=releases&" if include_releases else ""
+    url = f"{BASE_URL}artist/{mbid}?{inc}fmt=json"
+    result = _make_api_call(url, entity_type="아티스트 상세 정보", cache_endpoint="musicbrainz:artist", usage=usage)
     
     # 직접 API 호출 시 응답 자체가 artist 객체이므로, 'id' 존재 여부로 확인
     if result and result.get('id'):
-        print(f"[LOG][MusicBrainz] get_artist_by_mbid 성공: {result.get('name')}")
+        logger.debug("get_artist_by_mbid 성공: %s", result.get('name'))
         return result
-    print(f"[LOG][MusicBrainz] get_artist_by_mbid 실패 (ID 없음)")
+    logger.debug("get_artist_by_mbid 실패 (ID 없음)")
     return None
 
-def get_artist_recordings(artist_mbid: str, limit: int = 100, offset: int = 0) -> Optional[Dict[str, Any]]:
+def get_artist_recordings(artist_mbid: str, limit: int = 100, offset: int = 0,
+                          usage: Optional[FetchUsage] = None) -> RecordingPage:
     """
     아티스트의 모든 Recording(곡) 목록을 가져옵니다. (페이지네이션 지원)
+    Recording을 하나씩 파싱하며 반환하는 `RecordingPage`를 반환합니다. (한 번만 순회 가능)
     """
-    print(f"[LOG][MusicBrainz] get_artist_recordings 호출: mbid='{artist_mbid}', offset={offset}, limit={limit}")
+    logger.debug("get_artist_recordings 호출: mbid='%s', offset=%s, limit=%s", artist_mbid, offset, limit)
     # inc 파라미터에 필요한 정보를 모두 포함
     # artist-credits: 가창자 정보
     # artist-rels: 편곡, 프로듀서 등 아티스트 관계
     # work-rels: 작곡, 작사 등 작품(Work) 관계
     url = f"{BASE_URL}recording?artist={artist_mbid}&inc=artist-credits+work-rels+artist-rels&limit={limit}&offset={offset}&fmt=json"
     
-    result = _make_api_call(url, entity_type=f"아티스트 곡 목록 (Offset: {offset})")
-    
-    count = len(result.get('recordings', [])) if result else 0
-    print(f"[LOG][MusicBrainz] get_artist_recordings 반환: {count}곡")
-    return result
+    page = _fetch_body(url, f"아티스트 곡 목록 (Offset: {offset})", "musicbrainz:recording-browse", usage,
+                       parse=RecordingPage.from_body)
+    logger.debug("get_artist_recordings 반환: 전체 %s곡 중 offset %s부터", page.count, offset)
+    return page
+
+def get_artist_recording_ids(artist_mbid: str, limit: int = 100, offset: int = 0,
+                             usage: Optional[FetchUsage] = None) -> Optional[Dict[str, Any]]:
+    """
+    `get_artist_recordings`와 같은 페이지를 inc 없이 가져옵니다. (Recording MBID/제목만 포함, 응답이 훨씬 작음)
+    페이지의 곡이 이미 모두 저장되어 있는지 확인하는 용도입니다.
+    """
+    logger.debug("get_artist_recording_ids 호출: mbid='%s', offset=%s, limit=%s", artist_mbid, offset, limit)
+    url = f"{BASE_URL}recording?artist={artist_mbid}&limit={limit}&offset={offset}&fmt=json"
+    return _make_api_call(url, entity_type=f"아티스트 곡 MBID 목록 (Offset: {offset})", cache_endpoint="musicbrainz:recording-browse", usage=usage)
+
+
+class RecordingFetchPlanner:
+    """
+    아티스트 한 명의 Recording 페이지를 필요한 만큼만, 가장 적은 요청으로 가져옵니다.
+
+    - 페이지 크기를 아티스트당 곡 수 제한의 남은 곡 수에 맞춥니다. (제한이 50곡이면 100곡 대신 50곡만 요청)
+    - 응답의 `recording-count`로 끝을 알 수 있으면 마지막 빈 페이지 요청을 생략합니다.
+    - 이 아티스트의 곡이 DB에 이미 있으면 inc 없는 가벼운 요청으로 페이지의 MBID만 먼저 확인하고,
+      모두 저장된 페이지는 inc 포함 요청(artist-credits/work-rels/artist-rels)을 건너뜁니다.
+      (DB에 있는 곡을 모두 확인한 뒤부터는 확인 요청 없이 바로 가져옵니다.)
+
+    사용법:
+        planner = RecordingFetchPlanner(artist_mbid, song_limit, page_limit, known_song_count, find_known_mbids)
+        while (recordings := planner.next_page()) is not None:
+            ... 저장 ...
+            planner.record_imported(저장된 곡 수)
+        planner.report()
+    """
+    def __init__(self, artist_mbid: str, song_limit: int, page_limit: int, known_song_count: int = 0,
+                 find_known_mbids: Optional[Callable[[Set[str]], Set[str]]] = None):
+        self.artist_mbid = artist_mbid
+        self.song_limit = song_limit
+        self.page_limit = page_limit
+        self.find_known_mbids = find_known_mbids
+        self.unseen_known_songs = known_song_count if find_known_mbids else 0
+        self.usage = FetchUsage()
+        self.offset = 0
+        self.imported = 0
+        self.total: Optional[int] = None # recording-count (첫 응답 이후)
+        self.pages_fetched = 0
+        self.pages_skipped = 0
+        self.requests_saved = 0
+        self.bytes_saved = 0.0
+        # inc 포함 페이지의 곡당 평균 응답 크기 (건너뛴 페이지의 절약량 추정용, 이 아티스트의 응답으로 갱신)
+        self.bytes_per_recording = float(ESTIMATED_BYTES_PER_RECORDING)
+
+    def record_imported(self, count: int):
+        self.imported += count
+
+    def _page_limit(self) -> int:
+        return max(1, min(self.page_limit, self.song_limit - self.imported))
+
+    def _page_is_known(self, limit: int) -> Optional[bool]:
+        """가벼운 요청으로 페이지의 곡이 모두 저장되어 있는지 확인합니다. (페이지가 비어 있으면 None)"""
+        before = self.usage.bytes
+        response = get_artist_recording_ids(self.artist_mbid, limit=limit, offset=self.offset, usage=self.usage)
+        self.requests_saved -= 1
+        self.bytes_saved -= self.usage.bytes - before
+        if (response or {}).get("recording-count") is not None:
+            self.total = response["recording-count"]
+        mbids = {recording["id"] for recording in (response or {}).get("recordings", []) if recording.get("id")}
+        if not mbids:
+            return None
+        known = self.find_known_mbids(mbids)
+        self.unseen_known_songs -= len(known)
+        if len(known) < len(mbids):
+            return False
+        self.pages_skipped += 1
+        self.requests_saved += 1
+        self.bytes_saved += len(mbids) * self.bytes_per_recording
+        logger.info("이미 저장된 페이지 건너뜀: mbid='%s', offset=%s, %s곡", self.artist_mbid, self.offset, len(mbids))
+        return True
+
+    def next_page(self) -> Optional[RecordingPage]:
+        """다음으로 저장할 Recording 페이지를 반환합니다. 더 가져올 곡이 없으면 None."""
+        while self.imported < self.song_limit:
+            if self.total is not None and self.offset >= self.total:
+                self.requests_saved += 1 # 빈 페이지 요청 생략
+                return None
+            limit = self._page_limit()
+            if self.unseen_known_songs > 0:
+                known = self._page_is_known(limit)
+                if known is None:
+                    return None
+                if known:
+                    self.offset += limit
+                    continue
+
+            before = self.usage.bytes
+            page = get_artist_recordings(self.artist_mbid, limit=limit, offset=self.offset, usage=self.usage)
+            if not page:
+                return None
+            if page.count is not None:
+                self.total = page.count
+            self.pages_fetched += 1
+            # 페이지는 아직 파싱 전이므로 곡 수는 recording-count로 계산합니다.
+            page_size = min(limit, self.total - self.offset) if self.total is not None else limit
+            received = self.usage.bytes - before
+            if received and page_size > 0:
+                self.bytes_per_recording = received / page_size
+            if self.total is not None and limit < self.page_limit:
+                # 곡 수 제한에 맞춰 줄인 만큼 (기존에는 항상 page_limit 곡을 요청)
+                trimmed = min(self.page_limit, self.total - self.offset) - page_size
+                self.bytes_saved += max(0, trimmed) * self.bytes_per_recording
+            self.offset += limit
+            return page
+        return None
+
+    def report(self) -> Dict[str, Any]:
+        """아티스트 한 명의 요청/응답 크기와 기존 방식 대비 절약량(추정)을 반환합니다."""
+        return {
+            "artist_mbid": self.artist_mbid,
+            "requests": self.usage.requests,
+            "bytes": self.usage.bytes,
+            "pages_fetched": self.pages_fetched,
+            "pages_skipped": self.pages_skipped,
+            "requests_saved": self.requests_saved,
+            "bytes_saved": int(self.bytes_saved),
+        }
 
 def get_artist_image_from_relations(artist_mbid: str) -> Optional[str]:
     """
     아티스트의 관계(relations)에서 'image' 타입의 URL을 찾아 반환합니다.
     Wikimedia Commons URL을 우선적으로 찾습니다.
     """
-    print(f"[LOG][MusicBrainz] get_artist_image_from_relations 호출: mbid='{artist_mbid}'")
+    logger.debug("get_artist_image_from_relations 호출: mbid='%s'", artist_mbid)
     url = f"{BASE_URL}artist/{artist_mbid}?inc=url-rels&fmt=json"
-    result = _make_api_call(url, entity_type=f"아티스트 이미지 관계 (MBID: {artist_mbid})")
+    result = _make_api_call(url, entity_type=f"아티스트 이미지 관계 (MBID: {artist_mbid})", cache_endpoint="musicbrainz:artist")
     
     if not (result and result.get('relations')):
-        print(f"[LOG][MusicBrainz] 관계 데이터 없음.")
+        logger.debug("관계 데이터 없음.")
         return None
 
     image_url = None
@@ -136,12 +492,12 @@ def get_artist_image_from_relations(artist_mbid: str) -> Optional[str]:
             if target_url:
                 # 위키미디어 커먼스 URL을 우선적으로 선택
                 if 'commons.wikimedia.org' in target_url:
-                    print(f"[LOG][MusicBrainz] Wikimedia 이미지 찾음: {target_url}")
+                    logger.debug("Wikimedia 이미지 찾음: %s", target_url)
                     return target_url
                 if not image_url: # 다른 이미지 URL이 아직 없으면 일단 저장
                     image_url = target_url
     
-    print(f"[LOG][MusicBrainz] 이미지 URL 반환: {image_url}")
+    logger.debug("이미지 URL 반환: %s", image_url)
     return image_url
 
 
@@ -159,7 +515,7 @@ def get_release_details_by_mbid(mbid: str) -> Optional[Dict[str, Any]]:
     ]
     url = f"{BASE_URL}release/{mbid}?inc={'%2B'.join(includes_params)}&fmt=json"
     
-    result = _make_api_call(url, entity_type="릴리즈 상세 정보")
+    result = _make_api_call(url, entity_type="릴리즈 상세 정보", cache_endpoint="musicbrainz:release")
     
     if result and result.get('release'):
         return result['release']
@@ -176,7 +532,7 @@ def get_recording_details_by_mbid(mbid: str) -> Optional[Dict[str, Any]]:
     ]
     url = f"{BASE_URL}recording/{mbid}?inc={'%2B'.join(includes_params)}&fmt=json"
 
-    result = _make_api_call(url, entity_type="레코딩 상세 정보")
+    result = _make_api_call(url, entity_type="레코딩 상세 정보", cache_endpoint="musicbrainz:recording")
 
     if result and result.get('recording'):
         return result['recording']
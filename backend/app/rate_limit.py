@@ -0,0 +1,136 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    여러 스레드가 공유하는 토큰 버킷 Rate Limiter입니다.
+
+    `acquire()`는 토큰을 예약한 뒤 필요한 만큼만 기다립니다.
+    (응답을 받은 뒤 고정 시간만큼 쉬는 대신, 토큰이 생기는 즉시 다음 요청을 시작할 수 있습니다.)
+    예약 방식이므로 대기 중인 스레드들은 요청 순서대로 토큰을 받습니다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate # 초당 토큰 생성 수
+        self.capacity = capacity # 버스트 허용량
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._paused_seconds = 0.0 # pause()로 예약 시각이 뒤로 밀린 시간의 누적 합계
+        self.acquired_count = 0 # 지금까지 사용된 토큰(요청) 수 (진행률의 요청 속도 계산용)
+
+    def _refill(self, now: float):
+        # _updated_at이 미래인 경우(일시 정지 중)에는 토큰이 쌓이지 않습니다.
+        if now <= self._updated_at:
+            return
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _reserve(self, tokens: float, now: float) -> float:
+        """토큰을 예약하고, 예약한 토큰을 쓸 수 있을 때까지의 대기 시간(초)을 반환합니다. (락 안에서 호출)"""
+        self._refill(now)
+        self._tokens -= tokens
+        ready_at = self._updated_at + max(0.0, -self._tokens) / self.rate
+        return max(0.0, ready_at - now)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 하나 사용합니다. 실제로 대기한 시간(초)을 반환합니다.
+        기다리는 동안 `pause`가 호출되면, 깨어난 뒤 예약 시각이 밀린 만큼 더 기다립니다.
+        """
+        with self._lock:
+            wait_seconds = self._reserve(tokens, time.monotonic())
+            paused_seconds = self._paused_seconds
+            self.acquired_count += 1
+
+        waited = 0.0
+        while wait_seconds > 0:
+            time.sleep(wait_seconds)
+            waited += wait_seconds
+            with self._lock:
+                wait_seconds = self._paused_seconds - paused_seconds
+                paused_seconds = self._paused_seconds
+        return waited
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """`Retry-After` 헤더(초 단위 숫자 또는 HTTP-date)를 대기 시간(초)으로 변환합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    서버의 스로틀링 신호에 맞춰 속도를 조절하는 토큰 버킷입니다.
+
+    - 503/429 응답을 받으면 `Retry-After`(없으면 지수 백오프 + 지터)만큼 모든 호출을 멈추고,
+      토큰 생성 속도를 절반으로 줄입니다.
+    - 이후 성공 응답이 이어지면 속도를 조금씩 `max_rate`까지 되돌립니다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, min_rate: Optional[float] = None,
+                 backoff_base_seconds: float = 1.0, backoff_max_seconds: float = 60.0,
+                 recovery_step: float = 0.05):
+        super().__init__(rate, capacity)
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 8
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.recovery_step = recovery_step # 성공 1회당 회복되는 속도 비율 (max_rate 대비)
+        self.throttle_count = 0
+
+    def backoff_delay(self, attempt: int) -> float:
+        """재시도 횟수(0부터)에 따른 지수 백오프 + 지터 대기 시간(초)을 계산합니다."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** attempt))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def pause(self, seconds: float):
+        """
+        지정한 시간 동안 모든 호출자의 요청을 멈춥니다.
+        이미 예약된 토큰도 그만큼 뒤로 밀리며, `acquire`에서 대기 중인 스레드는 깨어난 뒤 이를 확인해 더 기다립니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            resume_at = now + seconds
+            if resume_at > self._updated_at:
+                # 정지 구간 동안에는 토큰이 쌓이지 않도록 기준 시각을 재개 시점으로 옮깁니다.
+                self._tokens = min(self._tokens, 0.0)
+                self._paused_seconds += resume_at - self._updated_at
+                self._updated_at = resume_at
+
+    def record_throttle(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """스로틀링 응답을 기록하고, 적용된 대기 시간(초)을 반환합니다."""
+        delay = retry_after if retry_after is not None else self.backoff_delay(attempt)
+        with self._lock:
+            self.throttle_count += 1
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+        self.pause(delay)
+        return delay
+
+    def record_success(self):
+        """성공 응답을 기록하여, 줄어든 속도를 점진적으로 회복합니다."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_step)
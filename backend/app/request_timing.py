@@ -0,0 +1,141 @@
+import contextvars
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from sqlalchemy import event
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# API 요청 계측 설정 (환경 변수)
+SLOW_REQUEST_SECONDS = float(os.getenv("SLOW_REQUEST_MS", "500")) / 1000 # 이보다 오래 걸린 요청은 SQL과 함께 경고 로그
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "0") == "1" # 응답에 Server-Timing 헤더 추가 (디버그용)
+SLOW_REQUEST_TOP_STATEMENTS = 5 # 느린 요청 로그에 남길 SQL 문 수
+STATEMENT_PREVIEW_CHARS = 300
+
+
+class RequestStats:
+    """요청 하나가 실행한 SQL 통계. 같은 SQL 문(바인드 파라미터 제외)끼리 묶어 횟수와 시간을 셉니다."""
+
+    __slots__ = ("query_count", "sql_seconds", "statements")
+
+    def __init__(self):
+        self.query_count = 0
+        self.sql_seconds = 0.0
+        self.statements: Dict[str, List[float]] = {} # SQL 문 → [실행 횟수, 합계 시간]
+
+    def record(self, statement: str, seconds: float):
+        self.query_count += 1
+        self.sql_seconds += seconds
+        entry = self.statements.get(statement)
+        if entry is None:
+            self.statements[statement] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def repeated_statement(self) -> Tuple[int, Optional[str]]:
+        """가장 많이 반복된 SQL 문과 횟수 (N+1 패턴이면 곡/인물 수만큼 반복됩니다)"""
+        if not self.statements:
+            return 0, None
+        statement, (count, _) = max(self.statements.items(), key=lambda item: item[1][0])
+        return int(count), statement
+
+    def slowest_statements(self, limit: int = SLOW_REQUEST_TOP_STATEMENTS) -> List[Dict[str, object]]:
+        ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        return [
+            {"sql": " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS], "count": int(count),
+             "ms": round(seconds * 1000, 2)}
+            for statement, (count, seconds) in ranked
+        ]
+
+
+# 현재 요청의 통계. 요청 밖(탐색 작업 스레드 등)에서 실행된 SQL은 None이므로 기록하지 않습니다.
+# (동기 엔드포인트는 스레드 풀에서 실행되지만 컨텍스트가 복사되어 같은 RequestStats 객체를 봅니다.)
+_current_stats: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar("request_stats", default=None)
+
+_QUERY_STARTED_KEY = "request_timing_query_started"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault(_QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = conn.info.get(_QUERY_STARTED_KEY)
+    if stats is not None and started:
+        stats.record(statement, time.perf_counter() - started.pop())
+
+
+def _handle_error(exception_context):
+    # 실패한 SQL은 after_cursor_execute가 호출되지 않으므로 시작 시각을 버립니다.
+    conn = exception_context.connection
+    started = conn.info.get(_QUERY_STARTED_KEY) if conn is not None else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(db_engine):
+    """엔진의 SQL 실행 시간을 현재 요청 통계에 더하도록 이벤트를 등록합니다."""
+    event.listen(db_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(db_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(db_engine, "handle_error", _handle_error)
+
+
+def _route_template(request: Request) -> str:
+    """지표 레이블용 경로: 매칭된 라우트의 템플릿 (`/songs/{song_id}`), 없으면 'unmatched' (레이블 수 폭증 방지)"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def install(app: FastAPI, *db_engines):
+    """
+    요청 계측 미들웨어를 등록합니다.
+    - 라우트별 응답 시간/SQL 수/SQL 시간 히스토그램 (`/metrics`)
+    - SLOW_REQUEST_MS보다 느린 요청은 가장 오래 걸린 SQL과 가장 많이 반복된 SQL을 경고 로그로 남김
+    - SERVER_TIMING_HEADER=1이면 `Server-Timing: app;dur=..., db;dur=...;desc="N queries"` 헤더 추가
+    StreamingResponse(내보내기)는 헤더를 보낼 때까지만 측정됩니다.
+    """
+    for db_engine in db_engines:
+        instrument_engine(db_engine)
+
+    @app.middleware("http")
+    async def request_timing(request: Request, call_next):
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            _current_stats.reset(token)
+        elapsed = time.perf_counter() - started
+
+        route = _route_template(request)
+        labels = {"method": request.method, "route": route}
+        metrics.HTTP_REQUEST_SECONDS.observe(elapsed, **labels)
+        metrics.HTTP_REQUEST_QUERIES.observe(stats.query_count, **labels)
+        metrics.HTTP_REQUEST_SQL_SECONDS.observe(stats.sql_seconds, **labels)
+        metrics.HTTP_REQUESTS.inc(status=response.status_code, **labels)
+
+        if elapsed >= SLOW_REQUEST_SECONDS:
+            repeated_count, repeated_sql = stats.repeated_statement()
+            slowest = stats.slowest_statements()
+            logger.warning(
+                "느린 요청: %s %s (%s) %.0fms, SQL %s회 %.0fms\n  최다 반복 SQL (%s회): %s\n  가장 오래 걸린 SQL: %s",
+                request.method, request.url.path, route, elapsed * 1000, stats.query_count, stats.sql_seconds * 1000,
+                repeated_count, " ".join((repeated_sql or "").split())[:STATEMENT_PREVIEW_CHARS],
+                "\n    ".join(f"{item['ms']}ms × {item['count']}회: {item['sql']}" for item in slowest),
+                extra={"route": route, "elapsed_ms": round(elapsed * 1000, 1), "query_count": stats.query_count,
+                       "sql_ms": round(stats.sql_seconds * 1000, 1), "slowest_sql": slowest},
+            )
+        if SERVER_TIMING_HEADER:
+            response.headers["Server-Timing"] = (
+                f"app;dur={elapsed * 1000:.1f}, db;dur={stats.sql_seconds * 1000:.1f};desc=\"{stats.query_count} queries\""
+            )
+        return response
@@ -0,0 +1,170 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+
+IN_QUERY_CHUNK_SIZE = 500
+
+# 역할 분류 (탐색 우선순위 가중치와 필터에 사용)
+CREATIVE = "creative" # 작곡/작사/프로듀싱: 여러 아티스트의 곡을 잇는 허브
+TECHNICAL = "technical" # 믹싱/마스터링/엔지니어
+PERFORMER = "performer" # 가창/연주 등
+
+# 표준 역할 이름은 MusicBrainz 관계 타입을 따릅니다. (목록에 없는 타입은 그대로 쓰고 PERFORMER로 분류)
+ROLE_CATEGORIES = {
+    "composer": CREATIVE, "lyricist": CREATIVE, "writer": CREATIVE, "librettist": CREATIVE,
+    "producer": CREATIVE, "arranger": CREATIVE, "orchestrator": CREATIVE,
+    "instrument arranger": CREATIVE, "vocal arranger": CREATIVE,
+    "mix": TECHNICAL, "mastering": TECHNICAL, "engineer": TECHNICAL, "audio": TECHNICAL,
+    "sound": TECHNICAL, "recording": TECHNICAL, "programming": TECHNICAL, "editor": TECHNICAL,
+}
+
+# 다른 출처/언어의 역할 이름 → (표준 역할, 추가 속성)
+ROLE_ALIASES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    # 수집기가 붙이는 한국어 역할 (MusicBrainz artist-credit, Genius 가져오기의 ROLE_MAP)
+    "가창": ("vocal", ()),
+    "피처링": ("vocal", ("guest",)),
+    "작곡": ("composer", ()),
+    "작사": ("lyricist", ()),
+    "편곡": ("arranger", ()),
+    "프로듀싱": ("producer", ()),
+    "믹싱 엔지니어": ("mix", ()),
+    "마스터링 엔지니어": ("mastering", ()),
+    "레코딩 엔지니어": ("recording", ()),
+    # Genius custom_performances 라벨
+    "mixing engineer": ("mix", ()),
+    "mastering engineer": ("mastering", ()),
+    "recording engineer": ("recording", ()),
+    "featuring": ("vocal", ("guest",)),
+    "featured artist": ("vocal", ("guest",)),
+    "vocals": ("vocal", ()),
+    "songwriter": ("writer", ()),
+}
+
+
+class ParsedRole(NamedTuple):
+    base_role: str
+    attributes: Tuple[str, ...] # 정렬된 속성 목록 (예: ('bass', 'guitar'))
+
+    @property
+    def name(self) -> str:
+        """표준 역할 이름 (roles.name). 예: 'instrument (bass, guitar)'"""
+        if not self.attributes:
+            return self.base_role
+        return f"{self.base_role} ({', '.join(self.attributes)})"
+
+    @property
+    def category(self) -> str:
+        return ROLE_CATEGORIES.get(self.base_role, PERFORMER)
+
+
+def parse_role(label: str) -> ParsedRole:
+    """
+    수집된 역할 문자열을 표준 역할과 속성으로 나눕니다.
+    예: 'Instrument (guitar, Bass)' → ('instrument', ('bass', 'guitar')), '작곡' → ('composer', ())
+    """
+    label = " ".join((label or "").split())
+    base, _, rest = label.partition(" (")
+    attributes = {attribute.strip().casefold() for attribute in rest.rstrip(")").split(",")} if rest else set()
+    base = base.strip().casefold()
+    if base in ROLE_ALIASES:
+        base, alias_attributes = ROLE_ALIASES[base]
+        attributes.update(alias_attributes)
+    attributes.discard("")
+    return ParsedRole(base, tuple(sorted(attributes)))
+
+
+def _role_row(parsed: ParsedRole) -> Dict[str, Optional[str]]:
+    return {
+        "name": parsed.name,
+        "base_role": parsed.base_role,
+        "attributes": ", ".join(parsed.attributes) or None,
+        "category": parsed.category,
+    }
+
+
+def get_role_ids(db: Session, labels: Iterable[str]) -> Dict[str, int]:
+    """
+    수집된 역할 문자열들을 표준 역할 ID로 바꿉니다. {역할 문자열: role_id} (커밋은 하지 않음)
+    출처가 달라도 같은 역할이면 같은 ID를 받습니다. ('작곡'과 'composer')
+    처음 보는 역할은 roles 테이블에 추가합니다. 역할 종류는 수백 개 수준이므로 페이지마다 `IN (...)`으로 다시 읽습니다.
+    (롤백된 ID를 캐시에 남기지 않기 위함)
+    """
+    parsed_by_label = {label: parse_role(label) for label in set(labels) if label}
+    if not parsed_by_label:
+        return {}
+    rows = {parsed.name: _role_row(parsed) for parsed in parsed_by_label.values()}
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    db.execute(
+        dialect.insert(models.Role.__table__).on_conflict_do_nothing(index_elements=["name"]),
+        list(rows.values()),
+    )
+    names = list(rows)
+    ids_by_name: Dict[str, int] = {}
+    for start in range(0, len(names), IN_QUERY_CHUNK_SIZE):
+        chunk = names[start:start + IN_QUERY_CHUNK_SIZE]
+        ids_by_name.update(db.query(models.Role.name, models.Role.id).filter(models.Role.name.in_(chunk)).all())
+    return {label: ids_by_name[parsed.name] for label, parsed in parsed_by_label.items()}
+
+
+def get_filter_role_ids(db: Session, labels: Iterable[str]) -> Set[int]:
+    """
+    역할 필터('composer', '작곡', 'instrument (guitar)' 등)와 일치하는 role_id 집합을 반환합니다. (roles.base_role 인덱스 사용)
+    속성을 지정하면 그 속성을 모두 가진 역할만, 지정하지 않으면 표준 역할의 모든 속성을 포함합니다.
+    """
+    wanted = [parse_role(label) for label in labels if label]
+    if not wanted:
+        return set()
+    rows = (
+        db.query(models.Role.id, models.Role.base_role, models.Role.attributes)
+        .filter(models.Role.base_role.in_({parsed.base_role for parsed in wanted}))
+        .all()
+    )
+    role_ids = set()
+    for role_id, base_role, attributes in rows:
+        role_attributes = set(attributes.split(", ")) if attributes else set()
+        if any(parsed.base_role == base_role and role_attributes.issuperset(parsed.attributes) for parsed in wanted):
+            role_ids.add(role_id)
+    return role_ids
+
+
+def get_role_names(db: Session) -> Dict[int, str]:
+    return dict(db.query(models.Role.id, models.Role.name).all())
+
+
+def canonicalize_roles(conn) -> int:
+    """
+    기존 roles 행을 표준 역할로 정리합니다. (마이그레이션용, 합쳐진 역할 수를 반환)
+    같은 표준 역할로 파싱되는 역할들은 하나로 합치고, 기여 관계의 role_id를 옮깁니다.
+    """
+    groups: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+    for role_id, name in conn.execute(text("SELECT id, name FROM roles ORDER BY id")).all():
+        groups[parse_role(name).name].append((role_id, name))
+
+    merged = 0
+    for canonical_name, members in groups.items():
+        # 이미 표준 이름을 가진 행이 있으면 그 ID를 유지합니다. (이름 UNIQUE 충돌 방지)
+        target_id = next((role_id for role_id, name in members if name == canonical_name), members[0][0])
+        for role_id, _ in members:
+            if role_id == target_id:
+                continue
+            conn.execute(text(
+                "INSERT INTO contributions (song_id, person_id, role_id) "
+                "SELECT c.song_id, c.person_id, :target FROM contributions AS c WHERE c.role_id = :source "
+                "AND NOT EXISTS (SELECT 1 FROM contributions AS t "
+                "                WHERE t.song_id = c.song_id AND t.person_id = c.person_id AND t.role_id = :target)"
+            ), {"target": target_id, "source": role_id})
+            conn.execute(text("DELETE FROM contributions WHERE role_id = :source"), {"source": role_id})
+            conn.execute(text("DELETE FROM roles WHERE id = :source"), {"source": role_id})
+            merged += 1
+        row = _role_row(parse_role(canonical_name))
+        conn.execute(
+            text("UPDATE roles SET name = :name, base_role = :base_role, attributes = :attributes, "
+                 "category = :category WHERE id = :id"),
+            dict(row, id=target_id),
+        )
+    return merged
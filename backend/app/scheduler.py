@@ -0,0 +1,116 @@
+from datetime import date
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from . import crud, models, roles
+
+DEFAULT_SCHEDULE_POLICY = "fifo"
+
+# 역할 분류별 가중치 (분류는 `roles.ROLE_CATEGORIES` 기준, 괄호 안 속성은 무시)
+CREATIVE_ROLE_WEIGHT = 3.0 # 작곡/작사/프로듀싱: 여러 아티스트의 곡을 잇는 허브
+TECHNICAL_ROLE_WEIGHT = 1.5 # 믹싱/마스터링/엔지니어
+PERFORMER_ROLE_WEIGHT = 1.0 # 가창/연주 등
+ROLE_CATEGORY_WEIGHTS = {
+    roles.CREATIVE: CREATIVE_ROLE_WEIGHT,
+    roles.TECHNICAL: TECHNICAL_ROLE_WEIGHT,
+    roles.PERFORMER: PERFORMER_ROLE_WEIGHT,
+}
+
+
+def role_weight(role: str) -> float:
+    """역할 문자열(예: 'instrument (guitar)', '작곡')의 가중치를 반환합니다."""
+    return ROLE_CATEGORY_WEIGHTS[roles.parse_role(role).category]
+
+
+class SchedulingPolicy:
+    """
+    탐색 큐(frontier)에 새로 발견된 아티스트의 우선순위를 정하는 정책의 기본 클래스입니다.
+    `score()`가 높은 아티스트부터 탐색하며, 점수가 같으면 발견된 순서(FIFO)를 따릅니다.
+    """
+    name = DEFAULT_SCHEDULE_POLICY
+    uses_stats = False # True이면 점수 계산 전에 DB에서 통계를 조회합니다.
+
+    def score(self, stats: Optional[Dict[str, Any]]) -> float:
+        """`crud.get_person_crawl_stats()`의 한 항목으로 점수를 계산합니다. (통계가 없으면 None)"""
+        return 0.0
+
+
+class DegreePolicy(SchedulingPolicy):
+    """이미 저장된 곡 중 해당 인물이 참여한 곡이 많을수록 먼저 탐색합니다."""
+    name = "degree"
+    uses_stats = True
+
+    def score(self, stats: Optional[Dict[str, Any]]) -> float:
+        return float(stats["song_count"]) if stats else 0.0
+
+
+class RolePolicy(SchedulingPolicy):
+    """작곡가/작사가/프로듀서를 연주자보다 먼저 탐색합니다. (참여 횟수 × 역할 가중치의 합)"""
+    name = "role"
+    uses_stats = True
+
+    def score(self, stats: Optional[Dict[str, Any]]) -> float:
+        if not stats:
+            return 0.0
+        return sum(role_weight(role) * count for role, count in stats["role_counts"].items())
+
+
+class RecencyPolicy(SchedulingPolicy):
+    """최근 발매곡에 참여한 인물을 먼저 탐색합니다. (가장 최근 발매일을 연 단위 소수로 환산)"""
+    name = "recency"
+    uses_stats = True
+
+    def score(self, stats: Optional[Dict[str, Any]]) -> float:
+        latest_release: Optional[date] = stats["latest_release"] if stats else None
+        if not latest_release:
+            return 0.0
+        return latest_release.year + (latest_release.timetuple().tm_yday - 1) / 366
+
+
+SCHEDULING_POLICIES = {
+    policy.name: policy for policy in (SchedulingPolicy, DegreePolicy, RolePolicy, RecencyPolicy)
+}
+
+
+def get_policy(name: Optional[str]) -> SchedulingPolicy:
+    policy_class = SCHEDULING_POLICIES.get(name or DEFAULT_SCHEDULE_POLICY)
+    if policy_class is None:
+        raise ValueError(f"알 수 없는 탐색 정책: {name} (사용 가능: {', '.join(SCHEDULING_POLICIES)})")
+    return policy_class()
+
+
+class CrawlScheduler:
+    """정책에 따라 frontier 항목의 우선순위를 계산하고, 탐색 범위(coverage) 지표를 제공합니다."""
+
+    def __init__(self, policy: Optional[str] = DEFAULT_SCHEDULE_POLICY):
+        self.policy = get_policy(policy)
+
+    def score_candidates(self, db: Session, mbids: Iterable[str]) -> Dict[str, float]:
+        """MBID별 우선순위를 계산합니다. 통계는 페이지당 한 번의 집계 쿼리로 조회합니다."""
+        mbids = {mbid for mbid in mbids if mbid}
+        if not mbids:
+            return {}
+        stats = crud.get_person_crawl_stats(db, mbids) if self.policy.uses_stats else {}
+        return {mbid: self.policy.score(stats.get(mbid)) for mbid in mbids}
+
+    def coverage(self, db: Session, frontier) -> Dict[str, Any]:
+        """현재까지의 탐색 범위 지표를 반환합니다."""
+        explored_artists = db.query(func.count(models.Person.id)).filter(models.Person.is_explored == True).scalar()
+        person_count = db.query(func.count(models.Person.id)).scalar()
+        song_count = db.query(func.count(models.Song.id)).scalar()
+        contribution_count = db.query(func.count()).select_from(models.Contribution).scalar()
+        discovered_artists = frontier.discovered_count()
+        return {
+            "policy": self.policy.name,
+            "explored_artists": explored_artists,
+            "pending_artists": len(frontier),
+            "discovered_artists": discovered_artists,
+            "explored_ratio": round(explored_artists / discovered_artists, 4) if discovered_artists else 0.0,
+            "persons": person_count,
+            "songs": song_count,
+            "contributions": contribution_count,
+            # 곡당 평균 참여 기록 수 (그래프 밀도의 대략적인 지표)
+            "contributions_per_song": round(contribution_count / song_count, 2) if song_count else 0.0,
+        }
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import date
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 
 # --- Base Schemas ---
@@ -118,6 +118,42 @@ class CollaborationResponse(BaseModel):
     collaborations: List[CollaborationDetail]
 
 
+# --- Schemas for Song Graph ---
+class SongGraphPerson(Person):
+    roles: List[str]
+
+class SongGraphResponse(BaseModel):
+    main: R_Song
+    related: List[SongGraphPerson]
+
+
+# --- Schemas for Graph Neighbourhood ---
+class GraphNode(BaseModel):
+    type: Literal["song", "person"]
+    id: int
+    mbid: Optional[str] = None
+    label: Optional[str] = None
+    hop: int # 루트로부터의 거리
+    image_url: Optional[str] = None
+    youtube_url: Optional[str] = None
+
+class GraphEdge(BaseModel):
+    song_id: int
+    person_id: int
+    roles: List[str]
+
+class GraphRoot(BaseModel):
+    type: Literal["song", "person"]
+    id: int
+    mbid: Optional[str] = None
+
+class GraphNeighbourhoodResponse(BaseModel):
+    root: GraphRoot
+    nodes: List[GraphNode]
+    edges: List[GraphEdge]
+    truncated: bool # 노드 수 상한(max_nodes)에 걸려 탐색이 중간에 멈췄는지 여부
+
+
 # --- Schemas for Crawled Data ---
 class ContributionData(BaseModel):
     person_name: str
@@ -134,11 +170,47 @@ class CrawledSongData(SongBase):
 class ArtistImportRequest(BaseModel):
     artist_name: str
     artist_mbid: Optional[str] = None # MBID 필드 추가
+    profile: bool = False # True면 이 가져오기를 샘플링 프로파일링하여 결과의 profile 항목으로 반환
 
 class ExplorationQueueRequest(BaseModel):
     initial_artist_name: Optional[str] = None
     initial_artist_mbid: Optional[str] = None
     max_data_gb: float = 0.05 # 기본 50MB
+    fetch_workers: int = 4 # 동시에 MusicBrainz 데이터를 수집할 워커 수
+    schedule_policy: Literal["fifo", "degree", "role", "recency"] = "fifo" # 탐색 순서 정책
+
+class MusicBrainzDumpImportRequest(BaseModel):
+    recording_path: str # recording 덤프 (recording.tar.xz 또는 JSON Lines, .gz/.bz2/.xz 가능)
+    work_path: Optional[str] = None # work 덤프 (작곡/작사 관계), 없으면 생략
+    artist_path: Optional[str] = None # artist 덤프 (seed_areas 사용 시 필요)
+    seed_artist_mbids: List[str] = []
+    seed_areas: List[str] = [] # 이 지역(area/begin-area 이름)의 아티스트를 시드로 추가 (예: "South Korea")
+    hops: int = 2 # 시드 아티스트에서 몇 단계의 협업 아티스트까지 가져올지
+
+# --- Schemas for Background Jobs ---
+class JobProgress(BaseModel):
+    artists_processed: int = 0
+    artists_in_progress: int = 0
+    songs_imported: int = 0
+    pages_written: int = 0
+    recordings_scanned: int = 0 # 덤프 가져오기에서 읽은 Recording 수
+    queue_length: int = 0
+    db_size_bytes: int = 0
+    requests: int = 0 # 작업 시작 후 MusicBrainz 요청 수
+    requests_per_second: float = 0.0
+
+class JobResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: Literal["pending", "running", "cancelling", "completed", "cancelled", "failed"]
+    params: dict
+    created_at: float # Unix 시각 (초)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    elapsed_seconds: float = 0.0
+    progress: JobProgress
+    result: Optional[dict] = None
+    error: Optional[str] = None
 
 # --- Schemas for Search ---
 class SearchResultItem(BaseModel):
@@ -0,0 +1,211 @@
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import DDL, bindparam, event, text
+from sqlalchemy.orm import Session
+
+from . import models
+
+logger = logging.getLogger(__name__)
+
+REBUILD_CHUNK_SIZE = 5000
+IN_QUERY_CHUNK_SIZE = 500
+
+# 한글 음절 → 초성 (호환 자모)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+CHOSEONG_PERIOD = 21 * 28 # 중성 21개 × 종성 28개
+CHOSEONG_QUERY = re.compile(rf"^[{CHOSEONG}\s]+$")
+# NFKC는 호환 자모(ㄱ, U+3131)를 첫소리 자모(U+1100)로 바꾸므로 다시 호환 자모로 되돌립니다.
+CONJOINING_TO_CHOSEONG = {0x1100 + i: choseong for i, choseong in enumerate(CHOSEONG)}
+TOKEN_SPLIT = re.compile(r"[^\w]+")
+
+# 종류별 FTS5 색인과 순위(연결 수) 테이블. 색인의 rowid는 persons.id / songs.id와 같습니다.
+PERSON = "person"
+SONG = "song"
+SEARCH_TABLES = {
+    PERSON: ("search_person", "search_person_rank"),
+    SONG: ("search_song", "search_song_rank"),
+}
+
+# `Base.metadata.create_all()`이 호출될 때 함께 생성됩니다. (SQLite 전용, 다른 DB는 기존 LIKE 검색 사용)
+for _fts_table, _rank_table in SEARCH_TABLES.values():
+    for _ddl in (
+        DDL(f"CREATE VIRTUAL TABLE IF NOT EXISTS {_fts_table} USING fts5("
+            "name, choseong, tokenize='unicode61 remove_diacritics 2', prefix='1 2 3')"),
+        DDL(f"CREATE TABLE IF NOT EXISTS {_rank_table} (id INTEGER PRIMARY KEY, degree INTEGER NOT NULL DEFAULT 0)"),
+    ):
+        event.listen(models.Base.metadata, "after_create", _ddl.execute_if(dialect="sqlite"))
+
+
+def normalize_text(value: str) -> str:
+    """검색용 정규화: NFKC(전각/분해된 한글 등 통일) + casefold"""
+    return unicodedata.normalize("NFKC", value or "").translate(CONJOINING_TO_CHOSEONG).casefold().strip()
+
+
+def to_choseong(value: str) -> str:
+    """한글 음절을 초성으로 바꿉니다. 한글이 아닌 문자는 제외합니다. 예: '아이유' → 'ㅇㅇㅇ'"""
+    initials = []
+    for char in normalize_text(value):
+        code = ord(char)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            initials.append(CHOSEONG[(code - HANGUL_SYLLABLE_START) // CHOSEONG_PERIOD])
+        elif char.isspace() and initials and initials[-1] != " ":
+            initials.append(" ")
+    return "".join(initials).strip()
+
+
+def is_enabled(db: Session) -> bool:
+    return db.bind.dialect.name == "sqlite"
+
+
+def _fts_query(column: str, query: str) -> Optional[str]:
+    """검색어의 각 토큰을 접두사 검색(AND)으로 바꿉니다. 예: 'new jeans' → {name}: ("new"* "jeans"*)"""
+    tokens = [token for token in TOKEN_SPLIT.split(query) if token]
+    if not tokens:
+        return None
+    terms = " ".join('"' + token.replace('"', '""') + '"*' for token in tokens)
+    return f"{{{column}}}: ({terms})"
+
+
+# --- 색인 갱신 ---
+
+def _insert_documents(db: Session, entity_type: str, labels: Dict[int, str]):
+    fts_table, _ = SEARCH_TABLES[entity_type]
+    rows = [
+        {"id": entity_id, "name": normalize_text(label), "choseong": to_choseong(label)}
+        for entity_id, label in labels.items() if label
+    ]
+    if rows:
+        db.execute(text(f"INSERT INTO {fts_table} (rowid, name, choseong) VALUES (:id, :name, :choseong)"), rows)
+
+
+def index_entities(db: Session, entity_type: str, labels: Dict[int, str],
+                   degree_deltas: Optional[Dict[int, int]] = None):
+    """
+    인물/곡을 검색 색인에 추가하고 연결 수(degree)를 갱신합니다. (커밋은 하지 않음)
+    labels: {id: 이름 또는 제목}, degree_deltas: {id: 연결 수 증가량}
+    이미 색인된 항목은 다시 추가하지 않습니다. (순위 테이블에 행이 있으면 색인된 것으로 봅니다.)
+    """
+    if not labels or not is_enabled(db):
+        return
+    _, rank_table = SEARCH_TABLES[entity_type]
+    ids = list(labels)
+    indexed: Set[int] = set()
+    for start in range(0, len(ids), IN_QUERY_CHUNK_SIZE):
+        chunk = ids[start:start + IN_QUERY_CHUNK_SIZE]
+        rows = db.execute(
+            text(f"SELECT id FROM {rank_table} WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)),
+            {"ids": chunk},
+        )
+        indexed.update(row[0] for row in rows)
+
+    _insert_documents(db, entity_type, {entity_id: label for entity_id, label in labels.items() if entity_id not in indexed})
+
+    degree_deltas = degree_deltas or {}
+    db.execute(
+        text(f"INSERT INTO {rank_table} (id, degree) VALUES (:id, :delta) "
+             "ON CONFLICT(id) DO UPDATE SET degree = degree + excluded.degree"),
+        [{"id": entity_id, "delta": degree_deltas.get(entity_id, 0)} for entity_id in ids],
+    )
+
+
+def record_new_contributions(db: Session, added_members: Dict[int, Set[int]],
+                             persons: Dict[int, str], songs: Dict[int, str]):
+    """
+    곡 저장 시 호출합니다. added_members: 곡별로 새로 추가된 참여 인물 ({song_id: {person_id}})
+    인물의 연결 수 = 참여 곡 수, 곡의 연결 수 = 참여 인물 수
+    """
+    person_deltas: Dict[int, int] = defaultdict(int)
+    for person_ids in added_members.values():
+        for person_id in person_ids:
+            person_deltas[person_id] += 1
+    index_entities(db, PERSON, persons, person_deltas)
+    index_entities(db, SONG, songs, {song_id: len(person_ids) for song_id, person_ids in added_members.items()})
+
+
+def rebuild_search_index(db: Session) -> int:
+    """persons/songs/contributions 전체로부터 검색 색인을 다시 만듭니다. 색인된 항목 수를 반환합니다."""
+    count = 0
+    for entity_type, model, label_column, degree_sql in (
+        (PERSON, models.Person, models.Person.name,
+         "SELECT person_id AS entity_id, COUNT(DISTINCT song_id) AS degree FROM contributions GROUP BY person_id"),
+        (SONG, models.Song, models.Song.title,
+         "SELECT song_id AS entity_id, COUNT(DISTINCT person_id) AS degree FROM contributions GROUP BY song_id"),
+    ):
+        fts_table, rank_table = SEARCH_TABLES[entity_type]
+        db.execute(text(f"DELETE FROM {fts_table}"))
+        db.execute(text(f"DELETE FROM {rank_table}"))
+        last_id = 0
+        while True:
+            rows = (
+                db.query(model.id, label_column)
+                .filter(model.id > last_id)
+                .order_by(model.id)
+                .limit(REBUILD_CHUNK_SIZE)
+                .all()
+            )
+            if not rows:
+                break
+            _insert_documents(db, entity_type, dict(rows))
+            count += len(rows)
+            last_id = rows[-1][0]
+        db.execute(text(f"INSERT INTO {rank_table} (id, degree) SELECT id, 0 FROM {model.__tablename__}"))
+        db.execute(text(
+            f"UPDATE {rank_table} SET degree = counts.degree "
+            f"FROM ({degree_sql}) AS counts WHERE {rank_table}.id = counts.entity_id"
+        ))
+    db.commit()
+    logger.info("검색 색인 재구성 완료: %s개 항목", count)
+    return count
+
+
+def ensure_search_index(db: Session):
+    """검색 색인이 비어 있는데 인물/곡 데이터가 있으면 (기존 DB) 한 번 채웁니다."""
+    if not is_enabled(db):
+        return
+    has_index = any(
+        db.execute(text(f"SELECT 1 FROM {rank_table} LIMIT 1")).first() is not None
+        for _, rank_table in SEARCH_TABLES.values()
+    )
+    has_data = (db.query(models.Person.id).first() or db.query(models.Song.id).first()) is not None
+    if has_data and not has_index:
+        logger.info("기존 데이터로 검색 색인을 생성합니다...")
+        rebuild_search_index(db)
+
+
+# --- 검색 ---
+
+def search(db: Session, query: str, entity_type: str, limit: int = 5) -> List[Tuple[int, int]]:
+    """
+    검색어와 일치하는 인물(entity_type='person') 또는 곡('song')을 순위대로 반환합니다. [(id, degree)]
+
+    - 토큰별 접두사 검색 ('방탄' → '방탄소년단', 'new jea' → 'New Jeans')
+    - 초성만 입력하면 초성 색인에서 검색 ('ㅇㅇㅇ' → '아이유')
+    - 순위: 이름 완전 일치 > 이름이 검색어로 시작 > 연결 수(참여 곡/인물 수) > 짧은 이름
+      일치하는 항목 전체를 SQL 안에서 이 순서로 정렬한 뒤 limit개만 가져오므로,
+      짧은 검색어에서도 연결 수가 많은 허브가 빠지지 않습니다. (SQLite는 ORDER BY + LIMIT을 상위 N개 정렬로 처리)
+    """
+    normalized = normalize_text(query)
+    compare_column = "choseong" if CHOSEONG_QUERY.match(normalized) else "name"
+    fts_query = _fts_query(compare_column, normalized)
+    if not fts_query:
+        return []
+
+    fts_table, rank_table = SEARCH_TABLES[entity_type]
+    rows = db.execute(
+        text(
+            f"SELECT f.rowid, COALESCE(r.degree, 0) AS degree FROM {fts_table} AS f "
+            f"LEFT JOIN {rank_table} AS r ON r.id = f.rowid "
+            f"WHERE {fts_table} MATCH :match "
+            f"ORDER BY f.{compare_column} = :query DESC, substr(f.{compare_column}, 1, :query_length) = :query DESC, "
+            f"degree DESC, length(f.{compare_column}) "
+            f"LIMIT :limit"
+        ),
+        {"match": fts_query, "query": normalized, "query_length": len(normalized), "limit": limit},
+    ).all()
+    return [(entity_id, degree) for entity_id, degree in rows]
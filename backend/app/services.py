@@ -1,47 +1,30 @@
-import requests
-import json
-import time
-import sys
-import os
+import logging
 import os
+import threading
 from datetime import date 
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List, Optional, Set
-
-from . import crud, models, schemas, musicbrainz_api, youtube_api
-from .database import SessionLocal # SessionLocal import
-
-# Queue 파일 관리
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-QUEUE_FILE = os.path.join(CURRENT_DIR, "..", "..", "logs", "exploration_queue.json")
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set
 
-def _load_queue() -> List[str]:
-    """큐 파일을 읽어 MBID 리스트를 반환합니다."""
-    print(f"[LOG][Service] _load_queue 호출됨: {QUEUE_FILE}")
-    if not os.path.exists(QUEUE_FILE):
-        print(f"[LOG][Service] 큐 파일이 존재하지 않음. 빈 리스트 반환.")
-        return []
-    with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
-        queue = json.load(f)
-        print(f"[LOG][Service] 큐 로드 완료. 항목 수: {len(queue)}")
-        return queue
+from . import crud, models, roles, schemas, musicbrainz_api, batch_writer, mb_dump, metrics
+from .database import ReadSessionLocal, SessionLocal, db_file_size_bytes # SessionLocal import
+from .identity_cache import PersonIdentityCache
+from .exploration_engine import EXPLORATION_FETCH_WORKERS, ExplorationEngine
+from .frontier import ExplorationFrontier
+from .scheduler import DEFAULT_SCHEDULE_POLICY, CrawlScheduler
 
-def _save_queue(queue: List[str]):
-    """MBID 리스트를 큐 파일에 저장합니다."""
-    print(f"[LOG][Service] _save_queue 호출됨. 항목 수: {len(queue)}")
-    with open(QUEUE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(queue, f, indent=2, ensure_ascii=False)
+logger = logging.getLogger(__name__)
 
-def _add_to_queue(mbid: str, current_queue: List[str], explored_mbids: Set[str]):
-    """큐에 새로운 MBID를 추가합니다. 이미 탐색되었거나 큐에 있으면 추가하지 않습니다."""
-    if mbid and mbid not in explored_mbids and mbid not in current_queue:
-        current_queue.append(mbid)
+ARTIST_SONG_LIMIT = 50 # 아티스트당 곡 수집 제한
+RECORDINGS_PAGE_LIMIT = 100 # MusicBrainz browse 요청 한 번에 가져올 Recording 수
+ARTIST_CREDIT_ROLE = "가창" # Artist Credit에 이름이 오른 인물의 역할
 
 class MusicDataService:
     def __init__(self):
         """서비스 초기화 시 YouTube 서비스 객체를 한 번만 생성합니다."""
         # 유튜브 수집 중단으로 인한 비활성화
         self.youtube_service = None # youtube_api.get_youtube_service()
+        # 탐색 실행 동안 유지되는 인물 Identity Map (아티스트/페이지 간 공유)
+        self.person_cache = PersonIdentityCache()
 
     def _parse_musicbrainz_recording_to_schema(self, recording_data: Dict[str, Any], artist_name_context: str = "Unknown") -> Optional[schemas.CrawledSongData]:
         """
@@ -63,7 +46,7 @@ class MusicDataService:
             except ValueError:
                 pass 
 
-        print(f"[LOG][Service]   곡 파싱 시작: Title='{song_title}', MBID='{song_mbid}'")
+        logger.debug("곡 파싱 시작: Title='%s', MBID='%s'", song_title, song_mbid)
 
         contributions: List[schemas.ContributionData] = []
         
@@ -74,7 +57,7 @@ class MusicDataService:
                 contributor = schemas.ContributionData(
                     person_name=artist_info.get('name'),
                     person_mbid=artist_info.get('id'),
-                    role="가창" 
+                    role=ARTIST_CREDIT_ROLE
                 )
                 contributions.append(contributor)
 
@@ -132,243 +115,235 @@ class MusicDataService:
             mbid=song_mbid,
             contributions=contributions
         )
-        print(f"[LOG][Service]   곡 파싱 완료: '{parsed_song.title}' (MBID: {parsed_song.mbid}, Contributions: {len(parsed_song.contributions)})")
+        logger.debug("곡 파싱 완료: '%s' (MBID: %s, Contributions: %s)", parsed_song.title, parsed_song.mbid, len(parsed_song.contributions))
         return parsed_song
 
-    def import_artist_by_mbid(self, artist_mbid: str,
-                              known_explored_mbids: Set[str], queue: List[str]) -> Dict[str, Any]:
+    def _parse_recordings_page(self, recordings: Iterable[Dict[str, Any]], artist_name: str) -> List[schemas.CrawledSongData]:
+        """
+        Recording 목록 한 페이지를 CrawledSongData 리스트로 변환합니다.
+        recordings는 `musicbrainz_api.RecordingPage`처럼 하나씩 파싱되는 iterable일 수 있으며, 한 번만 순회합니다.
+        """
+        parsed_songs = []
+        with metrics.timed(metrics.SCHEMA_PARSE):
+            for rec_data in recordings:
+                parsed_song = self._parse_musicbrainz_recording_to_schema(rec_data, artist_name_context=artist_name)
+                if parsed_song:
+                    parsed_songs.append(parsed_song)
+        return parsed_songs
+
+    def _fetch_artist_name(self, artist_mbid: str, usage: Optional[musicbrainz_api.FetchUsage] = None) -> str:
+        """아티스트 기본 정보를 가져와 이름을 반환합니다."""
+        # 이름만 필요하므로 릴리즈 목록(inc=releases) 없이 가볍게 조회합니다.
+        artist_info_raw = musicbrainz_api.get_artist_by_mbid(artist_mbid, include_releases=False, usage=usage)
+        artist_name = artist_info_raw.get('name', 'Unknown Artist') if artist_info_raw else "Unknown Artist"
+        logger.info("아티스트 이름 식별: %s", artist_name)
+        return artist_name
+
+    def _plan_artist_fetch(self, artist_mbid: str, song_limit: int = ARTIST_SONG_LIMIT,
+                           page_limit: int = RECORDINGS_PAGE_LIMIT) -> musicbrainz_api.RecordingFetchPlanner:
+        """아티스트의 Recording 요청 계획을 만듭니다. (DB에 이미 저장된 이 아티스트의 곡 수를 함께 전달)"""
+        def find_known_mbids(mbids: Set[str]) -> Set[str]:
+            # 페이지마다 새 세션으로 조회하여 다른 워커가 방금 저장한 곡도 반영합니다.
+            with ReadSessionLocal() as read_db:
+                return set(crud.get_song_ids_by_mbids(read_db, mbids))
+
+        with ReadSessionLocal() as read_db:
+            known_song_count = crud.count_songs_by_person_role(
+                read_db, artist_mbid, roles.parse_role(ARTIST_CREDIT_ROLE).name
+            )
+        return musicbrainz_api.RecordingFetchPlanner(
+            artist_mbid, song_limit, page_limit, known_song_count, find_known_mbids
+        )
+
+    def _log_fetch_report(self, report: Dict[str, Any]):
+        logger.info(
+            "요청 계획 결과 (MBID: %s): 요청 %s회, %s bytes, 건너뛴 페이지 %s개, 절약: 요청 %s회, 약 %s bytes",
+            report['artist_mbid'], report['requests'], report['bytes'], report['pages_skipped'],
+            report['requests_saved'], report['bytes_saved'], extra={"fetch": report},
+        )
+
+    def _mark_artist_explored(self, db: Session, artist_mbid: str):
+        """아티스트를 탐색 완료 상태로 표시합니다. (커밋은 호출하는 쪽에서 수행)"""
+        # 곡 저장 과정에서 인물이 생성되었을 수 있으므로 여기서 다시 조회합니다.
+        db_person = crud.get_person_by_mbid(db, mbid=artist_mbid)
+        if db_person:
+            crud.update_person_explored_status(db, db_person.id, True)
+
+    def import_artist_by_mbid(self, artist_mbid: str) -> Dict[str, Any]:
         """아티스트 MBID로 검색하여, 해당 아티스트의 모든 Recording(곡)을 DB에 저장합니다."""
         db = SessionLocal() # 새로운 세션 생성
         try:
-            print(f"[LOG][Service] import_artist_by_mbid 호출됨: artist_mbid={artist_mbid}")
+            logger.info("import_artist_by_mbid 호출됨: artist_mbid=%s", artist_mbid)
             
             # 0. 탐색 여부 확인
             existing_artist_person = crud.get_person_by_mbid(db, mbid=artist_mbid)
             if existing_artist_person and existing_artist_person.is_explored:
-                print(f"[LOG][Service] 아티스트 (MBID: {artist_mbid})는 이미 탐색되었습니다. 스킵.")
+                logger.info("아티스트 (MBID: %s)는 이미 탐색되었습니다. 스킵.", artist_mbid)
                 return {"message": "Already explored"}
 
             # 아티스트 기본 정보 가져오기 (이름 확인용)
-            artist_info_raw = musicbrainz_api.get_artist_by_mbid(artist_mbid) # 기존 함수 재사용 (releases inc 없이 호출하면 가벼움)
-            artist_name = artist_info_raw.get('name', 'Unknown Artist') if artist_info_raw else "Unknown Artist"
-            print(f"[LOG][Service] 아티스트 이름 식별: {artist_name}")
+            planner = self._plan_artist_fetch(artist_mbid)
+            artist_name = self._fetch_artist_name(artist_mbid, usage=planner.usage)
 
             imported_songs_count = 0
-            offset = 0
-            limit = 100
             
             while True:
-                print(f"[LOG][Service] Recording 목록 가져오기 (Offset: {offset}, Limit: {limit})...")
-                recordings_data = musicbrainz_api.get_artist_recordings(artist_mbid, limit=limit, offset=offset)
-                
-                if not recordings_data:
-                    print(f"[LOG][Service] 데이터를 가져오지 못했습니다. 루프 종료.")
-                    break
-                
-                recordings_list = recordings_data.get('recordings', [])
-                if not recordings_list:
-                    print(f"[LOG][Service] 더 이상 가져올 곡이 없습니다. (총 {imported_songs_count}곡 처리됨)")
+                logger.debug("Recording 목록 가져오기 (Offset: %s)...", planner.offset)
+                recordings = planner.next_page()
+                if not recordings:
+                    logger.info("더 이상 가져올 곡이 없습니다. (총 %s곡 처리됨)", imported_songs_count)
                     break
                     
-                print(f"[LOG][Service]   {len(recordings_list)}개의 곡 데이터 수신.")
-                
-                for rec_data in recordings_list:
-                    parsed_song = self._parse_musicbrainz_recording_to_schema(rec_data, artist_name_context=artist_name)
-                    
-                    if not parsed_song: 
-                        continue
+                parsed_songs = self._parse_recordings_page(recordings, artist_name)
+                logger.debug("%s개의 곡 데이터 수신.", len(parsed_songs))
 
-                    # --- DB 저장 로직 (기존 import_release와 유사하지만 단일 곡 처리) ---
-                    # 중복 확인
-                    existing_song = crud.get_song_by_mbid(db, mbid=parsed_song.mbid)
-                    if existing_song:
-                        # 이미 있으면 건너뜀 (또는 업데이트? 일단은 스킵)
-                        continue
-                    
-                    db_song = models.Song(
-                        title=parsed_song.title,
-                        artist=parsed_song.artist, # Main Artist Context
-                        album=parsed_song.album,
-                        release_date=parsed_song.release_date,
-                        source_url=parsed_song.source_url,
-                        youtube_url=parsed_song.youtube_url,
-                        mbid=parsed_song.mbid
-                    )
-                    
-                    for contribution in parsed_song.contributions:
-                        # 인물 처리
-                        db_person = None
-                        if contribution.person_mbid:
-                            db_person = crud.get_person_by_mbid(db, mbid=contribution.person_mbid)
-                        
-                        if not db_person:
-                            db_person = crud.get_person_by_name(db, name=contribution.person_name)
-                            
-                        if not db_person:
-                            # --- 이미지 URL 검색 로직 (일시 중단: API 과부하 방지) ---
-                            # 추후 별도 스크립트로 일괄 업데이트 예정
-                            image_url = None
-                            # if contribution.person_mbid:
-                            #     try:
-                            #         print(f"[LOG][Service]   인물 이미지 검색 (MBID: {contribution.person_mbid})")
-                            #         image_url = musicbrainz_api.get_artist_image_from_relations(contribution.person_mbid)
-                            #         if image_url:
-                            #             print(f"[LOG][Service]   이미지 찾음: {image_url}")
-                            #     except Exception as e:
-                            #         print(f"[LOG][Service]   이미지 검색 중 오류 발생: {e}")
-                            # --------------------------------
+                # 페이지 단위 일괄 저장 (기존 곡 확인, 인물/곡/기여 관계 INSERT, 커밋 1회)
+                page_result = batch_writer.write_song_page(db, parsed_songs, self.person_cache)
 
-                            new_person_schema = schemas.PersonCreate(
-                                name=contribution.person_name,
-                                mbid=contribution.person_mbid,
-                                image_url=image_url
-                                )
-                            db_person = crud.create_person(db, person=new_person_schema)
-                                            
-                        if db_person:
-                            # 큐 추가 (새로운 인물이거나, 기존 인물이지만 탐색 안 된 경우)
-                            if db_person.mbid:
-                                _add_to_queue(db_person.mbid, queue, known_explored_mbids)
-
-                            # 기여 관계 생성
-                            db_contribution = models.Contribution(song=db_song, person=db_person, role=contribution.role)
-                            db.add(db_contribution) # Add contribution to the session
-                    
-                    crud.create_song(db, song=db_song) # Use crud function to add song to session
-                    
-                    # 곡 단위 커밋 (중간 저장)
-                    try:
-                        db.commit()
-                        # print(f"[LOG][Service]   곡 '{db_song.title}' 저장 완료.") # 너무 빈번하면 주석 처리
-                    except Exception as e:
-                        print(f"[LOG][Service]   곡 '{db_song.title}' 저장 중 DB 오류: {e}")
-                        db.rollback()
-
-                    imported_songs_count += 1
+                imported_songs_count += page_result["imported_song_count"]
+                planner.record_imported(page_result["imported_song_count"])
+                if page_result["failed_song_mbids"]:
+                    logger.warning("저장 실패 곡 %s개: %s", len(page_result['failed_song_mbids']), page_result['failed_song_mbids'])
                 
-                print(f"[LOG][Service]   현재까지 {imported_songs_count}곡 처리됨. 다음 페이지로 이동.")
+                logger.debug("현재까지 %s곡 처리됨. 다음 페이지로 이동.", imported_songs_count)
                 
                 # 아티스트당 곡 수집 제한 (50곡)
-                if imported_songs_count >= 50:
-                    print(f"Artist song limit reached ({imported_songs_count} songs). Moving to next artist.")
+                if imported_songs_count >= ARTIST_SONG_LIMIT:
+                    logger.info("Artist song limit reached (%s songs). Moving to next artist.", imported_songs_count)
                     break
-                
-                offset += limit
+            fetch_report = planner.report()
+            self._log_fetch_report(fetch_report)
             # 아티스트 탐색 완료 처리
-            if existing_artist_person:
-                crud.update_person_explored_status(db, existing_artist_person.id, True)
-            else: 
-                # 만약 위에서 create_person으로 생성되었다면 여기서 다시 가져와서 업데이트
-                db_person = crud.get_person_by_mbid(db, mbid=artist_mbid)
-                if db_person:
-                    crud.update_person_explored_status(db, db_person.id, True)
+            self._mark_artist_explored(db, artist_mbid)
+
+            db.commit() # 곡은 페이지마다 이미 커밋되었고, 여기서는 탐색 완료 표시만 커밋
+            metrics.ARTISTS_EXPLORED.inc()
 
-            print(f"[LOG][Service] DB 커밋 시도 중... (Song Count: {imported_songs_count})")
-            db.commit() # 모든 변경 사항을 한 번에 커밋
-            print(f"[LOG][Service] DB 커밋 성공!")
-            
-            known_explored_mbids.add(artist_mbid)
-            
             return {
                 "artist_name": artist_name,
                 "artist_mbid": artist_mbid,
-                "imported_song_count": imported_songs_count
+                "imported_song_count": imported_songs_count,
+                "fetch": fetch_report,
             }
         except Exception as e:
-            print(f"[LOG][Service] 오류 발생으로 인한 DB 롤백: {e}")
+            logger.error("오류 발생으로 인한 DB 롤백: %s", e)
             db.rollback() # 에러 발생 시 롤백
             raise e
         finally:
-            print(f"[LOG][Service] 세션 종료 (db.close())")
+            logger.debug("세션 종료 (db.close())")
             db.close() # 세션 닫기
 
+    def import_musicbrainz_dump(self, recording_path: str, work_path: Optional[str] = None,
+                                artist_path: Optional[str] = None, seed_artist_mbids: Optional[List[str]] = None,
+                                seed_areas: Optional[List[str]] = None, hops: int = mb_dump.DUMP_DEFAULT_HOPS,
+                                cancel_event: Optional[threading.Event] = None,
+                                on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        MusicBrainz JSON 덤프에서 시드 아티스트 주변의 곡을 API 호출 없이 일괄 저장합니다. (`mb_dump.DumpImporter` 참고)
+        """
+        logger.info("import_musicbrainz_dump 호출됨: recording_path=%s, work_path=%s, hops=%s", recording_path, work_path, hops)
+        for path in (recording_path, work_path, artist_path):
+            if path and not os.path.exists(path):
+                return {"status": "failed", "message": f"덤프 파일을 찾을 수 없습니다: {path}"}
+        if seed_areas and not artist_path:
+            return {"status": "failed", "message": "seed_areas를 사용하려면 artist_path가 필요합니다."}
+        importer = mb_dump.DumpImporter(
+            self, recording_path, work_path=work_path, artist_path=artist_path,
+            seed_artist_mbids=seed_artist_mbids or [], seed_areas=seed_areas or [], hops=hops,
+            cancel_event=cancel_event, on_progress=on_progress,
+        )
+        return importer.run()
+
     def run_exploration_queue(self, initial_artist_name: str = None,
-                              initial_artist_mbid: str = None, max_data_gb: float = 0.05): # 50MB로 조정
+                              initial_artist_mbid: str = None, max_data_gb: float = 0.05, # 50MB로 조정
+                              fetch_workers: int = EXPLORATION_FETCH_WORKERS,
+                              schedule_policy: str = DEFAULT_SCHEDULE_POLICY,
+                              cancel_event: Optional[threading.Event] = None,
+                              on_progress: Optional[Callable[[Dict[str, Any]], None]] = None):
         """
         큐 파일에서 MBID를 가져와 아티스트 데이터를 탐색하고 DB에 저장합니다.
         max_data_gb: 목표 데이터베이스 크기 (GB)
+        fetch_workers: 동시에 MusicBrainz 데이터를 수집할 워커 수
+        schedule_policy: 탐색 순서 정책 (fifo, degree, role, recency)
+        cancel_event: 설정되면 진행 중인 페이지까지만 저장하고 탐색을 멈춥니다. (백그라운드 작업 취소)
+        on_progress: 진행 상황 dict를 받는 콜백 (`ExplorationEngine.progress()` 참고)
         """
         db = SessionLocal() # 새로운 세션 생성 (초기 아티스트 검색용)
+        frontier = None
         try:
-            print(f"[LOG][Service] run_exploration_queue 호출됨.")
-            print(f"[LOG][Service] 초기 요청 파라미터: initial_artist_name={initial_artist_name}, initial_artist_mbid={initial_artist_mbid}, max_data_gb={max_data_gb}")
+            logger.info("run_exploration_queue 호출됨.")
+            logger.info(
+                "초기 요청 파라미터: initial_artist_name=%s, initial_artist_mbid=%s, max_data_gb=%s",
+                initial_artist_name, initial_artist_mbid, max_data_gb,
+            )
             
+            try:
+                scheduler = CrawlScheduler(schedule_policy)
+            except ValueError as e:
+                logger.error("오류: %s", e)
+                return {"status": "failed", "message": str(e)}
+            logger.info("탐색 정책: %s", scheduler.policy.name)
+
             target_db_size_bytes = max_data_gb * (1024 ** 3)
-            print(f"[LOG][Service] 목표 DB 크기 (bytes): {target_db_size_bytes}")
+            logger.info("목표 DB 크기 (bytes): %s", target_db_size_bytes)
             
-            queue = _load_queue()
-            print(f"[LOG][Service] 초기 큐 로드: {len(queue)}개 항목")
+            # 탐색 큐 (SQLite 기반 frontier, 이전 exploration_queue.json이 있으면 자동으로 가져옴)
+            frontier = ExplorationFrontier()
+            logger.info("초기 큐 로드: %s개 항목", len(frontier))
 
             # 이미 탐색된 아티스트 MBID를 DB에서 미리 로드 (중복 탐색 방지)
-            explored_persons = db.query(models.Person).filter(models.Person.is_explored == True).all()
-            known_explored_mbids: Set[str] = {p.mbid for p in explored_persons if p.mbid}
-            print(f"[LOG][Service] 이미 탐색된 아티스트: {len(known_explored_mbids)}명 (MBIDs: {known_explored_mbids})")
+            explored_mbid_rows = db.query(models.Person.mbid).filter(models.Person.is_explored == True, models.Person.mbid.isnot(None)).all()
+            known_explored_mbids: Set[str] = {mbid for (mbid,) in explored_mbid_rows}
+            logger.info("이미 탐색된 아티스트: %s명", len(known_explored_mbids))
 
-            # 큐 정제: 이미 탐색된 MBID 제거
-            initial_queue_len = len(queue)
-            # 순서 보장을 위해 list comprehension 사용하되, 중복 제거는 set 활용하여 O(1) 조회
-            queue = [mbid for mbid in queue if mbid not in known_explored_mbids]
-            cleaned_queue_len = len(queue)
-
-            if initial_queue_len != cleaned_queue_len:
-                print(f"[LOG][Service] 큐 정제: 이미 탐색된 {initial_queue_len - cleaned_queue_len}개 항목 제거됨. (남은 큐: {cleaned_queue_len})")
-                _save_queue(queue)
+            # 큐 정제: 이미 탐색된 MBID를 완료 상태로 표시 (다시 추가되지 않음)
+            initial_queue_len = len(frontier)
+            frontier.mark_done_many(known_explored_mbids)
+            if initial_queue_len != len(frontier):
+                logger.info("큐 정제: 이미 탐색된 %s개 항목 제거됨. (남은 큐: %s)", initial_queue_len - len(frontier), len(frontier))
             else:
-                print(f"[LOG][Service] 큐 정제 완료: 중복 항목 없음.")
+                logger.info("큐 정제 완료: 중복 항목 없음.")
 
             # 초기 아티스트 추가
             if initial_artist_name and not initial_artist_mbid:
-                print(f"[LOG][Service] 초기 아티스트 '{initial_artist_name}' MBID 검색 중...")
+                logger.info("초기 아티스트 '%s' MBID 검색 중...", initial_artist_name)
                 search_result_artist = musicbrainz_api.search_artist(initial_artist_name)
                 if search_result_artist:
                     initial_artist_mbid = search_result_artist['id']
-                    print(f"[LOG][Service] '{initial_artist_name}'의 MBID: {initial_artist_mbid} 발견.")
+                    logger.info("'%s'의 MBID: %s 발견.", initial_artist_name, initial_artist_mbid)
                 else:
-                    print(f"[LOG][Service] 오류: 초기 아티스트 '{initial_artist_name}'를 MusicBrainz에서 찾을 수 없습니다.")
+                    logger.error("오류: 초기 아티스트 '%s'를 MusicBrainz에서 찾을 수 없습니다.", initial_artist_name)
                     return {"status": "failed", "message": "초기 아티티스트를 찾을 수 없습니다."}
             
-            if initial_artist_mbid:
-                _add_to_queue(initial_artist_mbid, queue, known_explored_mbids)
-                _save_queue(queue) # 초기 큐 저장
-                print(f"[LOG][Service] 큐에 초기 아티스트 '{initial_artist_mbid}' 추가됨. 현재 큐 크기: {len(queue)}")
-            
-            from fastapi import HTTPException
+            if initial_artist_mbid and initial_artist_mbid not in known_explored_mbids:
+                frontier.requeue(initial_artist_mbid)
+                logger.info("큐에 초기 아티스트 '%s' 추가됨. 현재 큐 크기: %s", initial_artist_mbid, len(frontier))
             
-            results = []
-            while queue:
-                current_db_size = os.path.getsize(db.bind.url.database) if os.path.exists(db.bind.url.database) else 0
-                print(f"[LOG][Service] 현재 DB 크기: {current_db_size} bytes. 목표: {target_db_size_bytes} bytes.")
-                if current_db_size >= target_db_size_bytes:
-                    print(f"[LOG][Service] 목표 DB 크기({max_data_gb}GB)에 도달했습니다. 탐색을 종료합니다.")
-                    break
-
-                artist_mbid_to_explore = queue.pop(0) # 큐에서 하나 꺼내기
-                _save_queue(queue) # 큐 파일 업데이트
-                print(f"[LOG][Service] 큐에서 '{artist_mbid_to_explore}' 꺼냄. 남은 큐 크기: {len(queue)}")
-
-                if artist_mbid_to_explore in known_explored_mbids:
-                    print(f"[LOG][Service] 아티스트 (MBID: {artist_mbid_to_explore})는 이미 탐색되었습니다. 건너뜀.")
-                    continue
-                
-                print(f"\n--- 아티스트 (MBID: {artist_mbid_to_explore}) 탐색 시작 ---")
-                try:
-                    result = self.import_artist_by_mbid(artist_mbid_to_explore, known_explored_mbids, queue) # db 인자 제거
-                    results.append(result)
-                    print(f"[LOG][Service] 아티스트 (MBID: {artist_mbid_to_explore}) 탐색 완료. 큐 크기: {len(queue)}")
-                    
-                except HTTPException as e:
-                    print(f"[LOG][Service] API 호출 오류로 아티스트 (MBID: {artist_mbid_to_explore}) 탐색 실패: {e.detail}")
-                except Exception as e:
-                    import traceback
-                    traceback.print_exc()
-                    print(f"[LOG][Service] 예상치 못한 오류로 아티스트 (MBID: {artist_mbid_to_explore}) 탐색 실패: {e}")
-                
-                _save_queue(queue) # 매 탐색 후 큐 파일 저장 (진행 상황 저장)
+            # 수집(병렬 워커) / 저장(단일 writer) 파이프라인으로 탐색
+            engine = ExplorationEngine(
+                self, frontier, known_explored_mbids,
+                db_path=db.bind.url.database,
+                target_db_size_bytes=target_db_size_bytes,
+                artist_song_limit=ARTIST_SONG_LIMIT,
+                page_limit=RECORDINGS_PAGE_LIMIT,
+                fetch_workers=fetch_workers,
+                scheduler=scheduler,
+                cancel_event=cancel_event,
+                on_progress=on_progress,
+            )
+            results = engine.run()
             
-            print(f"\n[LOG][Service] 데이터 탐색 완료! 최종 큐 크기: {len(queue)}")
-            final_db_size_gb = (os.path.getsize(db.bind.url.database) / (1024 ** 3)) if os.path.exists(db.bind.url.database) else 0
-            return {"status": "completed", "final_db_size_gb": f"{final_db_size_gb:.2f} GB", "processed_artists_count": len(results)}
+            logger.info("데이터 탐색 완료! 최종 큐 크기: %s", len(frontier))
+            coverage = scheduler.coverage(db, frontier)
+            logger.info("탐색 범위: %s", coverage)
+            final_db_size_gb = db_file_size_bytes(db.bind.url.database) / (1024 ** 3)
+            status = "cancelled" if engine.cancel_event.is_set() else "completed"
+            fetch_savings = engine.fetch_savings()
+            logger.info("요청 절약 (추정): %s", fetch_savings)
+            return {"status": status, "final_db_size_gb": f"{final_db_size_gb:.2f} GB", "processed_artists_count": len(results), "coverage": coverage, "fetch": fetch_savings}
         finally:
+            if frontier is not None:
+                frontier.close()
             db.close() # 초기 세션 닫기
 
 musicdata_service = MusicDataService()
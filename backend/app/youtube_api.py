@@ -1,7 +1,10 @@
+import logging
 import os
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
+logger = logging.getLogger(__name__)
+
 # 전역 변수로 서비스 객체를 캐싱합니다.
 _youtube_service = None
 
@@ -36,9 +39,9 @@ def search_youtube_video(youtube_service, query, max_results=1):
     """
     주어진 쿼리로 YouTube를 검색하고 첫 번째 비디오의 링크를 반환합니다.
     """
-    print(f"[LOG][YouTube] search_youtube_video 호출: query='{query}'")
+    logger.debug("search_youtube_video 호출: query='%s'", query)
     if not youtube_service:
-        print(f"[LOG][YouTube] 서비스 객체 없음.")
+        logger.debug("YouTube 서비스 객체 없음.")
         return None
         
     search_response = youtube_service.search().list(
@@ -51,13 +54,13 @@ def search_youtube_video(youtube_service, query, max_results=1):
     videos = search_response.get('items', [])
     
     if not videos:
-        print(f"[LOG][YouTube] 검색 결과 없음.")
+        logger.debug("YouTube 검색 결과 없음.")
         return None
         
     # 첫 번째 비디오의 ID를 사용하여 링크 생성
     video_id = videos[0]['id']['videoId']
     link = f"https://www.youtube.com/watch?v={video_id}"
-    print(f"[LOG][YouTube] 링크 반환: {link}")
+    logger.debug("YouTube 링크 반환: %s", link)
     return link
 
 if __name__ == '__main__':
@@ -1,9 +1,12 @@
+import logging
 import requests
 import re
 import time
 import random
 from urllib.parse import quote_plus
 
+logger = logging.getLogger(__name__)
+
 def search_youtube_video_crawler(query: str) -> str | None:
     """
     YouTube 검색 페이지를 크롤링하여 첫 번째 동영상의 링크를 반환합니다.
@@ -37,7 +40,7 @@ def search_youtube_video_crawler(query: str) -> str | None:
         return None
 
     except Exception as e:
-        print(f"[LOG][YouTubeCrawler] 크롤링 중 오류 발생: {e}")
+        logger.warning("YouTube 검색 페이지 크롤링 중 오류 발생: %s", e)
         return None
 
 if __name__ == "__main__":
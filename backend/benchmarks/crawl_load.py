@@ -0,0 +1,119 @@
+"""
+가짜 MusicBrainz 서버를 상대로 한 탐색 부하 테스트 (네트워크 없이 재현 가능).
+
+`benchmarks.fake_musicbrainz` 서버를 같은 프로세스에서 띄우고 `musicbrainz_api.BASE_URL`을 연결한 뒤,
+`run_exploration_queue`를 시드 아티스트 이름 검색부터 실행합니다. 목표 아티스트 수를 처리하면 작업을 취소합니다.
+서버 쪽 지연/오류율/503 스로틀링과 클라이언트 쪽 요청 속도/워커 수를 바꿔 가며
+동시 수집, 재시도, Rate Limiter의 감속/회복이 끝까지 어떻게 동작하는지 확인합니다.
+임시 디렉토리의 새 DB와 탐색 큐를 사용하므로 기존 데이터는 건드리지 않습니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.crawl_load [--artists 50] [--workers 4] [--client-rps 20] [--latency-ms 50]
+        [--error-rate 0.02] [--throttle-rps 10] [--output 결과.json]
+"""
+import argparse
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# 기본 DB 경로(./kpop.db)가 임시 디렉토리를 가리키도록 app을 가져오기 전에 이동합니다.
+WORK_DIR = tempfile.mkdtemp()
+os.chdir(WORK_DIR)
+os.environ.setdefault("HTTP_CACHE_ENABLED", "0") # 가짜 응답을 실제 응답 캐시에 남기지 않음
+os.environ.setdefault("LOG_LEVEL", "ERROR") # 재시도 경고까지 보려면 LOG_LEVEL=WARNING
+
+from app import logging_config, metrics, migrations, models, musicbrainz_api, services  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.exploration_engine import EXPLORATION_FETCH_WORKERS  # noqa: E402
+from app.frontier import ExplorationFrontier  # noqa: E402
+from app.rate_limit import AdaptiveRateLimiter  # noqa: E402
+from benchmarks.fake_musicbrainz import FakeMusicBrainzServer, add_fault_arguments, fault_config  # noqa: E402
+from benchmarks.synthetic_graph import GraphShape, person_name  # noqa: E402
+
+DEFAULT_ARTISTS = 30
+DEFAULT_CLIENT_RPS = 20.0
+RETRY_BACKOFF_BASE_SECONDS = 0.2 # 오류 재시도 지수 백오프의 기본 대기 (실제 설정은 2초)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 MusicBrainz 서버 상대 탐색 부하 테스트")
+    parser.add_argument("--artists", type=int, default=DEFAULT_ARTISTS, help="처리하면 멈출 아티스트 수")
+    parser.add_argument("--workers", type=int, default=EXPLORATION_FETCH_WORKERS, help="수집 워커 수")
+    parser.add_argument("--client-rps", type=float, default=DEFAULT_CLIENT_RPS, help="클라이언트 Rate Limiter 속도")
+    parser.add_argument("--policy", default=services.DEFAULT_SCHEDULE_POLICY, help="탐색 순서 정책")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    musicbrainz_api.response_cache = None
+    musicbrainz_api.rate_limiter = AdaptiveRateLimiter(
+        rate=args.client_rps, capacity=1, backoff_base_seconds=RETRY_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds=musicbrainz_api.MAX_RETRY_DELAY_SECONDS,
+    )
+    services.ExplorationFrontier = functools.partial(
+        ExplorationFrontier, path=os.path.join(WORK_DIR, "frontier.db"), legacy_queue_file=None
+    )
+    logging_config.setup_logging()
+    models.Base.metadata.create_all(bind=engine)
+    migrations.run_migrations(engine)
+
+    cancel_event = threading.Event()
+    progress = {}
+
+    def on_progress(snapshot):
+        progress.update(snapshot)
+        if snapshot["artists_processed"] >= args.artists:
+            cancel_event.set()
+
+    shape = GraphShape(args.songs, args.seed)
+    with FakeMusicBrainzServer(shape, args.recordings_per_artist, faults=fault_config(args)) as server:
+        musicbrainz_api.BASE_URL = server.base_url
+        started = time.perf_counter()
+        result = services.MusicDataService().run_exploration_queue(
+            initial_artist_name=person_name(shape.artists.offset), max_data_gb=100,
+            fetch_workers=args.workers, schedule_policy=args.policy,
+            cancel_event=cancel_event, on_progress=on_progress,
+        )
+        elapsed = time.perf_counter() - started
+        server_stats = server.stats()
+    logging_config.shutdown_logging()
+
+    limiter = musicbrainz_api.rate_limiter
+    report = {
+        "settings": {key: value for key, value in vars(args).items() if key != "output"},
+        "status": result.get("status"),
+        "seconds": round(elapsed, 2),
+        "artists": progress.get("artists_processed", 0),
+        "songs": progress.get("songs_imported", 0),
+        "songs_per_second": round(progress.get("songs_imported", 0) / elapsed, 1),
+        "server": server_stats,
+        "server_requests_per_second": round(server_stats["requests"] / elapsed, 2),
+        "client": {
+            "retries_throttle": int(metrics.MUSICBRAINZ_RETRIES.value(reason="throttle")),
+            "retries_error": int(metrics.MUSICBRAINZ_RETRIES.value(reason="error")),
+            "throttle_count": limiter.throttle_count,
+            "final_rate": round(limiter.rate, 3),
+            "rate_limit_wait_seconds": round(metrics.stage_totals().get(metrics.RATE_LIMIT_WAIT, 0), 2),
+        },
+    }
+
+    print(f"{report['status']}: 아티스트 {report['artists']}명, 곡 {report['songs']}개, {report['seconds']}초 "
+          f"({report['songs_per_second']}곡/초)")
+    print(f"  서버: 요청 {server_stats['requests']}회 ({report['server_requests_per_second']} req/s), "
+          f"503 {server_stats['throttled']}회, 5xx 오류 {server_stats['errors']}회, 응답 상태 {server_stats['statuses']}")
+    client = report["client"]
+    print(f"  클라이언트: 스로틀 재시도 {client['retries_throttle']}회, 오류 재시도 {client['retries_error']}회, "
+          f"최종 속도 {client['final_rate']} req/s (설정 {args.client_rps}), Rate Limit 대기 합계 {client['rate_limit_wait_seconds']}초")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
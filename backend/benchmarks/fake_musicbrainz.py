@@ -0,0 +1,302 @@
+"""
+로컬 가짜 MusicBrainz 서버 (벤치마크/부하 테스트용).
+
+`musicbrainz_api`가 쓰는 `/ws/2/` 요청 중 수집에 필요한 것을 흉내 냅니다.
+- `artist/?query=<이름>`: 아티스트 검색 (가장 일치하는 아티스트 하나)
+- `artist/<mbid>`: 아티스트 조회 (`inc=releases`, `inc=url-rels`면 빈 목록)
+- `recording?artist=<mbid>&limit=&offset=`: 아티스트의 곡 목록 (페이지 단위, `inc=`가 있으면 관계 포함)
+- `/stats`: 지금까지의 응답 통계 (JSON)
+곡은 아티스트 MBID로 정해지는 시드로 만들어지므로 같은 아티스트는 항상 같은 응답을 받습니다.
+참여 인물은 `benchmarks.synthetic_graph`와 같은 인물 풀에서 뽑으므로, 합성 DB에 이미 있는 인물과 이어지고
+참여 인물을 다시 탐색하면 그래프가 계속 이어집니다.
+
+장애 흉내 (FaultConfig):
+- latency_ms / jitter_ms: 응답마다 지연
+- error_rate: 이 비율의 요청에 500/502/504 응답
+- throttle_rps: 초당 요청이 이보다 많으면 503 + `Retry-After` (MusicBrainz의 IP별 Rate Limit과 같은 방식)
+- throttle_rate: 이 비율의 요청에 무작위로 503
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.fake_musicbrainz [--port 8089] [--latency-ms 50] [--error-rate 0.01] [--throttle-rps 5]
+    MUSICBRAINZ_BASE_URL=http://127.0.0.1:8089/ws/2/ MUSICBRAINZ_REQUESTS_PER_SECOND=10 HTTP_CACHE_ENABLED=0 \\
+        uvicorn app.main:app
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import roles  # noqa: E402
+from benchmarks.synthetic_graph import (  # noqa: E402
+    DEFAULT_SEED, DEFAULT_SONGS, FEATURING_ROLE, GraphShape, person_mbid, person_name, release_date, song_title,
+)
+
+RECORDINGS_PER_ARTIST = 80 # ARTIST_SONG_LIMIT(50)보다 많게 두어 곡 수 제한까지 가져오게 합니다.
+WORK_RELATION_TYPES = {"composer", "lyricist", "writer"} # MusicBrainz에서 Work(작품)에 붙는 관계
+FAKE_PERSON_OFFSET = 10 ** 9 # 서버가 만드는 1회 참여 연주자 번호 (합성 DB의 인물 번호와 겹치지 않도록)
+SYNTHETIC_PERSON_PREFIX = person_mbid(0)[:-1]
+ERROR_STATUS_CODES = (500, 502, 504)
+
+
+class FaultConfig(NamedTuple):
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error_rate: float = 0
+    throttle_rps: Optional[float] = None # None이면 요청 속도 제한 없음
+    throttle_rate: float = 0
+    retry_after_seconds: Optional[float] = 1 # None이면 503에 Retry-After를 붙이지 않음 (클라이언트 백오프)
+
+
+def artist_name(mbid: str) -> str:
+    """합성 DB의 인물 MBID면 같은 이름을, 아니면 MBID로 만든 이름을 돌려줍니다."""
+    index = _synthetic_index(mbid)
+    return person_name(index) if index is not None else f"Bench Artist {mbid}"
+
+
+def _synthetic_index(mbid: str) -> Optional[int]:
+    suffix = mbid[len(SYNTHETIC_PERSON_PREFIX):]
+    return int(suffix) if mbid.startswith(SYNTHETIC_PERSON_PREFIX) and suffix.isdigit() else None
+
+
+def search_artist_mbid(query: str) -> str:
+    """이름이 합성 인물 이름(`person_name`)과 같으면 그 인물을, 아니면 검색어로 정해지는 새 아티스트를 돌려줍니다."""
+    number = query.rsplit(" ", 1)[-1]
+    if number.isdigit() and person_name(int(number)) == query:
+        return person_mbid(int(number))
+    return f"bench-artist-{zlib.crc32(query.encode()):08x}"
+
+
+def _artist_ref(index: int) -> Dict[str, str]:
+    return {"id": person_mbid(index), "name": person_name(index)}
+
+
+class FakeCatalog:
+    """아티스트 MBID별 가짜 Recording 목록 (GraphShape의 인물 풀 사용)"""
+
+    def __init__(self, shape: GraphShape, recordings_per_artist: int = RECORDINGS_PER_ARTIST):
+        self.shape = shape
+        self.recordings_per_artist = recordings_per_artist
+        self._recordings: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def recordings(self, artist_mbid: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            recordings = self._recordings.get(artist_mbid)
+            if recordings is None:
+                recordings = self._recordings[artist_mbid] = self._generate(artist_mbid)
+            return recordings
+
+    def _generate(self, artist_mbid: str) -> List[Dict[str, Any]]:
+        artist_hash = zlib.crc32(artist_mbid.encode())
+        rng = random.Random(f"{self.shape.seed}:{artist_mbid}")
+        one_off_ids = iter(range(FAKE_PERSON_OFFSET + artist_hash * 1000, FAKE_PERSON_OFFSET + (artist_hash + 1) * 1000))
+        artist = {"id": artist_mbid, "name": artist_name(artist_mbid)}
+        recordings = []
+        for i in range(self.recordings_per_artist):
+            artist_credit = [{"name": artist["name"], "joinphrase": "", "artist": artist}]
+            relations, work_relations = [], []
+            # 가창 아티스트 자리(-1)는 위의 artist로 바꾸고, 나머지 참여자를 MusicBrainz 관계 형식으로 옮깁니다.
+            for person, label in self.shape.song_contributions(rng, lambda: next(one_off_ids), -1)[1:]:
+                if label == FEATURING_ROLE:
+                    artist_credit.append({"name": person_name(person), "joinphrase": "", "artist": _artist_ref(person)})
+                    continue
+                parsed = roles.parse_role(label)
+                relation = {"target-type": "artist", "type": parsed.base_role, "attributes": list(parsed.attributes),
+                            "artist": _artist_ref(person)}
+                (work_relations if parsed.base_role in WORK_RELATION_TYPES else relations).append(relation)
+            if work_relations:
+                relations.append({"target-type": "work", "type": "performance",
+                                  "work": {"id": f"{artist_mbid}-work-{i}", "relations": work_relations}})
+            recordings.append({
+                "id": f"{artist_mbid}-recording-{i}",
+                "title": song_title(rng),
+                "first-release-date": release_date(rng).isoformat(),
+                "artist-credit": artist_credit,
+                "relations": relations,
+            })
+        return recordings
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeMusicBrainzServer"
+    protocol_version = "HTTP/1.1" # Keep-Alive (클라이언트의 연결 풀 재사용)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path == "/stats":
+            self._send_json(200, self.server.stats())
+            return
+        fault = self.server.inject_fault()
+        if fault is not None:
+            status, headers = fault
+            self._send_json(status, {"error": "Your requests are exceeding the allowable rate limit."
+                                     if status == 503 else "Internal server error"}, headers)
+            return
+
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        path = parts.path.removeprefix("/ws/2/").strip("/")
+        if path == "artist" and "query" in query:
+            mbid = search_artist_mbid(query["query"])
+            artists = [{"id": mbid, "name": artist_name(mbid), "score": 100}]
+            self._send_json(200, {"count": len(artists), "offset": 0, "artists": artists})
+        elif path.startswith("artist/"):
+            mbid = path.split("/", 1)[1]
+            body: Dict[str, Any] = {"id": mbid, "name": artist_name(mbid), "type": "Group"}
+            includes = query.get("inc", "")
+            if "releases" in includes:
+                body["releases"] = []
+            if "url-rels" in includes:
+                body["relations"] = []
+            self._send_json(200, body)
+        elif path == "recording" and "artist" in query:
+            recordings = self.server.catalog.recordings(query["artist"])
+            offset, limit = int(query.get("offset", 0)), min(int(query.get("limit", 25)), 100)
+            page = recordings[offset:offset + limit]
+            if "inc" not in query: # 관계 없이 ID/제목만 (get_artist_recording_ids)
+                page = [{"id": recording["id"], "title": recording["title"]} for recording in page]
+            self._send_json(200, {"recording-count": len(recordings), "recording-offset": offset, "recordings": page})
+        else:
+            self._send_json(404, {"error": "Not Found"})
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        self.server.record(status, len(payload))
+
+    def log_message(self, format, *args):
+        pass # 요청마다 stderr에 쓰지 않음
+
+
+class FakeMusicBrainzServer(ThreadingHTTPServer):
+    """
+    127.0.0.1에서 가짜 MusicBrainz를 별도 스레드로 실행합니다. (port=0이면 빈 포트)
+    `with FakeMusicBrainzServer(shape) as server:` 안에서 `musicbrainz_api.BASE_URL = server.base_url`로 연결하거나,
+    서버 프로세스를 따로 띄우고 `MUSICBRAINZ_BASE_URL` 환경 변수로 연결합니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, shape: GraphShape, recordings_per_artist: int = RECORDINGS_PER_ARTIST, port: int = 0,
+                 faults: FaultConfig = FaultConfig(), seed: Optional[int] = None):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.catalog = FakeCatalog(shape, recordings_per_artist)
+        self.faults = faults
+        self._rng = random.Random(seed if seed is not None else shape.seed)
+        self._lock = threading.Lock()
+        self._window_started = time.monotonic()
+        self._window_requests = 0
+        self._statuses: Counter = Counter()
+        self._bytes = 0
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-musicbrainz", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/ws/2/"
+
+    def inject_fault(self) -> Optional[tuple]:
+        """지연을 적용하고, 장애를 흉내 낼 요청이면 (상태 코드, 헤더)를 반환합니다."""
+        faults = self.faults
+        with self._lock:
+            delay = max(0.0, faults.latency_ms + self._rng.uniform(-faults.jitter_ms, faults.jitter_ms)) / 1000
+            throttled = self._rng.random() < faults.throttle_rate
+            failed = self._rng.random() < faults.error_rate
+            error_status = self._rng.choice(ERROR_STATUS_CODES)
+            if faults.throttle_rps is not None:
+                # 1초 단위 창에서 허용량을 넘긴 요청은 스로틀링합니다.
+                now = time.monotonic()
+                if now - self._window_started >= 1:
+                    self._window_started, self._window_requests = now, 0
+                self._window_requests += 1
+                throttled = throttled or self._window_requests > faults.throttle_rps
+        if delay:
+            time.sleep(delay)
+        if throttled:
+            retry_after = faults.retry_after_seconds
+            return 503, ({"Retry-After": f"{retry_after:g}"} if retry_after is not None else {})
+        if failed:
+            return error_status, {}
+        return None
+
+    def record(self, status: int, size: int):
+        with self._lock:
+            self._statuses[status] += 1
+            self._bytes += size
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": sum(self._statuses.values()),
+                "statuses": {str(status): count for status, count in sorted(self._statuses.items())},
+                "throttled": self._statuses[503],
+                "errors": sum(self._statuses[status] for status in ERROR_STATUS_CODES),
+                "bytes": self._bytes,
+            }
+
+    def __enter__(self) -> "FakeMusicBrainzServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser):
+    """FaultConfig와 카탈로그 명령줄 옵션 (benchmarks.crawl_load와 공유)"""
+    parser.add_argument("--latency-ms", type=float, default=0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="응답 지연 편차 (±ms)")
+    parser.add_argument("--error-rate", type=float, default=0, help="500/502/504로 응답할 요청 비율")
+    parser.add_argument("--throttle-rps", type=float, help="초당 허용 요청 수 (넘으면 503)")
+    parser.add_argument("--throttle-rate", type=float, default=0, help="무작위로 503을 돌려줄 요청 비율")
+    parser.add_argument("--retry-after", type=float, default=1, help="503의 Retry-After (초, 음수면 헤더 없음)")
+    parser.add_argument("--songs", type=int, default=DEFAULT_SONGS, help="인물 풀 크기를 정하는 곡 수 (합성 DB와 같게)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--recordings-per-artist", type=int, default=RECORDINGS_PER_ARTIST)
+
+
+def fault_config(args: argparse.Namespace) -> FaultConfig:
+    return FaultConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        throttle_rps=args.throttle_rps, throttle_rate=args.throttle_rate,
+        retry_after_seconds=args.retry_after if args.retry_after >= 0 else None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 MusicBrainz 서버")
+    parser.add_argument("--port", type=int, default=8089)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeMusicBrainzServer(GraphShape(args.songs, args.seed), args.recordings_per_artist, port=args.port,
+                                   faults=fault_config(args))
+    print(f"가짜 MusicBrainz 서버: {server.base_url} (통계: http://127.0.0.1:{args.port}/stats)")
+    print(f"  시드 아티스트 이름 예: {person_name(0)!r}")
+    print(f"  백엔드 연결: MUSICBRAINZ_BASE_URL={server.base_url} HTTP_CACHE_ENABLED=0")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.stats(), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+로그 출력이 수집 시간에 주는 부담 측정.
+
+가짜 MusicBrainz 응답(HTTP 없이 메모리에서 생성)으로 `import_artist_by_mbid`를 반복 실행해 아티스트 수집 시간을 비교합니다.
+- sync-debug: 모든 로그(DEBUG)를 호출한 스레드에서 바로 파일에 쓰기 (예전 `print()` 출력과 같은 양, 같은 방식)
+- queue-info: 기본 설정 (INFO, 큐 핸들러 → 별도 스레드에서 파일에 쓰기)
+- queue-json: 기본 설정 + LOG_FORMAT=json
+- off: WARNING 이상만 (정상 수집에서는 출력 없음)
+모드마다 새 아티스트를 가져오며, 모드를 번갈아 여러 번 실행한 중앙값과 1회 로그 크기를 출력합니다.
+마지막으로 비활성화된 `logger.debug()` 한 번의 비용을 출력합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.logging_overhead [아티스트 수] [반복 횟수]
+"""
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# 기본 DB 경로(./kpop.db)가 임시 디렉토리를 가리키도록 app을 가져오기 전에 이동합니다.
+WORK_DIR = tempfile.mkdtemp()
+os.chdir(WORK_DIR)
+
+from app import logging_config, migrations, models, musicbrainz_api  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.rate_limit import AdaptiveRateLimiter  # noqa: E402
+from app.services import MusicDataService  # noqa: E402
+
+DEFAULT_ARTISTS = 20
+DEFAULT_ROUNDS = 3
+RECORDINGS_PER_ARTIST = 120
+RELATION_TYPES = ("producer", "mix", "instrument", "vocal", "arranger")
+MODES = ("sync-debug", "queue-info", "queue-json", "off")
+
+
+def artist_ref(artist: str):
+    return {"id": artist, "name": f"Artist {artist}"}
+
+
+def fake_recordings(artist_mbid: str):
+    return [
+        {
+            "id": f"{artist_mbid}-recording-{i}",
+            "title": f"Recording {i}",
+            "first-release-date": f"{2000 + i % 25}",
+            "artist-credit": [{"name": "", "artist": artist_ref(artist_mbid)}],
+            "relations": [
+                {"target-type": "artist", "type": RELATION_TYPES[(i + r) % len(RELATION_TYPES)], "attributes": [],
+                 "artist": artist_ref(f"collaborator-{(i * 7 + r) % 200}")}
+                for r in range(3)
+            ],
+        }
+        for i in range(RECORDINGS_PER_ARTIST)
+    ]
+
+
+def fake_get(url, headers=None, timeout=None):
+    """MusicBrainz artist 조회와 recording browse 요청에 가짜 응답을 돌려줍니다."""
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    if "/artist/" in parts.path:
+        body = artist_ref(parts.path.rsplit("/", 1)[-1])
+    else:
+        offset, limit = int(query["offset"][0]), int(query["limit"][0])
+        recordings = fake_recordings(query["artist"][0])
+        body = {"recording-count": len(recordings), "recordings": recordings[offset:offset + limit]}
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+def configure(mode: str, log_path: str):
+    logging_config.shutdown_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    if mode == "sync-debug":
+        handler = logging.FileHandler(log_path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter(logging_config.TEXT_FORMAT))
+        root.addHandler(handler)
+        root.setLevel(logging.DEBUG)
+    elif mode == "off":
+        root.addHandler(logging.NullHandler())
+        root.setLevel(logging.WARNING)
+    else:
+        logging_config.setup_logging("INFO", "json" if mode == "queue-json" else "text", log_path)
+
+
+def run_mode(service: MusicDataService, mode: str, round_number: int, artists: int) -> float:
+    log_path = os.path.join(WORK_DIR, f"{mode}.log")
+    configure(mode, log_path)
+    started = time.perf_counter()
+    for artist in range(artists):
+        service.import_artist_by_mbid(f"{mode}-{round_number}-{artist}", set(), [])
+    elapsed = time.perf_counter() - started
+    configure("off", log_path) # 큐에 남은 로그까지 기록을 마칩니다.
+    return elapsed
+
+
+def main():
+    artists = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ARTISTS
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ROUNDS
+    musicbrainz_api.http_session.get = fake_get
+    musicbrainz_api.response_cache = None
+    musicbrainz_api.rate_limiter = AdaptiveRateLimiter(rate=1_000_000, capacity=1_000_000)
+
+    models.Base.metadata.create_all(bind=engine)
+    configure("off", os.devnull)
+    migrations.run_migrations(engine)
+    service = MusicDataService()
+
+    timings = {mode: [] for mode in MODES}
+    for round_number in range(rounds):
+        # DB가 커질수록 저장이 느려지므로 회차마다 모드 순서를 돌려 순서의 영향을 줄입니다.
+        shift = round_number % len(MODES)
+        for mode in MODES[shift:] + MODES[:shift]:
+            timings[mode].append(run_mode(service, mode, round_number, artists))
+
+    print(f"아티스트 {artists}명 × 곡 {RECORDINGS_PER_ARTIST}개 (ARTIST_SONG_LIMIT 적용), {rounds}회 중앙값")
+    baseline = statistics.median(timings["off"])
+    for mode in MODES:
+        median = statistics.median(timings[mode])
+        log_path = os.path.join(WORK_DIR, f"{mode}.log")
+        log_size = os.path.getsize(log_path) if os.path.exists(log_path) else 0
+        print(f"  {mode:>10}: {median:.3f}s ({(median / baseline - 1) * 100:+.1f}% vs off), "
+              f"로그 {log_size / rounds / 1024:.0f} KiB")
+
+    logger = logging.getLogger("benchmarks.logging_overhead")
+    calls = 1_000_000
+    seconds = timeit.timeit(lambda: logger.debug("get_person_by_mbid 호출: mbid=%s", "mbid"), number=calls)
+    print(f"비활성화된 logger.debug() 1회: {seconds / calls * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+MusicBrainz JSON 덤프 가져오기(`mb_dump.DumpImporter`) 벤치마크.
+
+합성 덤프(artist/recording/work, 실제 덤프와 같은 한 줄 JSON 형식)를 만들어 새 DB로 가져옵니다.
+- recording 덤프는 배포 형식과 같은 `recording.tar.xz` (`mbdump/recording`)
+- work 덤프는 `work.gz`, artist 덤프는 압축하지 않은 JSON Lines
+한 지역(area)의 아티스트를 시드로 2단계까지 가져오며, 처리 시간, 곡/초, 최대 메모리 사용량(RSS)을 출력합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.mb_dump_import [recording 수]
+"""
+import gzip
+import io
+import json
+import os
+import random
+import resource
+import sys
+import tarfile
+import tempfile
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import mb_dump, migrations, models  # noqa: E402
+from app.database import create_db_engine  # noqa: E402
+from app.services import MusicDataService  # noqa: E402
+
+DEFAULT_RECORDINGS = 50000
+ARTISTS = 5000
+SEED_AREA = "South Korea"
+SEED_AREA_RATIO = 0.02 # 시드 지역 아티스트 비율
+WORKS_PER_RECORDING = 0.7 # 작품(work)이 연결된 Recording 비율
+RELATION_TYPES = ("producer", "mix", "instrument", "vocal", "arranger")
+
+
+def artist_ref(artist: int):
+    return {"id": f"artist-{artist}", "name": f"Artist {artist}"}
+
+
+def write_synthetic_dump(directory: str, recordings: int):
+    rnd = random.Random(0)
+    artist_path = os.path.join(directory, "artist")
+    with open(artist_path, "w", encoding="utf-8") as artist_file:
+        for artist in range(ARTISTS):
+            area = SEED_AREA if rnd.random() < SEED_AREA_RATIO else "Elsewhere"
+            artist_file.write(json.dumps(dict(artist_ref(artist), area={"name": area})) + "\n")
+
+    work_path = os.path.join(directory, "work.gz")
+    with gzip.open(work_path, "wt", encoding="utf-8") as work_file:
+        for work in range(recordings):
+            work_file.write(json.dumps({"id": f"work-{work}", "title": f"Work {work}", "relations": [
+                {"target-type": "artist", "type": role, "artist": artist_ref(rnd.randrange(ARTISTS))}
+                for role in ("composer", "lyricist")
+            ]}) + "\n")
+
+    lines = io.BytesIO()
+    for recording in range(recordings):
+        relations = [
+            {"target-type": "artist", "type": rnd.choice(RELATION_TYPES), "attributes": [],
+             "artist": artist_ref(rnd.randrange(ARTISTS))}
+            for _ in range(rnd.randint(0, 3))
+        ]
+        if rnd.random() < WORKS_PER_RECORDING:
+            relations.append({"target-type": "work", "type": "performance", "work": {"id": f"work-{recording}"}})
+        lines.write((json.dumps({
+            "id": f"recording-{recording}",
+            "title": f"Recording {recording}",
+            "first-release-date": f"{2000 + recording % 25}",
+            "artist-credit": [{"name": "", "artist": artist_ref(rnd.randrange(ARTISTS))}],
+            "relations": relations,
+        }) + "\n").encode("utf-8"))
+    recording_path = os.path.join(directory, "recording.tar.xz")
+    with tarfile.open(recording_path, "w:xz") as archive:
+        info = tarfile.TarInfo("mbdump/recording")
+        info.size = lines.tell()
+        lines.seek(0)
+        archive.addfile(info, lines)
+    return recording_path, work_path, artist_path
+
+
+def main():
+    recordings = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORDINGS
+    directory = tempfile.mkdtemp()
+    started = time.perf_counter()
+    recording_path, work_path, artist_path = write_synthetic_dump(directory, recordings)
+    print(f"합성 덤프 생성: Recording {recordings}개 ({time.perf_counter() - started:.1f}s, "
+          f"recording.tar.xz {os.path.getsize(recording_path) / 1024 ** 2:.1f} MB)")
+
+    engine = create_db_engine(f"sqlite:///{os.path.join(directory, 'dump.db')}")
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    # 로그 출력이 측정에 섞이지 않도록 stdout을 잠시 버립니다.
+    devnull = open(os.devnull, "w")
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        migrations.run_migrations(engine)
+        importer = mb_dump.DumpImporter(
+            MusicDataService(), recording_path, work_path=work_path, artist_path=artist_path,
+            seed_areas=[SEED_AREA], hops=2, session_factory=session_factory,
+        )
+        result = importer.run()
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+
+    with engine.connect() as conn:
+        counts = {
+            table: conn.exec_driver_sql(f"SELECT COUNT(*) FROM {table}").scalar()
+            for table in ("songs", "persons", "contributions")
+        }
+    print(f"결과: {result}")
+    print(f"DB: {counts}")
+    print(f"최대 메모리 사용량(RSS): {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+`/songs/mbid/{mbid}/graph-details` 읽기 경로 벤치마크.
+
+참여 인물 수를 늘려가며 기존 방식(곡 조회 후 contribution.person 지연 로딩 + model_validate)과
+`crud.get_song_graph_details_by_mbid`(JOIN 한 번 + SQL 역할 집계)의 응답 시간과 SQL 실행 횟수를 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.song_graph_details
+"""
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import crud, models, roles, schemas  # noqa: E402
+
+CONTRIBUTOR_COUNTS = [5, 50, 500, 2000]
+ROLES_PER_PERSON = 2
+REPEAT = 20
+
+
+def legacy_song_graph_details(db, mbid):
+    """변경 전 구현 (비교용)"""
+    song = db.query(models.Song).filter(models.Song.mbid == mbid).first()
+    person_roles_map = defaultdict(lambda: {"person": None, "roles": []})
+    for contribution in song.contributions:
+        person = contribution.person
+        if person:
+            person_roles_map[person.id]["person"] = person
+            person_roles_map[person.id]["roles"].append(contribution.role)
+    related_persons = []
+    for data in person_roles_map.values():
+        person_with_roles = schemas.Person.model_validate(data["person"]).model_dump()
+        person_with_roles["roles"] = data["roles"]
+        related_persons.append(person_with_roles)
+    return {"main": song, "related": related_persons}
+
+
+def populate(session_factory):
+    db = session_factory()
+    role_ids = roles.get_role_ids(db, [f"role {r}" for r in range(ROLES_PER_PERSON)])
+    person_id = 0
+    for count in CONTRIBUTOR_COUNTS:
+        song = models.Song(title=f"Song {count}", artist="Bench", mbid=f"song-{count}")
+        db.add(song)
+        db.flush()
+        rows = []
+        for _ in range(count):
+            person_id += 1
+            rows.append({"id": person_id, "name": f"Person {person_id}", "mbid": f"person-{person_id}", "is_explored": False})
+        db.execute(models.Person.__table__.insert(), rows)
+        db.execute(models.Contribution.__table__.insert(), [
+            {"song_id": song.id, "person_id": row["id"], "role_id": role_ids[f"role {r}"]}
+            for row in rows for r in range(ROLES_PER_PERSON)
+        ])
+    db.commit()
+    db.close()
+
+
+def measure(session_factory, engine, fn, mbid):
+    statements = [0]
+
+    def count_statement(*_):
+        statements[0] += 1
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            db = session_factory() # 요청마다 새 세션 (FastAPI get_db와 동일)
+            try:
+                fn(db, mbid)
+            finally:
+                db.close()
+        elapsed_ms = (time.perf_counter() - started) * 1000 / REPEAT
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+    return elapsed_ms, statements[0] // REPEAT
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    populate(session_factory)
+
+    # crud 모듈의 로그 출력이 측정에 섞이지 않도록 stdout을 잠시 버립니다.
+    print(f"{'contributors':>12} | {'legacy ms':>10} {'queries':>8} | {'joined ms':>10} {'queries':>8}")
+    devnull = open(os.devnull, "w")
+    for count in CONTRIBUTOR_COUNTS:
+        mbid = f"song-{count}"
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            legacy = measure(session_factory, engine, legacy_song_graph_details, mbid)
+            joined = measure(session_factory, engine, crud.get_song_graph_details_by_mbid, mbid)
+        finally:
+            sys.stdout = stdout
+        print(f"{count:>12} | {legacy[0]:>10.2f} {legacy[1]:>8} | {joined[0]:>10.2f} {joined[1]:>8}")
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
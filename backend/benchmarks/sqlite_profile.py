@@ -0,0 +1,145 @@
+"""
+SQLite 저장 프로필(`database.SQLITE_PROFILES`) 벤치마크.
+
+크롤러와 UI가 같은 DB 파일을 쓰는 상황을 재현합니다. 프로필마다 새 DB 파일에서
+- 쓰기: 단일 writer가 `batch_writer.write_song_page`로 페이지(곡 100개)를 연속 저장합니다.
+  (조회 없이 한 번, 조회와 동시에 한 번)
+- 읽기: 쓰기와 동시에 여러 스레드가 조회 전용 엔진으로 `/songs/mbid/{mbid}/graph-details`와 같은 조회를
+  READ_INTERVAL_SECONDS 간격으로 반복합니다. (UI 사용자 몇 명 정도의 부하)
+수집 처리량(곡/초)과 조회 지연 시간 분포(p50/p95/p99/최대)를 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.sqlite_profile
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import batch_writer, crud, models, schemas  # noqa: E402
+from app.database import SQLITE_PROFILES, create_db_engine  # noqa: E402
+from app.identity_cache import PersonIdentityCache  # noqa: E402
+
+SEED_PAGES = 20 # 측정 전에 미리 저장해 두는 페이지 수 (조회 대상)
+INGEST_PAGES = 150
+SONGS_PER_PAGE = 100
+CONTRIBUTORS_PER_SONG = 4
+PERSON_POOL = 20000
+READER_THREADS = 4
+READ_INTERVAL_SECONDS = 0.01
+
+
+def make_page(page: int):
+    rnd = random.Random(page)
+    songs = []
+    for i in range(SONGS_PER_PAGE):
+        person_ids = rnd.sample(range(PERSON_POOL), CONTRIBUTORS_PER_SONG)
+        songs.append(schemas.CrawledSongData(
+            title=f"Song {page}-{i}",
+            artist="Bench",
+            source_url="https://musicbrainz.org/",
+            mbid=f"song-{page}-{i}",
+            contributions=[
+                schemas.ContributionData(person_name=f"Person {p}", person_mbid=f"person-{p}", role=role)
+                for p, role in zip(person_ids, ("vocals", "composer", "lyricist", "producer"))
+            ],
+        ))
+    return songs
+
+
+def percentile(values, ratio):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def run_profile(profile: str, pages, with_readers: bool = True):
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    url = f"sqlite:///{path}"
+    write_engine = create_db_engine(url, profile)
+    read_engine = create_db_engine(url, profile, read_only=True, pool_size=READER_THREADS)
+    models.Base.metadata.create_all(bind=write_engine)
+    write_session = sessionmaker(bind=write_engine, autoflush=False)
+    read_session = sessionmaker(bind=read_engine, autoflush=False)
+    person_cache = PersonIdentityCache()
+
+    db = write_session()
+    for page in pages[:SEED_PAGES]:
+        batch_writer.write_song_page(db, page, person_cache)
+    seeded_mbids = [song.mbid for page in pages[:SEED_PAGES] for song in page]
+
+    stop = threading.Event()
+    latencies = []
+    errors = []
+
+    def reader(seed: int):
+        rnd = random.Random(seed)
+        while not stop.is_set():
+            read_db = read_session()
+            started = time.perf_counter()
+            try:
+                crud.get_song_graph_details_by_mbid(read_db, rnd.choice(seeded_mbids))
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                read_db.close()
+            time.sleep(READ_INTERVAL_SECONDS)
+
+    threads = [
+        threading.Thread(target=reader, args=(i,), daemon=True) for i in range(READER_THREADS if with_readers else 0)
+    ]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    imported = 0
+    for page in pages[SEED_PAGES:]:
+        imported += batch_writer.write_song_page(db, page, person_cache)["imported_song_count"]
+    ingest_seconds = time.perf_counter() - started
+    stop.set()
+    for thread in threads:
+        thread.join()
+    db.close()
+    write_engine.dispose()
+    read_engine.dispose()
+
+    return {
+        "songs_per_second": imported / ingest_seconds,
+        "reads": len(latencies),
+        "read_errors": len(errors),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies, default=0.0) * 1000,
+    }
+
+
+def main():
+    pages = [make_page(page) for page in range(SEED_PAGES + INGEST_PAGES)]
+    print(f"{'profile':>8} | {'songs/s':>8} | {'songs/s*':>8} | {'reads':>6} {'errors':>6} | "
+          f"{'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'max ms':>8}")
+    # 저장 경로의 로그 출력이 측정에 섞이지 않도록 stdout을 잠시 버립니다.
+    devnull = open(os.devnull, "w")
+    for profile in SQLITE_PROFILES:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            ingest_only = run_profile(profile, pages, with_readers=False)
+            result = run_profile(profile, pages)
+        finally:
+            sys.stdout = stdout
+        print(f"{profile:>8} | {ingest_only['songs_per_second']:>8.0f} | {result['songs_per_second']:>8.0f} | "
+              f"{result['reads']:>6} {result['read_errors']:>6} | "
+              f"{result['p50_ms']:>7.2f} {result['p95_ms']:>7.2f} {result['p99_ms']:>7.2f} {result['max_ms']:>8.2f}")
+    devnull.close()
+    print("songs/s: 조회 없이 수집, songs/s*: 조회와 동시에 수집 (오른쪽 지연 시간은 이때의 조회 기준)")
+
+
+if __name__ == "__main__":
+    main()
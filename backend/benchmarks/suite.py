@@ -0,0 +1,284 @@
+"""
+합성 K-POP 그래프 크기별 주요 경로 벤치마크.
+
+`benchmarks.synthetic_graph`로 곡 수별 DB를 만들고(데이터 디렉토리에 두고 다음 실행에 재사용),
+크기마다 DB 사본을 만들어 별도 프로세스에서 다음을 측정합니다. (앱은 ./kpop.db를 열기 때문)
+- collaboration_details: `crud.get_collaboration_details_by_mbid` (연결이 가장 많은 허브, 상위 1%, 중앙값 인물)
+- song_graph_details: `crud.get_song_graph_details_by_mbid` (임의의 곡)
+- search: `GET /search` (한글/초성/로마자 접두어, 곡 제목, 결과 없음. API 캐시는 끔)
+- ingest: `MusicDataService.import_artist_by_mbid` (로컬 가짜 MusicBrainz 서버, Rate Limit 없음)
+조회는 호출마다 새 세션을 열고, 첫 호출(콜드 캐시)은 first_ms로 따로 기록합니다. SQL 실행 수는 queries에 남습니다.
+결과는 JSON 파일로 저장하며, 이전 결과를 --compare로 넘기면 p50 변화를 함께 출력합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.suite [--sizes 10000,100000,1000000] [--repeat 20] [--output 결과.json] [--compare 이전.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks import synthetic_graph  # noqa: E402
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_SIZES = "10000,100000,1000000"
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), "starlight-benchmarks")
+DEFAULT_REPEAT = 20
+DEFAULT_INGEST_ARTISTS = 10
+
+SEARCH_QUERIES = {
+    "hangul_prefix": "김민",
+    "choseong": "ㄱㅁ",
+    "latin_prefix": "Min",
+    "song_title": "Love",
+    "no_match": "zzqx",
+}
+
+# 측정 프로세스 환경: 캐시 없이 매번 DB를 읽고, 로그는 경고만, 응답의 Server-Timing 헤더로 SQL 수를 셉니다.
+WORKER_ENV = {
+    "HTTP_CACHE_ENABLED": "0",
+    "API_CACHE_BACKEND": "off",
+    "LOG_LEVEL": "WARNING",
+    "SERVER_TIMING_HEADER": "1",
+    "SLOW_REQUEST_MS": "3600000",
+}
+
+
+def summarize(seconds: List[float]) -> Dict[str, float]:
+    ordered = sorted(seconds)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[round(fraction * (len(ordered) - 1))] * 1000, 3)
+
+    return {
+        "runs": len(ordered),
+        "min_ms": percentile(0),
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "max_ms": percentile(1),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+    }
+
+
+# --- 측정 (DB 사본 디렉토리에서 실행되는 별도 프로세스) ---
+
+def run_worker(size: int, repeat: int, ingest_artists: int, seed: int) -> Dict[str, object]:
+    # app은 가져올 때 ./kpop.db에 연결하므로, 작업 디렉토리가 DB 사본 위치로 바뀐 뒤에 가져옵니다.
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event, text
+
+    from app import crud, metrics, musicbrainz_api
+    from app.database import ReadSessionLocal, read_engine
+    from app.main import app
+    from app.rate_limit import AdaptiveRateLimiter
+    from app.services import MusicDataService
+    from benchmarks.fake_musicbrainz import FakeMusicBrainzServer
+
+    query_count = [0]
+    event.listen(read_engine, "before_cursor_execute", lambda *args: query_count.__setitem__(0, query_count[0] + 1))
+
+    def measure(calls: List[Callable[[], None]]) -> Dict[str, float]:
+        """calls[0]은 콜드 캐시 측정(first_ms), 나머지의 분포와 마지막 호출의 SQL 수를 기록합니다."""
+        timings = []
+        for call in calls:
+            query_count[0] = 0
+            started = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - started)
+        return {"first_ms": round(timings[0] * 1000, 3), **summarize(timings[1:]), "queries": query_count[0]}
+
+    def collaboration_details(mbid: str):
+        with ReadSessionLocal() as db:
+            crud.get_collaboration_details_by_mbid(db, mbid)
+
+    def song_graph_details(mbid: str):
+        with ReadSessionLocal() as db:
+            crud.get_song_graph_details_by_mbid(db, mbid)
+
+    results: Dict[str, object] = {}
+
+    with ReadSessionLocal() as db:
+        person_total = db.execute(text("SELECT COUNT(*) FROM search_person_rank")).scalar()
+        people = {}
+        for label, offset in (("hub", 0), ("top_1pct", person_total // 100), ("median", person_total // 2)):
+            people[label] = db.execute(text(
+                "SELECT p.mbid, r.degree FROM search_person_rank r JOIN persons p ON p.id = r.id "
+                "ORDER BY r.degree DESC, r.id LIMIT 1 OFFSET :offset"
+            ), {"offset": offset}).one()
+    results["collaboration_details"] = {
+        label: {"mbid": mbid, "songs": degree, **measure([lambda mbid=mbid: collaboration_details(mbid)] * (repeat + 1))}
+        for label, (mbid, degree) in people.items()
+    }
+
+    rng = random.Random(seed)
+    song_mbids = [f"synthetic-song-{rng.randrange(size)}" for _ in range(repeat + 1)]
+    results["song_graph_details"] = {
+        "random_songs": measure([lambda mbid=mbid: song_graph_details(mbid) for mbid in song_mbids])
+    }
+
+    client = TestClient(app)
+    search_results = {}
+    for label, query in SEARCH_QUERIES.items():
+        responses = []
+        stats = measure([lambda: responses.append(client.get("/search", params={"q": query}))] * (repeat + 1))
+        server_timing = responses[-1].headers.get("Server-Timing", "")
+        stats["queries"] = int(server_timing.rsplit('desc="', 1)[-1].split()[0]) if 'desc="' in server_timing else None
+        search_results[label] = {"q": query, "results": len(responses[-1].json()["results"]), **stats}
+    results["search"] = search_results
+
+    musicbrainz_api.response_cache = None
+    musicbrainz_api.rate_limiter = AdaptiveRateLimiter(rate=1_000_000, capacity=1_000_000)
+    service = MusicDataService()
+    with FakeMusicBrainzServer(synthetic_graph.GraphShape(size, seed)) as server:
+        musicbrainz_api.BASE_URL = server.base_url
+        stages_before = metrics.stage_totals()
+        timings, songs = [], 0
+        for artist in range(ingest_artists):
+            started = time.perf_counter()
+            result = service.import_artist_by_mbid(f"bench-artist-{artist}", set(), [])
+            timings.append(time.perf_counter() - started)
+            songs += result["imported_song_count"]
+        stages_after = metrics.stage_totals()
+    results["ingest"] = {
+        "per_artist": summarize(timings),
+        "songs": songs,
+        "songs_per_second": round(songs / sum(timings), 1),
+        "stage_seconds": {
+            stage: round(stages_after.get(stage, 0) - stages_before.get(stage, 0), 4) for stage in metrics.STAGES
+        },
+    }
+    return results
+
+
+# --- 실행 관리 ---
+
+def prepare_dataset(data_dir: str, size: int, seed: int, regenerate: bool) -> Dict[str, object]:
+    """곡 수별 합성 DB를 만들거나, 같은 설정으로 만든 DB가 있으면 재사용합니다."""
+    size_dir = os.path.join(data_dir, f"songs-{size}-seed-{seed}")
+    info_path = os.path.join(size_dir, "dataset.json")
+    if not regenerate and os.path.exists(info_path):
+        with open(info_path, encoding="utf-8") as f:
+            info = json.load(f)
+        if info.get("generator_version") == synthetic_graph.GENERATOR_VERSION:
+            return info
+    os.makedirs(size_dir, exist_ok=True)
+    print(f"곡 {size:,}개 합성 DB 생성 중... ({size_dir})", flush=True)
+    info = synthetic_graph.generate(os.path.join(size_dir, "kpop.db"), size, seed)
+    info["path"] = os.path.join(size_dir, "kpop.db")
+    with open(info_path, "w", encoding="utf-8") as f:
+        json.dump(info, f, ensure_ascii=False, indent=2)
+    return info
+
+
+def run_size(dataset: Dict[str, object], args: argparse.Namespace) -> Dict[str, object]:
+    """DB 사본을 만든 임시 디렉토리에서 측정 프로세스를 실행합니다. (수집 측정이 원본 DB를 바꾸지 않도록)"""
+    work_dir = tempfile.mkdtemp(prefix="run-", dir=args.data_dir)
+    try:
+        shutil.copyfile(str(dataset["path"]), os.path.join(work_dir, "kpop.db"))
+        output_path = os.path.join(work_dir, "result.json")
+        env = {**os.environ, **WORKER_ENV,
+               "PYTHONPATH": os.pathsep.join(filter(None, [BACKEND_DIR, os.environ.get("PYTHONPATH")]))}
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.suite", "--worker", str(dataset["songs"]), "--seed", str(args.seed),
+             "--repeat", str(args.repeat), "--ingest-artists", str(args.ingest_artists), "--output", output_path],
+            cwd=work_dir, env=env, check=True,
+        )
+        with open(output_path, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_summary(results: Dict[str, object], previous: Optional[Dict[str, object]]):
+    for size, size_results in results["sizes"].items():
+        dataset = size_results["dataset"]
+        print(f"\n곡 {int(size):,}개 (인물 {dataset['persons']:,}명, 기여 관계 {dataset['contributions']:,}개, "
+              f"{dataset['db_bytes'] / 1024 ** 2:.0f} MiB)")
+        for benchmark, cases in size_results.items():
+            if benchmark == "dataset":
+                continue
+            for case, stats in cases.items():
+                if not isinstance(stats, dict) or "p50_ms" not in stats:
+                    continue
+                line = f"  {benchmark}/{case}: p50 {stats['p50_ms']:.2f}ms, p95 {stats['p95_ms']:.2f}ms"
+                if stats.get("queries") is not None:
+                    line += f", SQL {stats['queries']}회"
+                try:
+                    before = previous["sizes"][size][benchmark][case]["p50_ms"]
+                    line += f" ({(stats['p50_ms'] / before - 1) * 100:+.0f}% vs 이전)"
+                except (KeyError, TypeError, ZeroDivisionError):
+                    pass
+                print(line)
+        ingest = size_results["ingest"]
+        print(f"  ingest: 곡 {ingest['songs']}개, {ingest['songs_per_second']}곡/초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 K-POP 그래프 크기별 주요 경로 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="쉼표로 구분한 곡 수 목록")
+    parser.add_argument("--seed", type=int, default=synthetic_graph.DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="경우마다 반복 횟수 (첫 호출 제외)")
+    parser.add_argument("--ingest-artists", type=int, default=DEFAULT_INGEST_ARTISTS, help="수집할 가짜 아티스트 수")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="합성 DB를 저장해 재사용할 디렉토리")
+    parser.add_argument("--regenerate", action="store_true", help="저장된 합성 DB가 있어도 새로 생성")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: <data-dir>/results/suite-<시각>.json)")
+    parser.add_argument("--compare", help="p50을 비교할 이전 결과 JSON")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS) # 내부용: 현재 디렉토리의 DB 사본 측정
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        result = run_worker(args.worker, args.repeat, args.ingest_artists, args.seed)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        return
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    started_at = datetime.now(timezone.utc)
+    results = {
+        "created_at": started_at.isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "settings": {"seed": args.seed, "repeat": args.repeat, "ingest_artists": args.ingest_artists},
+        "sizes": {},
+    }
+    for size in (int(size) for size in args.sizes.split(",")):
+        dataset = prepare_dataset(args.data_dir, size, args.seed, args.regenerate)
+        print(f"곡 {size:,}개 측정 중...", flush=True)
+        results["sizes"][str(size)] = {"dataset": dataset, **run_size(dataset, args)}
+
+    output = args.output or os.path.join(args.data_dir, "results", f"suite-{started_at:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+    print_summary(results, previous)
+    print(f"\n결과: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+합성 K-POP 협업 그래프 생성기 (벤치마크용).
+
+실제 수집 DB처럼 소수의 허브(여러 아티스트의 곡을 맡는 작곡가/프로듀서)와 곡 하나에만 참여한 연주자가
+대부분인 멱법칙(Zipf) 분포의 그래프를 `models` 스키마에 바로 씁니다.
+- 곡마다: 가창 아티스트 1명(가끔 피처링 1명), 작곡/작사/프로듀싱/편곡 1~4명, 연주/코러스 0~3명
+- 아티스트/창작자/세션 연주자는 각자의 인물 풀에서 순위 가중치로 뽑고, 연주자의 70%는 새 인물(1회 참여)
+- 같은 시드와 곡 수면 항상 같은 DB가 만들어집니다.
+곡/인물/기여 관계는 SQL을 직접 일괄 INSERT하고, 마지막에 앱과 같은 코드로 협업 쌍 테이블과 검색 색인을 만듭니다.
+`benchmarks.fake_musicbrainz`는 같은 인물 풀(`person_mbid`, `person_name`)로 새 아티스트의 곡을 만들어 줍니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.synthetic_graph [곡 수] [DB 경로]
+"""
+import bisect
+import itertools
+import os
+import random
+import sys
+import time
+from datetime import date
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import collaborators, migrations, models, roles, search_index  # noqa: E402
+from app.database import create_db_engine  # noqa: E402
+from app.services import ARTIST_CREDIT_ROLE  # noqa: E402
+
+DEFAULT_SONGS = 10_000
+DEFAULT_SEED = 42
+GENERATOR_VERSION = 2 # 분포나 스키마 쓰기 방식이 바뀌면 올립니다. (benchmarks.suite가 캐시한 DB를 다시 만듦)
+INSERT_CHUNK_SONGS = 5_000 # 한 트랜잭션에 쓰는 곡 수
+
+# 인물 풀 크기 (곡 수 대비)
+SONGS_PER_ARTIST = 20
+SONGS_PER_CREATOR = 10
+SONGS_PER_SESSION_PLAYER = 25
+
+# 순위 가중치 지수 (클수록 상위 몇 명에게 몰림)
+ARTIST_ZIPF = 0.7
+CREATOR_ZIPF = 0.8
+SESSION_ZIPF = 0.8
+
+FEATURING_PROBABILITY = 0.1
+ONE_OFF_PERFORMER_PROBABILITY = 0.7
+SECOND_CREATOR_ROLE_PROBABILITY = 0.3 # 같은 창작자가 작곡과 작사를 함께 맡는 경우
+
+CREATOR_ROLES = ("작곡", "작사", "프로듀싱", "편곡")
+PERFORMER_ROLES = (
+    "instrument (guitar)", "instrument (bass guitar)", "instrument (drums)",
+    "instrument (piano)", "instrument (strings)", "vocal (background vocals)", "programming",
+)
+FEATURING_ROLE = "피처링"
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ("민준", "서연", "지훈", "하은", "도윤", "수아", "예준", "지유", "시우", "서윤", "주원", "하린", "유진", "태현")
+LATIN_GIVEN_NAMES = ("Min", "Jae", "Hyun", "Seo", "Ji", "Young", "Soo", "Hae", "Woo", "Eun", "Dong", "Yoon")
+LATIN_SURNAMES = ("Kim", "Lee", "Park", "Choi", "Jung", "Kang", "Cho", "Yoon", "Jang", "Lim", "Han", "Shin")
+TITLE_WORDS = (
+    "Love", "Star", "Night", "Dream", "Summer", "Blue", "Fire", "Heart", "Moon", "Light", "Rain", "Forever",
+    "사랑", "별", "밤", "꿈", "여름", "바다", "봄날", "하루", "너에게", "우리", "기억", "노래",
+)
+
+
+def person_mbid(index: int) -> str:
+    return f"synthetic-person-{index}"
+
+
+def person_name(index: int) -> str:
+    """인물 번호별 고유 이름. 짝수는 한글, 홀수는 로마자 이름입니다. (persons.name은 UNIQUE)"""
+    if index % 2 == 0:
+        return f"{SURNAMES[index % len(SURNAMES)]}{GIVEN_NAMES[index // len(SURNAMES) % len(GIVEN_NAMES)]} {index}"
+    return (f"{LATIN_GIVEN_NAMES[index % len(LATIN_GIVEN_NAMES)]} "
+            f"{LATIN_SURNAMES[index // len(LATIN_GIVEN_NAMES) % len(LATIN_SURNAMES)]} {index}")
+
+
+def song_title(rng: random.Random) -> str:
+    return f"{rng.choice(TITLE_WORDS)} {rng.choice(TITLE_WORDS)}"
+
+
+def release_date(rng: random.Random) -> date:
+    return date(rng.randint(2000, 2024), rng.randint(1, 12), rng.randint(1, 28))
+
+
+class ZipfPool:
+    """[offset, offset + size) 범위의 인물 번호를 순위 가중치 1 / rank^exponent로 뽑습니다."""
+
+    def __init__(self, offset: int, size: int, exponent: float):
+        self.offset = offset
+        self.size = size
+        self.cumulative = list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(size)))
+
+    def sample(self, rng: random.Random) -> int:
+        rank = bisect.bisect_left(self.cumulative, rng.random() * self.cumulative[-1])
+        return self.offset + min(rank, self.size - 1)
+
+
+class GraphShape:
+    """곡 수로 정해지는 인물 풀 구성. 생성기와 가짜 MusicBrainz 서버가 같은 풀을 공유합니다."""
+
+    def __init__(self, songs: int, seed: int = DEFAULT_SEED):
+        self.songs = songs
+        self.seed = seed
+        artists = max(songs // SONGS_PER_ARTIST, 10)
+        creators = max(songs // SONGS_PER_CREATOR, 10)
+        session_players = max(songs // SONGS_PER_SESSION_PLAYER, 10)
+        self.artists = ZipfPool(0, artists, ARTIST_ZIPF)
+        self.creators = ZipfPool(artists, creators, CREATOR_ZIPF)
+        self.session_players = ZipfPool(artists + creators, session_players, SESSION_ZIPF)
+        self.one_off_offset = artists + creators + session_players # 1회 참여 연주자 번호는 여기부터
+
+    def song_contributions(self, rng: random.Random, new_person: Callable[[], int],
+                           artist: int) -> List[Tuple[int, str]]:
+        """곡 하나의 (인물 번호, 역할) 목록. artist는 가창 아티스트, new_person()은 1회 참여 연주자 번호를 만듭니다."""
+        contributions = [(artist, ARTIST_CREDIT_ROLE)]
+        if rng.random() < FEATURING_PROBABILITY:
+            featured = self.artists.sample(rng)
+            if featured != artist:
+                contributions.append((featured, FEATURING_ROLE))
+        for _ in range(rng.randint(1, 4)):
+            creator = self.creators.sample(rng)
+            contributions.append((creator, rng.choice(CREATOR_ROLES)))
+            if rng.random() < SECOND_CREATOR_ROLE_PROBABILITY:
+                contributions.append((creator, rng.choice(CREATOR_ROLES)))
+        for _ in range(rng.randint(0, 3)):
+            performer = new_person() if rng.random() < ONE_OFF_PERFORMER_PROBABILITY else self.session_players.sample(rng)
+            contributions.append((performer, rng.choice(PERFORMER_ROLES)))
+        return list(dict.fromkeys(contributions)) # 같은 (인물, 역할) 중복 제거 (기여 관계 기본 키)
+
+
+def _insert_rows(conn, table: str, columns: Tuple[str, ...], rows: List[tuple]):
+    if rows:
+        conn.exec_driver_sql(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows
+        )
+
+
+def generate(db_path: str, songs: int = DEFAULT_SONGS, seed: int = DEFAULT_SEED) -> Dict[str, object]:
+    """
+    db_path에 합성 그래프 DB를 새로 만듭니다. (이미 있으면 덮어씀)
+    생성된 행 수와 단계별 소요 시간(초)을 반환합니다.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    db_engine = create_db_engine(f"sqlite:///{db_path}")
+    models.Base.metadata.create_all(bind=db_engine)
+    migrations.run_migrations(db_engine)
+
+    shape = GraphShape(songs, seed)
+    rng = random.Random(seed)
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+
+    with Session(db_engine) as db:
+        role_ids = roles.get_role_ids(db, (ARTIST_CREDIT_ROLE, FEATURING_ROLE) + CREATOR_ROLES + PERFORMER_ROLES)
+        db.commit()
+
+    next_one_off = itertools.count(shape.one_off_offset)
+    inserted_persons = set()
+    contribution_count = 0
+    for chunk_start in range(0, songs, INSERT_CHUNK_SONGS):
+        song_rows, person_rows, contribution_rows = [], [], []
+        for song_index in range(chunk_start, min(chunk_start + INSERT_CHUNK_SONGS, songs)):
+            song_id = song_index + 1
+            artist = shape.artists.sample(rng)
+            song_rows.append((
+                song_id, f"synthetic-song-{song_index}", song_title(rng), person_name(artist), None,
+                release_date(rng).isoformat(), f"https://musicbrainz.org/recording/synthetic-song-{song_index}",
+            ))
+            for person, role in shape.song_contributions(rng, lambda: next(next_one_off), artist):
+                if person not in inserted_persons:
+                    inserted_persons.add(person)
+                    person_rows.append((person + 1, person_name(person), person_mbid(person),
+                                        person < shape.artists.size)) # 가창 아티스트는 탐색 완료 상태
+                contribution_rows.append((song_id, person + 1, role_ids[role]))
+        with db_engine.begin() as conn:
+            _insert_rows(conn, "songs", ("id", "mbid", "title", "artist", "album", "release_date", "source_url"),
+                         song_rows)
+            _insert_rows(conn, "persons", ("id", "name", "mbid", "is_explored"), person_rows)
+            _insert_rows(conn, "contributions", ("song_id", "person_id", "role_id"), contribution_rows)
+        contribution_count += len(contribution_rows)
+    timings["insert"] = time.perf_counter() - started
+
+    with Session(db_engine) as db:
+        phase_started = time.perf_counter()
+        pair_count = collaborators.rebuild_collaborator_pairs(db)
+        timings["collaborator_pairs"] = time.perf_counter() - phase_started
+
+        phase_started = time.perf_counter()
+        search_index.rebuild_search_index(db)
+        timings["search_index"] = time.perf_counter() - phase_started
+
+    with db_engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE") # 오래 쓴 DB처럼 쿼리 플래너 통계를 채웁니다.
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    db_engine.dispose()
+
+    return {
+        "generator_version": GENERATOR_VERSION,
+        "songs": songs,
+        "seed": seed,
+        "persons": len(inserted_persons),
+        "contributions": contribution_count,
+        "collaborator_pairs": pair_count,
+        "db_bytes": os.path.getsize(db_path),
+        "seconds": {phase: round(seconds, 2) for phase, seconds in timings.items()},
+    }
+
+
+def main():
+    songs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SONGS
+    db_path = sys.argv[2] if len(sys.argv) > 2 else f"synthetic-{songs}.db"
+    result = generate(db_path, songs)
+    print(f"{db_path}: 곡 {result['songs']:,}개, 인물 {result['persons']:,}명, 기여 관계 {result['contributions']:,}개, "
+          f"협업 쌍 {result['collaborator_pairs']:,}개, {result['db_bytes'] / 1024 ** 2:.1f} MiB")
+    print("  " + ", ".join(f"{phase} {seconds}s" for phase, seconds in result["seconds"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+백엔드 테스트 공통 fixture.
+
+실행 (backend 디렉토리에서):
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import migrations, models  # noqa: E402
+from app.database import create_db_engine  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """테스트마다 임시 디렉토리에 빈 SQLite DB를 만듭니다. (스키마는 만들지 않음)"""
+    db_engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    yield db_engine
+    db_engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """현재 모델로 만들고 마이그레이션까지 적용한 DB의 세션"""
+    models.Base.metadata.create_all(bind=engine)
+    migrations.run_migrations(engine)
+    with Session(engine) as session:
+        yield session
@@ -0,0 +1,123 @@
+import pytest
+from fastapi import HTTPException, Request
+
+from app.api_cache import SEARCH_TAG, ApiCache, MemoryCacheBackend, SQLiteCacheBackend, person_tag, song_tag
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryCacheBackend()
+    else:
+        backend = SQLiteCacheBackend(str(tmp_path / "api_cache.db"))
+    return ApiCache(backend)
+
+
+def _request(path: str, query: str = "", if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": headers})
+
+
+class _Endpoint:
+    """호출 횟수를 세는 compute 함수"""
+
+    def __init__(self, body: bytes, tags):
+        self.body = body
+        self.tags = set(tags)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.body, self.tags
+
+
+def test_cached_response_is_reused(cache):
+    compute = _Endpoint(b'{"id": 1}', [person_tag(1)])
+
+    first = cache.respond(_request("/persons/m1/collaborations"), compute)
+    second = cache.respond(_request("/persons/m1/collaborations"), compute)
+
+    assert compute.calls == 1
+    assert second.body == first.body == b'{"id": 1}'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_query_parameter_order_does_not_change_the_key(cache):
+    compute = _Endpoint(b"[]", [SEARCH_TAG])
+
+    cache.respond(_request("/search", "q=iu&limit=5"), compute)
+    cache.respond(_request("/search", "limit=5&q=iu"), compute)
+    cache.respond(_request("/search", "limit=6&q=iu"), compute)
+
+    assert compute.calls == 2
+
+
+def test_invalidate_removes_only_tagged_responses(cache):
+    person = _Endpoint(b"[1]", [person_tag(1), song_tag(10)])
+    other_person = _Endpoint(b"[2]", [person_tag(2)])
+    search = _Endpoint(b"[]", [SEARCH_TAG])
+    for path, compute in (("/p/1", person), ("/p/2", other_person), ("/search", search)):
+        cache.respond(_request(path), compute)
+
+    assert cache.invalidate(song_ids=[10], search=False) == 1
+
+    for path, compute in (("/p/1", person), ("/p/2", other_person), ("/search", search)):
+        cache.respond(_request(path), compute)
+    assert (person.calls, other_person.calls, search.calls) == (2, 1, 1)
+
+    cache.invalidate(person_ids=[2])
+    cache.respond(_request("/p/2"), other_person)
+    cache.respond(_request("/search"), search)
+    assert (other_person.calls, search.calls) == (2, 2)
+
+
+def test_response_computed_during_invalidation_is_not_stored(cache):
+    def compute():
+        cache.invalidate(person_ids=[1]) # 계산 중에 크롤러가 같은 인물을 갱신
+        return b"stale", {person_tag(1)}
+
+    cache.respond(_request("/p/1"), compute)
+    fresh = _Endpoint(b"fresh", [person_tag(1)])
+    assert cache.respond(_request("/p/1"), fresh).body == b"fresh"
+    assert fresh.calls == 1
+
+
+def test_errors_are_not_cached(cache):
+    def compute():
+        raise HTTPException(status_code=404, detail="not found")
+
+    with pytest.raises(HTTPException):
+        cache.respond(_request("/p/404"), compute)
+    found = _Endpoint(b"{}", [])
+    cache.respond(_request("/p/404"), found)
+    assert found.calls == 1
+
+
+def test_etag_revalidation(cache):
+    compute = _Endpoint(b'{"id": 1}', [person_tag(1)])
+    etag = cache.respond(_request("/p/1"), compute).headers["etag"]
+
+    not_modified = cache.respond(_request("/p/1", if_none_match=f'"other", {etag}'), compute)
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["etag"] == etag
+
+    cache.invalidate(person_ids=[1])
+    compute.body = b'{"id": 1, "changed": true}'
+    changed = cache.respond(_request("/p/1", if_none_match=etag), compute)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = ApiCache(MemoryCacheBackend(max_entries=2))
+    computes = [_Endpoint(str(i).encode(), []) for i in range(3)]
+    cache.respond(_request("/p/0"), computes[0])
+    cache.respond(_request("/p/1"), computes[1])
+    cache.respond(_request("/p/0"), computes[0]) # 0을 최근 사용으로
+    cache.respond(_request("/p/2"), computes[2]) # 1이 밀려남
+
+    cache.respond(_request("/p/0"), computes[0])
+    cache.respond(_request("/p/1"), computes[1])
+
+    assert [compute.calls for compute in computes] == [1, 2, 1]
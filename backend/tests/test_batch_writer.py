@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import batch_writer, models, schemas
+from app.identity_cache import PersonIdentityCache
+
+
+def _song(mbid, *contributors, role="vocal"):
+    return schemas.CrawledSongData(
+        title=f"Song {mbid}", artist="Artist", source_url=f"https://musicbrainz.org/recording/{mbid}", mbid=mbid,
+        contributions=[
+            schemas.ContributionData(person_name=f"Person {person_mbid}", person_mbid=person_mbid, role=role)
+            for person_mbid in contributors
+        ],
+    )
+
+
+def _contributions(db):
+    rows = (
+        db.query(models.Song.mbid, models.Person.mbid)
+        .join(models.Contribution, models.Contribution.song_id == models.Song.id)
+        .join(models.Person, models.Person.id == models.Contribution.person_id)
+        .all()
+    )
+    return {(song, person) for song, person in rows}
+
+
+def _fail_pages_with(monkeypatch, bad_mbid, error):
+    """bad_mbid가 들어 있는 트랜잭션에서만 INSERT 도중 error를 냅니다."""
+    insert_songs = batch_writer._insert_songs
+
+    def _insert(db, songs, transaction):
+        result = insert_songs(db, songs, transaction)
+        if any(song.mbid == bad_mbid for song in songs):
+            raise error
+        return result
+
+    monkeypatch.setattr(batch_writer, "_insert_songs", _insert)
+
+
+def test_page_is_written_once_and_existing_songs_are_skipped(db):
+    cache = PersonIdentityCache()
+    page = [_song("s1", "p1", "p2"), _song("s2", "p2"), _song("s1", "p3"), _song(None, "p4")]
+
+    result = batch_writer.write_song_page(db, page, cache)
+
+    assert (result["imported_song_count"], result["skipped_song_count"], result["failed_song_mbids"]) == (2, 2, [])
+    assert sorted(result["person_mbids"]) == ["p1", "p2", "p2"]
+    assert _contributions(db) == {("s1", "p1"), ("s1", "p2"), ("s2", "p2")} # 페이지 안의 중복 곡은 먼저 나온 곡만
+    assert db.query(models.Person).count() == 2
+    assert cache.get("p1", None) is not None
+
+    again = batch_writer.write_song_page(db, [_song("s1", "p1"), _song("s3", "p1")], cache)
+
+    assert (again["imported_song_count"], again["skipped_song_count"]) == (1, 1)
+    assert db.query(models.Person).count() == 2
+
+
+def test_failed_page_is_retried_song_by_song(db, monkeypatch):
+    cache = PersonIdentityCache()
+    _fail_pages_with(monkeypatch, "bad", OperationalError("INSERT", {}, Exception("disk I/O error")))
+
+    result = batch_writer.write_song_page(db, [_song("s1", "p1"), _song("bad", "p1", "p9"), _song("s2", "p2")], cache)
+
+    assert (result["imported_song_count"], result["failed_song_mbids"]) == (2, ["bad"])
+    assert sorted(result["song_ids"]) == sorted(song_id for (song_id,) in db.query(models.Song.id).all())
+    assert _contributions(db) == {("s1", "p1"), ("s2", "p2")}
+    # 롤백된 트랜잭션에서 만든 인물은 DB에도 공유 캐시에도 남지 않습니다.
+    assert cache.get("p9", None) is None
+    assert db.query(models.Person).filter(models.Person.mbid == "p9").count() == 0
+
+
+def test_unexpected_errors_roll_back_and_propagate(db, monkeypatch):
+    cache = PersonIdentityCache()
+    _fail_pages_with(monkeypatch, "bad", KeyboardInterrupt())
+
+    with pytest.raises(KeyboardInterrupt):
+        batch_writer.write_song_page(db, [_song("s1", "p1"), _song("bad", "p2")], cache)
+
+    assert db.query(models.Song).count() == 0
+    assert cache.get("p1", None) is None
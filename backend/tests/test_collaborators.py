@@ -0,0 +1,109 @@
+from sqlalchemy.orm import Session
+
+from app import collaborators, crud, models, roles, search_index
+
+
+def _pair_counts(db):
+    return {
+        (pair.person_id, pair.collaborator_id): pair.shared_song_count
+        for pair in db.query(models.CollaboratorPair).all()
+    }
+
+
+def _add_song(db, song_id: int, person_ids, role_id: int):
+    """협업 쌍을 먼저 갱신한 뒤 기여 관계를 저장합니다. (batch_writer와 같은 순서)"""
+    db.add(models.Song(id=song_id, title=f"Song {song_id}", artist="Hub", mbid=f"s{song_id}"))
+    collaborators.record_new_contributions(db, {song_id: set(person_ids)})
+    db.add_all(models.Contribution(song_id=song_id, person_id=person_id, role_id=role_id) for person_id in person_ids)
+    db.commit()
+
+
+def _setup(db):
+    role_id = roles.get_role_ids(db, ["작곡"])["작곡"]
+    db.add_all([
+        models.Person(id=1, name="Hub", mbid="p1"),
+        models.Person(id=2, name="Singer", mbid="p2"),
+        models.Person(id=3, name="Guitarist", mbid="p3"),
+        models.Person(id=4, name="Genius only", genius_id=4),
+    ])
+    db.flush()
+    _add_song(db, 10, [1, 2], role_id)
+    _add_song(db, 11, [1, 2, 3], role_id)
+    _add_song(db, 12, [1, 4], role_id)
+    return role_id
+
+
+def test_pairs_count_shared_songs_in_both_directions(db):
+    _setup(db)
+
+    assert _pair_counts(db) == {
+        (1, 2): 2, (2, 1): 2, (1, 3): 1, (3, 1): 1, (2, 3): 1, (3, 2): 1, (1, 4): 1, (4, 1): 1,
+    }
+
+
+def test_new_member_of_an_existing_song_is_counted_once(db):
+    role_id = _setup(db)
+
+    added, existing = collaborators.record_new_contributions(db, {11: {1, 2, 3, 4}})
+    db.add(models.Contribution(song_id=11, person_id=4, role_id=role_id))
+    db.commit()
+
+    assert added == {11: {4}} and existing[11] == {1, 2, 3}
+    counts = _pair_counts(db)
+    assert counts[(1, 4)] == counts[(4, 1)] == 2
+    assert counts[(1, 2)] == 2
+    assert collaborators.record_new_contributions(db, {11: {1, 2}}) == ({}, {11: {1, 2, 3, 4}})
+
+
+def test_rebuild_matches_incremental_updates(db):
+    _setup(db)
+    incremental = _pair_counts(db)
+
+    assert collaborators.rebuild_collaborator_pairs(db) == len(incremental)
+    assert _pair_counts(db) == incremental
+
+
+def test_collaboration_details_list_shared_songs_by_count(db):
+    _setup(db)
+
+    response = crud.get_collaboration_details_by_mbid(db, "p1")
+
+    assert [(detail.collaborator.name, [song.id for song in detail.songs]) for detail in response.collaborations] == [
+        ("Singer", [10, 11]), ("Guitarist", [11]),
+    ]
+    guitarist = crud.get_collaboration_details_by_mbid(db, "p3")
+    assert sorted(
+        (detail.collaborator.name, [song.id for song in detail.songs]) for detail in guitarist.collaborations
+    ) == [("Hub", [11]), ("Singer", [11])] # 협업 곡 수가 같으면 순서는 정해지지 않음
+
+
+def _genius_song(song_id: int, *artists):
+    return {"response": {"song": {
+        "title": f"Genius {song_id}", "artist_names": "Hub",
+        "primary_artist": {"id": artists[0], "name": f"Artist {artists[0]}"},
+        "featured_artists": [{"id": artist_id, "name": f"Artist {artist_id}"} for artist_id in artists[1:]],
+    }}}
+
+
+def test_genius_import_updates_pairs_and_search_then_invalidates_after_commit(db, engine, monkeypatch):
+    songs = {100: _genius_song(100, 7, 8), 101: _genius_song(101, 7, 9)}
+    monkeypatch.setattr(crud.genius_api, "get_song_details", songs.get)
+    invalidations = []
+
+    def _invalidate(song_ids=(), person_ids=(), search=True):
+        with Session(engine) as other: # 다른 세션에서 보여야 커밋된 것
+            committed = other.query(models.Contribution).filter(models.Contribution.song_id.in_(song_ids)).count()
+        invalidations.append((set(song_ids), set(person_ids), committed))
+
+    monkeypatch.setattr(crud.api_cache, "invalidate", _invalidate)
+
+    result = crud.batch_import_genius_songs(db, [100, 101, 100])
+
+    assert (result.imported_count, result.skipped_count, result.failed_ids) == (2, 1, [])
+    ids = {person.genius_id: person.id for person in db.query(models.Person).all()}
+    assert _pair_counts(db) == {
+        (ids[7], ids[8]): 1, (ids[8], ids[7]): 1, (ids[7], ids[9]): 1, (ids[9], ids[7]): 1,
+    }
+    assert [person_ids for _, person_ids, _ in invalidations] == [{ids[7], ids[8]}, {ids[7], ids[9]}]
+    assert all(committed == 2 for _, _, committed in invalidations)
+    assert search_index.search(db, "artist 7", search_index.PERSON) == [(ids[7], 2)]
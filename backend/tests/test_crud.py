@@ -0,0 +1,53 @@
+from app import crud, models, roles
+
+
+def _add_graph(db, song_count: int = 7):
+    role_id = roles.get_role_ids(db, ["작곡"])["작곡"]
+    db.add_all(models.Person(id=person_id, name=f"Person {person_id}", mbid=f"p{person_id}") for person_id in (1, 2))
+    for song_id in range(1, song_count + 1):
+        db.add(models.Song(id=song_id, title=f"Song {song_id}", mbid=f"s{song_id}"))
+        db.add(models.Contribution(song_id=song_id, person_id=1 + song_id % 2, role_id=role_id))
+    db.commit()
+
+
+def test_keyset_pages_cover_every_row_once(db):
+    _add_graph(db)
+
+    seen, after_id = [], 0
+    while page := crud.get_songs(db, limit=3, after_id=after_id):
+        seen.extend(song.id for song in page)
+        after_id = page[-1].id
+
+    assert seen == list(range(1, 8))
+
+
+def test_keyset_first_page_matches_offset_pagination(db):
+    _add_graph(db)
+
+    keyset = crud.get_persons(db, limit=1, after_id=0)
+    offset = crud.get_persons(db, skip=0, limit=1)
+
+    assert [person.id for person in keyset] == [person.id for person in offset] == [1]
+    assert [person.id for person in crud.get_persons(db, limit=5, after_id=1)] == [2]
+
+
+def test_keyset_is_not_shifted_by_deleted_rows(db):
+    _add_graph(db)
+    first_page = crud.get_songs(db, limit=3, after_id=0)
+    db.delete(db.get(models.Song, 2))
+    db.commit()
+
+    second_page = crud.get_songs(db, limit=3, after_id=first_page[-1].id)
+
+    assert [song.id for song in second_page] == [4, 5, 6]
+
+
+def test_pages_include_contributions(db):
+    _add_graph(db, song_count=2)
+
+    songs = crud.get_songs(db, limit=10, after_id=0)
+
+    assert [[contribution.person.name for contribution in song.contributions] for song in songs] == [
+        ["Person 2"], ["Person 1"],
+    ]
+    assert songs[0].contributions[0].role == "composer"
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from app.frontier import CLAIMED, DONE, FAILED, PENDING, ExplorationFrontier
+
+
+@pytest.fixture
+def frontier_path(tmp_path):
+    return str(tmp_path / "frontier.db")
+
+
+@pytest.fixture
+def frontier(frontier_path):
+    frontier = ExplorationFrontier(frontier_path, legacy_queue_file=None)
+    yield frontier
+    frontier.close()
+
+
+def _states(frontier):
+    return dict(frontier._conn.execute("SELECT mbid, state FROM frontier"))
+
+
+def test_pop_follows_priority_then_insertion_order(frontier):
+    frontier.add_many(["a", "b"])
+    frontier.push({"c": 5.0, "d": 1.0})
+
+    assert [frontier.pop() for _ in range(5)] == ["c", "d", "a", "b", None]
+    assert len(frontier) == 0
+
+
+def test_known_mbids_are_not_added_twice(frontier):
+    assert frontier.add_many(["a", "b", "a", "", None]) == 2
+    assert not frontier.add("a")
+    assert "a" in frontier and "z" not in frontier
+    assert len(frontier) == 2
+
+
+def test_push_updates_only_pending_priorities(frontier):
+    frontier.add_many(["a", "b", "c"])
+    claimed = frontier.pop()
+
+    assert frontier.push({"c": 10.0, claimed: 20.0, "new": 1.0}) == 1
+
+    assert [frontier.pop() for _ in range(3)] == ["c", "new", "b"]
+
+
+def test_state_transitions(frontier):
+    frontier.add_many(["a", "b", "c"])
+    a, b, c = frontier.pop(), frontier.pop(), frontier.pop()
+    frontier.mark_done(a)
+    frontier.mark_failed(b)
+    frontier.release(c)
+
+    assert _states(frontier) == {"a": DONE, "b": FAILED, "c": PENDING}
+    assert len(frontier) == 1
+    frontier.release("a") # 탐색 중이 아닌 항목은 그대로
+    assert len(frontier) == 1
+
+
+def test_mark_done_many_keeps_pending_count(frontier):
+    frontier.add_many(["a", "b", "c"])
+    claimed = frontier.pop()
+
+    frontier.mark_done_many([claimed, "b", "unknown"])
+
+    assert len(frontier) == 1
+    assert _states(frontier) == {"a": DONE, "b": DONE, "c": PENDING, "unknown": DONE}
+    assert not frontier.add("unknown")
+
+
+def test_requeue_returns_finished_items_to_pending(frontier):
+    frontier.add_many(["a", "b"])
+    frontier.mark_done_many(["a"])
+
+    assert frontier.requeue("a")
+    assert not frontier.requeue("b") # 이미 대기 중
+    assert frontier.requeue("new")
+    assert len(frontier) == 3
+
+
+def test_claimed_items_are_recovered_after_crash(frontier_path):
+    frontier = ExplorationFrontier(frontier_path, legacy_queue_file=None)
+    frontier.add_many(["a", "b", "c"])
+    frontier.pop()
+    frontier.pop()
+    frontier.mark_done("a")
+    frontier._conn.close() # close() 없이 종료된 것처럼 연결만 끊음
+
+    reopened = ExplorationFrontier(frontier_path, legacy_queue_file=None)
+    try:
+        assert CLAIMED not in _states(reopened).values()
+        assert _states(reopened) == {"a": DONE, "b": PENDING, "c": PENDING}
+        assert len(reopened) == 2
+        assert reopened.discovered_count() == 3
+        assert [reopened.pop(), reopened.pop()] == ["b", "c"]
+        reopened.add("d")
+        assert reopened.pop() == "d" # 재시작 후에도 추가 순서가 이어짐
+    finally:
+        reopened.close()
+
+
+def test_legacy_queue_file_is_migrated_once(tmp_path, frontier_path):
+    legacy_queue_file = tmp_path / "exploration_queue.json"
+    legacy_queue_file.write_text(json.dumps(["a", "b", "a"]), encoding="utf-8")
+
+    frontier = ExplorationFrontier(frontier_path, legacy_queue_file=str(legacy_queue_file))
+    try:
+        assert len(frontier) == 2
+        assert not legacy_queue_file.exists()
+        assert (tmp_path / "exploration_queue.json.migrated").exists()
+    finally:
+        frontier.close()
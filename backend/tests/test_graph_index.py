@@ -0,0 +1,61 @@
+import time
+
+from app import models, roles
+from app.graph_index import GraphIndexHolder
+
+
+def _add_contribution(db, song_id: int, person_id: int):
+    role_id = roles.get_role_ids(db, ["작곡"])["작곡"]
+    if db.get(models.Song, song_id) is None:
+        db.add(models.Song(id=song_id, title=f"Song {song_id}", mbid=f"s{song_id}"))
+    if db.get(models.Person, person_id) is None:
+        db.add(models.Person(id=person_id, name=f"Person {person_id}", mbid=f"p{person_id}"))
+    db.flush()
+    db.add(models.Contribution(song_id=song_id, person_id=person_id, role_id=role_id))
+    db.commit()
+
+
+def _wait_for_new_index(holder, db, old_index, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        index = holder.get(db)
+        if index is not old_index:
+            return index
+        time.sleep(0.01)
+    raise AssertionError("그래프 인덱스가 다시 만들어지지 않았습니다.")
+
+
+def test_index_is_kept_until_invalidated(db):
+    _add_contribution(db, 1, 1)
+    holder = GraphIndexHolder(refresh_seconds=0)
+    index = holder.get(db)
+    _add_contribution(db, 1, 2)
+
+    assert holder.get(db) is index
+    assert index.edge_count == 1
+
+
+def test_invalidate_rebuilds_in_background_and_serves_old_index_meanwhile(db):
+    _add_contribution(db, 1, 1)
+    holder = GraphIndexHolder(refresh_seconds=0)
+    old_index = holder.get(db)
+    _add_contribution(db, 1, 2)
+
+    holder.invalidate()
+
+    assert holder.get(db) is old_index
+    new_index = _wait_for_new_index(holder, db, old_index)
+    assert new_index.edge_count == 2
+    assert holder.get(db) is new_index
+
+
+def test_rebuild_waits_for_refresh_interval(db):
+    _add_contribution(db, 1, 1)
+    holder = GraphIndexHolder(refresh_seconds=3600)
+    index = holder.get(db)
+    _add_contribution(db, 1, 2)
+
+    holder.invalidate()
+
+    assert holder.get(db) is index
+    assert not holder._rebuilding
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from app import http_cache
+from app.http_cache import ResponseCache, cache_key, normalize_url
+
+URL = "https://musicbrainz.org/ws/2/recording?artist=a1&limit=100&fmt=json"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(http_cache, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / "cache" / "http_cache.db"))
+    yield response_cache
+    if response_cache._conn is not None:
+        response_cache._conn.close()
+
+
+def test_equivalent_urls_share_a_key():
+    assert normalize_url("HTTPS://MusicBrainz.org/ws/2/artist?fmt=json&query=iu") == \
+        "https://musicbrainz.org/ws/2/artist?fmt=json&query=iu"
+    assert cache_key(URL) == cache_key("https://musicbrainz.org/ws/2/recording?fmt=json&limit=100&artist=a1")
+    assert cache_key("https://api.genius.com/songs/1", {"b": 2, "a": 1, "c": None}) == \
+        cache_key("https://api.genius.com/songs/1?a=1&b=2")
+    assert cache_key(URL) != cache_key(URL.replace("a1", "a2"))
+
+
+def test_store_and_lookup_round_trip(cache, clock):
+    assert cache.lookup(URL) is None
+    body = b'{"recordings": []}' * 100
+    cache.store(URL, "musicbrainz:recording-browse", body, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    cached = cache.lookup(URL)
+
+    assert cached.body == body and cached.is_fresh
+    assert cached.conditional_headers() == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert os.path.getsize(cache.path) > 0
+
+
+def test_entries_expire_per_endpoint_and_revalidation_refreshes_them(cache, clock):
+    cache.store(URL, "musicbrainz:artist-search", b"search")
+    cache.store(URL + "&x=1", "musicbrainz:artist", b"artist")
+    clock.now += 2 * http_cache.DAY_SECONDS
+
+    stale = cache.lookup(URL)
+    assert stale.body == b"search" and not stale.is_fresh # 만료되어도 재검증/오프라인용으로 반환
+    assert cache.lookup(URL + "&x=1").is_fresh
+
+    cache.revalidated(URL, "musicbrainz:artist-search")
+    assert cache.lookup(URL).is_fresh
+
+
+def test_eviction_removes_least_recently_used_entries(cache, clock, monkeypatch):
+    monkeypatch.setattr(http_cache, "EVICTION_CHECK_INTERVAL", 1)
+    body = os.urandom(1000) # 압축되지 않는 본문
+    cache.max_bytes = 3500
+    for index in range(3):
+        clock.now += 1
+        cache.store(f"{URL}&page={index}", "musicbrainz:recording-browse", body)
+    clock.now += 1
+    cache.lookup(f"{URL}&page=0") # page=0을 최근 사용으로 만듦
+
+    clock.now += 1
+    cache.store(f"{URL}&page=3", "musicbrainz:recording-browse", body)
+
+    # 최대 용량의 90%가 될 때까지만, 가장 오래 사용되지 않은 항목부터 지웁니다.
+    remaining = {index for index in range(4) if cache.lookup(f"{URL}&page={index}") is not None}
+    assert remaining == {0, 2, 3}
+
+
+def test_clear(cache, clock):
+    cache.store(URL, "genius:song", b"{}")
+    cache.clear()
+
+    assert cache.lookup(URL) is None
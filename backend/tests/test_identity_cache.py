@@ -0,0 +1,109 @@
+import pytest
+
+from app import models
+from app.identity_cache import CachedPerson, PersonIdentityCache
+
+
+def _add_persons(db, *persons):
+    db.add_all(models.Person(id=person_id, name=name, mbid=mbid) for person_id, name, mbid in persons)
+    db.commit()
+
+
+def test_get_prefers_mbid_over_name():
+    cache = PersonIdentityCache()
+    cache.add(CachedPerson(1, "IU", "mbid-iu"))
+    cache.add(CachedPerson(2, "IU (2)", "mbid-other"))
+
+    assert cache.get("mbid-other", "IU").id == 2
+    assert cache.get("unknown-mbid", "IU").id == 1
+    assert cache.get(None, "IU").id == 1
+    assert cache.get("unknown-mbid", "unknown") is None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_names_match_exactly_like_the_db_lookup():
+    cache = PersonIdentityCache()
+    cache.add(CachedPerson(1, "IU", None))
+
+    assert cache.get(None, "iu") is None
+    assert cache.get(None, " IU") is None
+
+
+def test_resolution_does_not_depend_on_eviction(db):
+    _add_persons(db, (1, "IU", None), (2, "iu", None), (3, "Other", None))
+    cache = PersonIdentityCache(max_entries=2)
+
+    for _ in range(3):
+        for name, person_id in (("IU", 1), ("iu", 2)):
+            cache.prefetch(db, [(None, name)])
+            assert cache.get(None, name).id == person_id
+        cache.prefetch(db, [(None, "Other")]) # 앞의 항목을 캐시에서 밀어냄
+
+
+def test_prefetch_loads_only_missing_entries(db):
+    _add_persons(db, (1, "IU", "mbid-iu"), (2, "Suga", "mbid-suga"))
+    cache = PersonIdentityCache()
+
+    assert cache.prefetch(db, [("mbid-iu", "IU"), (None, "Suga"), ("mbid-none", "Nobody")]) == 2
+    assert cache.prefetch(db, [("mbid-iu", "IU"), (None, "Suga")]) == 0
+    assert cache.get("mbid-suga", None).name == "Suga"
+
+
+def _row(person_id, name, mbid=None):
+    return models.Person(id=person_id, name=name, mbid=mbid)
+
+
+def test_transaction_entries_are_shared_only_after_commit():
+    cache = PersonIdentityCache()
+    with cache.transaction() as transaction:
+        transaction.add_model(_row(1, "New", "m1"))
+        assert transaction.get("m1", None).id == 1
+        assert cache.get("m1", "New") is None # 다른 writer에게는 커밋 전까지 보이지 않음
+        transaction.commit()
+
+    assert cache.get("m1", None).id == 1
+
+
+def test_transaction_prefers_mbid_over_a_shared_name():
+    cache = PersonIdentityCache()
+    cache.add(CachedPerson(1, "IU", "m-old"))
+    with cache.transaction() as transaction:
+        transaction.add_model(_row(2, "IU 2", "m-new"))
+
+        assert transaction.get("m-new", "IU").id == 2
+        assert transaction.get("m-unknown", "IU").id == 1
+
+
+def test_rollback_of_one_writer_does_not_touch_another():
+    cache = PersonIdentityCache()
+    with cache.transaction() as first, cache.transaction() as second:
+        first.add_model(_row(1, "First", "m1"))
+        second.add_model(_row(2, "Second", "m2"))
+        second.commit()
+        first.rollback()
+        assert first.get("m2", None).id == 2
+
+    assert cache.get("m1", "First") is None
+    assert cache.get("m2", None).id == 2
+
+
+def test_exception_discards_uncommitted_entries():
+    cache = PersonIdentityCache()
+    with pytest.raises(KeyboardInterrupt):
+        with cache.transaction() as transaction:
+            transaction.add_model(_row(1, "Lost", "m1"))
+            raise KeyboardInterrupt
+
+    assert cache.get("m1", "Lost") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = PersonIdentityCache(max_entries=2)
+    cache.add(CachedPerson(1, "A", None))
+    cache.add(CachedPerson(2, "B", None))
+    cache.get(None, "A")
+    cache.add(CachedPerson(3, "C", None))
+
+    assert cache.get(None, "A") is not None
+    assert cache.get(None, "B") is None
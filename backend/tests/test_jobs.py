@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+from app.database import db_file_size_bytes
+from app.jobs import COMPLETED, JobConflictError, JobRegistry
+
+
+def _blocking_target(release: threading.Event):
+    def run(job):
+        release.wait(5)
+        return {"status": "completed"}
+    return run
+
+
+def _wait_finished(job, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while job.status != COMPLETED and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return job.status
+
+
+def test_any_active_job_rejects_new_jobs():
+    registry = JobRegistry()
+    release = threading.Event()
+    exploration = registry.submit("exploration", {}, _blocking_target(release))
+    try:
+        with pytest.raises(JobConflictError) as conflict:
+            registry.submit("musicbrainz-dump", {}, _blocking_target(release))
+        assert conflict.value.job is exploration
+    finally:
+        release.set()
+    assert _wait_finished(exploration) == COMPLETED
+    registry.shutdown()
+
+    assert [job.kind for job in registry.list()] == ["exploration"]
+
+
+def test_finished_jobs_do_not_block_new_ones():
+    registry = JobRegistry()
+    first = registry.submit("exploration", {}, lambda job: {"status": "completed"})
+    assert _wait_finished(first) == COMPLETED
+
+    dump = registry.submit("musicbrainz-dump", {}, lambda job: {"status": "completed"})
+
+    assert _wait_finished(dump) == COMPLETED
+    registry.shutdown()
+
+
+def test_db_size_includes_wal_file(tmp_path):
+    db_path = tmp_path / "kpop.db"
+    assert db_file_size_bytes(str(db_path)) == 0
+    db_path.write_bytes(b"x" * 100)
+    (tmp_path / "kpop.db-wal").write_bytes(b"x" * 40)
+
+    assert db_file_size_bytes(str(db_path)) == 140
+    assert db_file_size_bytes(None) == 0
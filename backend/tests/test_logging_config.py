@@ -0,0 +1,34 @@
+import logging
+import queue
+
+from app import metrics
+from app.logging_config import _DroppingQueueHandler
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _record(level, message, *args):
+    return logging.LogRecord("app.test", level, __file__, 1, message, args, None)
+
+
+def test_full_queue_drops_only_records_below_warning():
+    log_queue = queue.Queue(1)
+    fallback = _Capture()
+    handler = _DroppingQueueHandler(log_queue, fallback)
+    dropped = metrics.LOG_RECORDS_DROPPED.value(level="INFO")
+
+    handler.handle(_record(logging.INFO, "queued %s", 1))
+    handler.handle(_record(logging.INFO, "dropped"))
+    handler.handle(_record(logging.WARNING, "written by the caller %s", "thread"))
+    handler.handle(_record(logging.ERROR, "also written"))
+
+    assert [log_queue.get_nowait().getMessage()] == ["queued 1"] # 인자는 큐에 넣기 전에 합쳐짐
+    assert fallback.messages == ["written by the caller thread", "also written"]
+    assert metrics.LOG_RECORDS_DROPPED.value(level="INFO") == dropped + 1
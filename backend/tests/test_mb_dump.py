@@ -0,0 +1,134 @@
+import gzip
+import io
+import json
+import tarfile
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app import mb_dump, models
+from app.services import MusicDataService
+
+
+def _artist(mbid: str):
+    return {"id": mbid, "name": f"Artist {mbid}"}
+
+
+def _recording(mbid: str, credited, related=(), works=()):
+    return {
+        "id": mbid,
+        "title": f"Song {mbid}",
+        "artist-credit": [{"artist": _artist(artist_id)} for artist_id in credited],
+        "relations": [
+            {"target-type": "artist", "type": "producer", "artist": _artist(artist_id)} for artist_id in related
+        ] + [{"target-type": "work", "work": {"id": work_id}} for work_id in works],
+    }
+
+
+RECORDINGS = [
+    _recording("r1", ["a1", "a2"], related=["a3"], works=["w1"]), # 시드의 곡 (hop 1)
+    _recording("r2", ["a2"]), # 함께 부른 아티스트의 곡 (hop 2)
+    _recording("r3", ["a3"]), # 직접 관계(프로듀서)로 연결된 아티스트의 곡 (hop 2)
+    _recording("r4", ["a9"], works=["w2"]), # 범위 밖
+    _recording("r6", ["a6"]),
+]
+WORKS = [
+    {"id": "w1", "relations": [{"target-type": "artist", "type": "composer", "artist": _artist("a5")}]},
+    {"id": "w2", "relations": [{"target-type": "artist", "type": "lyricist", "artist": _artist("a9")}]},
+]
+ARTISTS = [
+    {"id": "a6", "name": "Artist a6", "area": {"name": "Seoul"}},
+    {"id": "a9", "name": "Artist a9", "area": {"name": "Busan"}},
+]
+
+
+def _lines(entities) -> bytes:
+    # 잘못된 줄과 빈 줄은 건너뛰어야 합니다.
+    return ("not json\n\n" + "".join(json.dumps(entity) + "\n" for entity in entities)).encode("utf-8")
+
+
+def _write_tar(path, entity: str, entities, mode: str):
+    data = _lines(entities)
+    with tarfile.open(path, mode) as archive:
+        info = tarfile.TarInfo("mbdump/README")
+        info.size = 2
+        archive.addfile(info, io.BytesIO(b"hi"))
+        info = tarfile.TarInfo(f"mbdump/{entity}")
+        info.size = len(data)
+        archive.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+@pytest.fixture
+def dumps(tmp_path):
+    artist_path = tmp_path / "artist.gz"
+    with gzip.open(artist_path, "wb") as artist_file:
+        artist_file.write(_lines(ARTISTS))
+    return {
+        "recording_path": _write_tar(tmp_path / "recording.tar.xz", "recording", RECORDINGS, "w:xz"),
+        "work_path": _write_tar(tmp_path / "work.tar.gz", "work", WORKS, "w:gz"),
+        "artist_path": str(artist_path),
+    }
+
+
+def _import(db, engine, dumps, **options):
+    importer = mb_dump.DumpImporter(MusicDataService(), session_factory=sessionmaker(bind=engine), **dumps, **options)
+    result = importer.run()
+    db.expire_all()
+    return importer, result
+
+
+def _contributions(db):
+    rows = (
+        db.query(models.Song.mbid, models.Person.mbid, models.Role.name)
+        .join(models.Contribution, models.Contribution.song_id == models.Song.id)
+        .join(models.Person, models.Person.id == models.Contribution.person_id)
+        .join(models.Role, models.Role.id == models.Contribution.role_id)
+        .all()
+    )
+    return {(song, person, role) for song, person, role in rows}
+
+
+def test_streams_entities_from_tar_and_compressed_files(dumps):
+    assert [recording["id"] for recording in mb_dump.iter_dump_entities(dumps["recording_path"], "recording")] == [
+        "r1", "r2", "r3", "r4", "r6",
+    ]
+    assert [artist["id"] for artist in mb_dump.iter_dump_entities(dumps["artist_path"], "artist")] == ["a6", "a9"]
+    with pytest.raises(FileNotFoundError):
+        list(mb_dump.open_dump_lines(dumps["recording_path"], "work"))
+
+
+def test_expands_seed_by_hops_and_attaches_work_relations(db, engine, dumps):
+    importer, result = _import(db, engine, dumps, seed_artist_mbids=["a1"], hops=2, page_size=2)
+
+    assert result["status"] == "completed"
+    assert (result["explored_artists"], result["imported_song_count"], result["failed_song_count"]) == (3, 3, 0)
+    assert importer.pages_written == 2 # 3곡을 2곡씩 나누어 저장
+    assert _contributions(db) == {
+        ("r1", "a1", "vocal"), ("r1", "a2", "vocal"), ("r1", "a3", "producer"), ("r1", "a5", "composer"),
+        ("r2", "a2", "vocal"), ("r3", "a3", "vocal"),
+    }
+    explored = {mbid for (mbid,) in db.query(models.Person.mbid).filter(models.Person.is_explored).all()}
+    assert explored == {"a1", "a2", "a3"} # 작품 관계로만 연결된 작곡가는 탐색 완료가 아님
+
+
+def test_single_hop_imports_only_seed_recordings(db, engine, dumps):
+    _, result = _import(db, engine, dumps, seed_artist_mbids=["a1"], hops=1)
+
+    assert result["imported_song_count"] == 1
+    assert {song for song, _, _ in _contributions(db)} == {"r1"}
+
+
+def test_seeds_from_artist_areas_and_skips_existing_songs(db, engine, dumps):
+    _import(db, engine, dumps, seed_areas=["seoul"], hops=1)
+    _, result = _import(db, engine, dumps, seed_areas=["SEOUL"], hops=1)
+
+    assert result["imported_song_count"] == 0
+    assert _contributions(db) == {("r6", "a6", "vocal")}
+
+
+def test_without_seeds_nothing_is_written(db, engine, dumps):
+    _, result = _import(db, engine, dumps, hops=2)
+
+    assert result["status"] == "failed"
+    assert db.query(models.Song).count() == 0
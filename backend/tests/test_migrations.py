@@ -0,0 +1,105 @@
+from sqlalchemy import inspect, text
+
+from app import migrations, models
+
+# 마이그레이션 도입 전 스키마: 기여 관계가 역할 문자열을 기본 키에 포함하고, roles 테이블이 없음
+LEGACY_CONTRIBUTIONS_DDL = """
+    CREATE TABLE contributions (
+        song_id INTEGER NOT NULL REFERENCES songs (id),
+        person_id INTEGER NOT NULL REFERENCES persons (id),
+        role VARCHAR NOT NULL,
+        PRIMARY KEY (song_id, person_id, role)
+    )
+"""
+
+
+def _create_legacy_db(engine):
+    models.Song.__table__.create(engine)
+    models.Person.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(text(LEGACY_CONTRIBUTIONS_DDL))
+        conn.execute(text("INSERT INTO songs (id, title, mbid) VALUES (1, 'Song A', 's1'), (2, 'Song B', 's2')"))
+        conn.execute(text("INSERT INTO persons (id, name, mbid) VALUES (1, 'Composer', 'p1'), (2, 'Guitarist', 'p2')"))
+        conn.execute(text(
+            "INSERT INTO contributions (song_id, person_id, role) VALUES "
+            "(1, 1, '작곡'), (1, 1, 'composer'), (2, 1, '작곡'), "
+            "(1, 2, 'Instrument (guitar, Bass)'), (2, 2, 'instrument (bass, guitar)')"
+        ))
+
+
+def _contributions(engine):
+    with engine.connect() as conn:
+        return set(conn.execute(text(
+            "SELECT c.song_id, c.person_id, r.name FROM contributions AS c JOIN roles AS r ON r.id = c.role_id"
+        )).all())
+
+
+def test_fresh_db_records_all_versions(engine):
+    models.Base.metadata.create_all(bind=engine)
+
+    applied = migrations.run_migrations(engine)
+
+    assert applied == [migration.version for migration in migrations.MIGRATIONS]
+    assert migrations.run_migrations(engine) == []
+
+
+def test_legacy_db_is_upgraded_to_role_ids(engine):
+    _create_legacy_db(engine)
+
+    assert migrations.run_migrations(engine) == [1, 2, 3, 4]
+
+    inspector = inspect(engine)
+    assert "contributions_legacy" not in inspector.get_table_names()
+    columns = {column["name"] for column in inspector.get_columns("contributions")}
+    assert "role" not in columns and "role_id" in columns
+    assert {"base_role", "attributes", "category"} <= {column["name"] for column in inspector.get_columns("roles")}
+    # v3: 출처/표기가 달라도 같은 역할은 하나로 합쳐지고, 합쳐진 중복 기여 관계는 한 행만 남습니다.
+    assert _contributions(engine) == {
+        (1, 1, "composer"), (2, 1, "composer"),
+        (1, 2, "instrument (bass, guitar)"), (2, 2, "instrument (bass, guitar)"),
+    }
+
+
+def test_legacy_db_gets_traversal_indexes(engine):
+    _create_legacy_db(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_persons_explored_mbid"))
+
+    migrations.run_migrations(engine)
+
+    inspector = inspect(engine)
+    assert "ix_contributions_person_song" in {index["name"] for index in inspector.get_indexes("contributions")}
+    assert "ix_persons_explored_mbid" in {index["name"] for index in inspector.get_indexes("persons")}
+
+
+def test_interrupted_role_migration_resumes_from_legacy_table(engine):
+    _create_legacy_db(engine)
+    # v1의 테이블 이름 변경 직후 중단된 상태 (SQLite DDL은 트랜잭션으로 되돌려지지 않음)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE contributions RENAME TO contributions_legacy"))
+
+    assert migrations.run_migrations(engine) == [1, 2, 3, 4]
+    assert "contributions_legacy" not in inspect(engine).get_table_names()
+    assert len(_contributions(engine)) == 4
+
+
+def test_applied_versions_are_recorded(engine):
+    _create_legacy_db(engine)
+    migrations.run_migrations(engine)
+
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT version, name FROM schema_migrations ORDER BY version")).all()
+    assert rows == [(migration.version, migration.name) for migration in migrations.MIGRATIONS]
+
+
+def test_collaborator_song_id_lists_are_dropped(engine):
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE collaborator_pairs ADD COLUMN song_ids TEXT NOT NULL DEFAULT ''"))
+        conn.execute(text("INSERT INTO collaborator_pairs VALUES (1, 2, 3, '1,2,3')"))
+
+    migrations.run_migrations(engine)
+
+    assert "song_ids" not in {column["name"] for column in inspect(engine).get_columns("collaborator_pairs")}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT * FROM collaborator_pairs")).all() == [(1, 2, 3)]
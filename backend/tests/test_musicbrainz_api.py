@@ -0,0 +1,184 @@
+import json
+
+import pytest
+
+from app import musicbrainz_api
+from app.musicbrainz_api import RecordingPage
+
+BODY = json.dumps({
+    "recording-count": 3,
+    "recording-offset": 0,
+    "recordings": [
+        {"id": "r1", "title": "One", "length": 1.5, "relations": [{"target-type": "work", "work": {"id": "w1"}}]},
+        {"id": "r2", "title": "Two", "artist-credit": [{"artist": {"id": "a1", "name": "A"}}]},
+        {"id": "r3", "title": "Three"},
+    ],
+}).encode("utf-8")
+
+
+@pytest.fixture(params=[False, True], ids=["loads", "streaming"])
+def streaming(request, monkeypatch):
+    monkeypatch.setattr(musicbrainz_api, "_use_streaming_json", request.param)
+    monkeypatch.setattr(musicbrainz_api, "STREAMING_JSON_MIN_BYTES", 0)
+    return request.param
+
+
+def test_page_yields_recordings_and_count(streaming):
+    page = RecordingPage.from_body(BODY)
+
+    assert page and page.count == 3
+    assert list(page) == json.loads(BODY)["recordings"]
+    assert list(page) == [] # 한 번만 순회 가능
+
+
+def test_empty_page(streaming):
+    page = RecordingPage.from_body(b'{"recording-count": 0, "recordings": []}')
+
+    assert not page and page.count == 0
+
+
+def test_streaming_parses_body_once(monkeypatch):
+    monkeypatch.setattr(musicbrainz_api, "_use_streaming_json", True)
+    monkeypatch.setattr(musicbrainz_api, "STREAMING_JSON_MIN_BYTES", 0)
+    calls = []
+    for name in ("items", "basic_parse"):
+        original = getattr(musicbrainz_api.ijson, name)
+        monkeypatch.setattr(musicbrainz_api.ijson, name,
+                            lambda *args, _name=name, _original=original, **kwargs: calls.append(_name) or _original(*args, **kwargs))
+
+    assert [recording["id"] for recording in RecordingPage.from_body(BODY)] == ["r1", "r2", "r3"]
+    assert calls == ["items"] # recording-count는 본문 앞부분에서만 읽음
+
+
+def test_broken_body_raises_value_error_and_is_not_reported_as_parsed(streaming):
+    with pytest.raises(ValueError):
+        RecordingPage.from_body(b"<html>502 Bad Gateway</html>")
+
+    truncated = BODY[:BODY.index(b'"r2"')]
+    if not streaming:
+        with pytest.raises(ValueError):
+            RecordingPage.from_body(truncated)
+        return
+    page = RecordingPage.from_body(truncated)
+    parsed = []
+    page.after_parsed(lambda: parsed.append(True))
+    with pytest.raises(ValueError):
+        list(page)
+    assert parsed == []
+
+
+def test_after_parsed_runs_once_the_whole_page_is_read(streaming):
+    page = RecordingPage.from_body(BODY)
+    parsed = []
+    page.after_parsed(lambda: parsed.append(True))
+
+    assert parsed == ([] if streaming else [True])
+    list(page)
+    assert parsed == [True]
+
+
+class _Response:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _Cache:
+    def __init__(self):
+        self.stored = []
+
+    def lookup(self, url, params=None):
+        return None
+
+    def store(self, url, endpoint, body, headers=None, params=None):
+        self.stored.append(url)
+
+
+def test_streamed_page_is_cached_only_after_it_is_fully_parsed(streaming, monkeypatch):
+    cache = _Cache()
+    monkeypatch.setattr(musicbrainz_api, "response_cache", cache)
+    monkeypatch.setattr(musicbrainz_api.rate_limiter, "acquire", lambda: 0.0)
+    monkeypatch.setattr(musicbrainz_api.http_session, "get", lambda url, **kwargs: _Response(BODY))
+
+    page = musicbrainz_api.get_artist_recordings("a1", limit=3)
+
+    assert len(cache.stored) == (0 if streaming else 1)
+    assert len(list(page)) == 3
+    assert len(cache.stored) == 1
+
+
+class _Artist:
+    """아티스트 한 명의 Recording 목록을 흉내내고, 보낸 요청을 (종류, offset, limit)으로 기록합니다."""
+
+    def __init__(self, monkeypatch, recording_count: int):
+        self.mbids = [f"r{index}" for index in range(recording_count)]
+        self.requests = []
+        monkeypatch.setattr(musicbrainz_api, "get_artist_recordings", self._recordings)
+        monkeypatch.setattr(musicbrainz_api, "get_artist_recording_ids", self._recording_ids)
+
+    def _slice(self, offset, limit):
+        return [{"id": mbid} for mbid in self.mbids[offset:offset + limit]]
+
+    def _recordings(self, artist_mbid, limit=100, offset=0, usage=None):
+        self.requests.append(("full", offset, limit))
+        return RecordingPage(self._slice(offset, limit), len(self.mbids))
+
+    def _recording_ids(self, artist_mbid, limit=100, offset=0, usage=None):
+        self.requests.append(("ids", offset, limit))
+        return {"recording-count": len(self.mbids), "recordings": self._slice(offset, limit)}
+
+
+def _drain(planner):
+    pages = []
+    while (page := planner.next_page()) is not None:
+        recordings = list(page)
+        pages.append([recording["id"] for recording in recordings])
+        planner.record_imported(len(recordings))
+    return pages
+
+
+def test_planner_trims_page_to_song_limit_and_skips_trailing_empty_page(monkeypatch):
+    artist = _Artist(monkeypatch, recording_count=30)
+    planner = musicbrainz_api.RecordingFetchPlanner("a1", song_limit=50, page_limit=100)
+
+    assert [len(page) for page in _drain(planner)] == [30]
+    assert artist.requests == [("full", 0, 50)]
+    assert planner.report()["requests_saved"] == 1
+
+
+def test_planner_stops_at_song_limit(monkeypatch):
+    artist = _Artist(monkeypatch, recording_count=250)
+    planner = musicbrainz_api.RecordingFetchPlanner("a1", song_limit=120, page_limit=100)
+
+    assert [len(page) for page in _drain(planner)] == [100, 20]
+    assert artist.requests == [("full", 0, 100), ("full", 100, 20)]
+
+
+def test_planner_skips_pages_already_in_the_db(monkeypatch):
+    artist = _Artist(monkeypatch, recording_count=200)
+    known = set(artist.mbids[:70])
+    planner = musicbrainz_api.RecordingFetchPlanner(
+        "a1", song_limit=50, page_limit=50, known_song_count=len(known), find_known_mbids=lambda mbids: mbids & known,
+    )
+
+    pages = _drain(planner)
+
+    # 0~49: 모두 저장됨 → 건너뜀, 50~99: 일부만 저장됨 → inc 포함 요청, 이후 DB의 곡을 모두 확인했으므로 확인 요청 없음
+    assert artist.requests == [("ids", 0, 50), ("ids", 50, 50), ("full", 50, 50)]
+    assert pages == [artist.mbids[50:100]]
+    assert planner.report()["pages_skipped"] == 1
+
+
+def test_planner_stops_when_light_page_is_empty(monkeypatch):
+    artist = _Artist(monkeypatch, recording_count=0)
+    planner = musicbrainz_api.RecordingFetchPlanner(
+        "a1", song_limit=50, page_limit=100, known_song_count=5, find_known_mbids=lambda mbids: set(),
+    )
+
+    assert _drain(planner) == []
+    assert artist.requests == [("ids", 0, 50)]
@@ -0,0 +1,142 @@
+"""
+자주 호출되는 조회 함수들의 쿼리 계획 회귀 검사.
+
+작은 DB를 만든 뒤 각 함수가 실행하는 SQL을 모두 모아 `EXPLAIN QUERY PLAN`을 확인합니다.
+테이블 전체를 읽는 단계(`SCAN <테이블>`)가 있으면 실패합니다.
+(인덱스만 읽는 `USING COVERING INDEX`도 전체를 훑는다면 실패입니다.)
+"""
+import re
+
+import pytest
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import sessionmaker
+
+from app import batch_writer, collaborators, crud, graph_index, migrations, models, schemas, search_index
+from app.database import create_db_engine
+from app.identity_cache import PersonIdentityCache
+
+PAGES = 5
+SONGS_PER_PAGE = 40
+SCAN_PATTERN = re.compile(r"^SCAN (\w+)")
+# FTS5 가상 테이블이 MATCH 조건으로 자체 색인을 쓰는 경우 (예: 'VIRTUAL TABLE INDEX 0:M2')
+VIRTUAL_INDEX_PATTERN = re.compile(r"VIRTUAL TABLE INDEX \d+:\S+")
+# 행 수가 작아 전체 읽기가 문제 되지 않는 테이블
+SMALL_TABLES = {"roles"}
+
+
+def _populate(session_factory):
+    db = session_factory()
+    person_cache = PersonIdentityCache()
+    for page in range(PAGES):
+        batch_writer.write_song_page(db, [
+            schemas.CrawledSongData(
+                title=f"Song {page}-{i}", artist="Bench", source_url="https://musicbrainz.org/",
+                mbid=f"song-{page}-{i}",
+                contributions=[
+                    schemas.ContributionData(person_name=f"Person {p}", person_mbid=f"person-{p}", role=role)
+                    for p, role in (((page * 7 + i) % 50, "vocals"), ((i * 3) % 50, "composer"), (i % 11, "producer"))
+                ],
+            )
+            for i in range(SONGS_PER_PAGE)
+        ], person_cache)
+    search_index.ensure_search_index(db)
+    # 운영 DB처럼 ANALYZE 통계 없이 검사합니다. (통계가 있으면 작은 테이블은 일부러 전체 읽기를 고를 수 있음)
+    db.close()
+
+
+def _exhaust(iterator, count: int = 1):
+    for _ in zip(range(count), iterator):
+        pass
+
+
+# (이름, 실행 함수, 전체 읽기를 허용하는 테이블과 이유)
+HOT_QUERIES = [
+    ("get_person_by_mbid", lambda db: crud.get_person_by_mbid(db, "person-1"), {}),
+    ("get_persons_by_mbids_or_names",
+     lambda db: crud.get_persons_by_mbids_or_names(db, {"person-1", "person-2"}, {"Person 3"}), {}),
+    ("get_person_crawl_stats", lambda db: crud.get_person_crawl_stats(db, {"person-1", "person-2"}), {}),
+    ("get_persons (keyset, contributions)", lambda db: crud.get_persons(db, limit=20, after_id=5), {}),
+    ("get_songs (keyset, contributions)", lambda db: crud.get_songs(db, limit=20, after_id=5), {}),
+    ("get_song_by_mbid", lambda db: crud.get_song_by_mbid(db, "song-0-1"), {}),
+    ("get_song_ids_by_mbids", lambda db: crud.get_song_ids_by_mbids(db, {"song-0-1", "song-1-2"}), {}),
+    ("get_song_graph_details_by_mbid", lambda db: crud.get_song_graph_details_by_mbid(db, "song-0-1"), {}),
+    ("get_collaboration_details_by_mbid", lambda db: crud.get_collaboration_details_by_mbid(db, "person-1"), {}),
+    ("Person.contributions (lazy load)",
+     lambda db: [c.song for c in crud.get_person_by_mbid(db, "person-1").contributions], {}),
+    ("search_persons_by_name", lambda db: crud.search_persons_by_name(db, "person 1", limit=5), {}),
+    ("search_songs_by_title", lambda db: crud.search_songs_by_title(db, "song", limit=5), {}),
+    ("iter_songs_for_export", lambda db: _exhaust(crud.iter_songs_for_export(db)), {}),
+    ("iter_persons_for_export", lambda db: _exhaust(crud.iter_persons_for_export(db)), {}),
+    ("collaborators._existing_members", lambda db: collaborators._existing_members(db, [1, 2, 3]), {}),
+    ("graph neighbourhood", lambda db: graph_index.get_neighbourhood(db, "person", "person-1", hops=2), {
+        # 그래프 인덱스는 생성 시 기여 관계 전체를 한 번 읽습니다. (메모리 인덱스)
+        "contributions": "graph index build",
+        "roles": "graph index build",
+    }),
+]
+
+
+def _plan_scans(conn, statement: str, parameters, tables):
+    """statement의 쿼리 계획에서 실제 테이블을 전체 읽는 단계를 반환합니다."""
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    scans = []
+    for row in rows:
+        detail = row[-1]
+        match = SCAN_PATTERN.match(detail)
+        if match and match.group(1) in tables and not VIRTUAL_INDEX_PATTERN.search(detail):
+            scans.append((match.group(1), detail))
+    return scans
+
+
+@pytest.fixture(scope="module")
+def plans_engine(tmp_path_factory):
+    engine = create_db_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+    models.Base.metadata.create_all(bind=engine)
+    migrations.run_migrations(engine)
+    _populate(sessionmaker(bind=engine, autoflush=False))
+    yield engine
+    engine.dispose()
+
+
+def _select_statements(engine, run):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    db = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        run(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        db.close()
+    return statements
+
+
+@pytest.mark.parametrize("run, allowed", [(run, allowed) for _, run, allowed in HOT_QUERIES],
+                         ids=[name for name, _, _ in HOT_QUERIES])
+def test_hot_query_does_not_scan_tables(plans_engine, monkeypatch, run, allowed):
+    monkeypatch.setattr(graph_index, "graph_index", graph_index.GraphIndexHolder()) # 그래프 인덱스 생성 쿼리까지 확인
+    statements = _select_statements(plans_engine, run)
+    tables = set(inspect(plans_engine).get_table_names())
+
+    problems = []
+    with plans_engine.connect() as conn:
+        for statement, parameters in statements:
+            for table, detail in _plan_scans(conn, statement, parameters, tables):
+                if table not in allowed and table not in SMALL_TABLES:
+                    problems.append((detail, " ".join(statement.split())[:160]))
+
+    assert statements
+    assert problems == []
+
+
+def test_plan_check_reports_table_scans(plans_engine):
+    tables = set(inspect(plans_engine).get_table_names())
+    with plans_engine.connect() as conn:
+        assert _plan_scans(conn, "SELECT id FROM songs WHERE source_url = ?", ("x",), tables) == [
+            ("songs", "SCAN songs"),
+        ]
+        assert _plan_scans(conn, "SELECT id FROM songs WHERE mbid = ?", ("song-0-1",), tables) == []
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from app import rate_limit
+from app.rate_limit import AdaptiveRateLimiter, TokenBucket, parse_retry_after
+
+
+class _Clock:
+    """`time.sleep`이 시계를 그만큼 앞으로 옮기는 가짜 시계. on_sleep으로 대기 중 다른 스레드의 호출을 흉내냅니다."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.on_sleep = None
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        if self.on_sleep is not None:
+            callback, self.on_sleep = self.on_sleep, None
+            callback()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def test_bucket_spaces_requests_by_rate(clock):
+    bucket = TokenBucket(rate=2.0, capacity=1)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+    clock.now += 10 # 오래 쉬어도 capacity보다 많이 쌓이지 않음
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquired_count == 4
+
+
+def test_reservations_are_served_in_order():
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    now = bucket._updated_at
+
+    assert [bucket._reserve(1, now) for _ in range(3)] == [0.0, 1.0, 2.0]
+
+
+def test_pause_delays_the_next_request(clock):
+    limiter = AdaptiveRateLimiter(rate=10.0)
+    limiter.acquire()
+
+    limiter.pause(5)
+
+    assert limiter.acquire() == pytest.approx(5.1)
+
+
+def test_pause_during_a_wait_extends_it(clock):
+    limiter = AdaptiveRateLimiter(rate=1.0)
+    limiter.acquire()
+    clock.on_sleep = lambda: limiter.pause(3) # 대기 중에 다른 워커가 스로틀링 응답을 받음
+
+    waited = limiter.acquire()
+
+    assert waited == pytest.approx(4.0) # 예약된 1초 + 정지 3초
+    assert clock.sleeps == [pytest.approx(1.0), pytest.approx(3.0)]
+
+
+def test_throttle_halves_rate_down_to_min_and_success_recovers(clock):
+    limiter = AdaptiveRateLimiter(rate=8.0, min_rate=2.0, recovery_step=0.25)
+
+    assert limiter.record_throttle(0, retry_after=4) == 4
+    assert limiter.rate == 4.0
+    limiter.record_throttle(1, retry_after=0)
+    limiter.record_throttle(2, retry_after=0)
+    assert limiter.rate == 2.0
+    assert limiter.throttle_count == 3
+
+    for _ in range(3):
+        limiter.record_success()
+    assert limiter.rate == 8.0
+    limiter.record_success()
+    assert limiter.rate == 8.0
+
+
+def test_throttle_without_retry_after_uses_jittered_backoff(clock):
+    limiter = AdaptiveRateLimiter(rate=1.0, backoff_base_seconds=1, backoff_max_seconds=10)
+
+    assert 2 <= limiter.record_throttle(2) <= 4
+    assert all(5 <= limiter.backoff_delay(10) <= 10 for _ in range(20))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(retry_at) <= 30
@@ -0,0 +1,44 @@
+import pytest
+
+from app import models, roles
+
+
+@pytest.mark.parametrize("label, name, category", [
+    ("작곡", "composer", roles.CREATIVE),
+    ("Composer", "composer", roles.CREATIVE),
+    ("피처링", "vocal (guest)", roles.PERFORMER),
+    ("Instrument (guitar, Bass)", "instrument (bass, guitar)", roles.PERFORMER),
+    ("instrument  (bass,guitar)", "instrument (bass, guitar)", roles.PERFORMER),
+    ("Mixing Engineer", "mix", roles.TECHNICAL),
+    ("theremin", "theremin", roles.PERFORMER),
+])
+def test_parse_role(label, name, category):
+    parsed = roles.parse_role(label)
+
+    assert parsed.name == name
+    assert parsed.category == category
+
+
+def test_same_role_from_different_sources_shares_an_id(db):
+    role_ids = roles.get_role_ids(db, ["작곡", "composer", "Instrument (guitar, Bass)", "instrument (bass, guitar)"])
+    db.commit()
+
+    assert role_ids["작곡"] == role_ids["composer"]
+    assert role_ids["Instrument (guitar, Bass)"] == role_ids["instrument (bass, guitar)"]
+    assert roles.get_role_ids(db, ["composer"]) == {"composer": role_ids["작곡"]}
+    guitar = db.get(models.Role, role_ids["instrument (bass, guitar)"])
+    assert (guitar.base_role, guitar.attributes, guitar.category) == ("instrument", "bass, guitar", roles.PERFORMER)
+
+
+def test_filter_matches_base_role_and_attribute_subsets(db):
+    role_ids = roles.get_role_ids(db, ["instrument (guitar)", "instrument (bass, guitar)", "instrument (piano)", "작곡"])
+    db.commit()
+
+    assert roles.get_filter_role_ids(db, ["instrument"]) == {
+        role_ids["instrument (guitar)"], role_ids["instrument (bass, guitar)"], role_ids["instrument (piano)"],
+    }
+    assert roles.get_filter_role_ids(db, ["Instrument (Guitar)"]) == {
+        role_ids["instrument (guitar)"], role_ids["instrument (bass, guitar)"],
+    }
+    assert roles.get_filter_role_ids(db, ["작곡"]) == {role_ids["작곡"]}
+    assert roles.get_filter_role_ids(db, []) == set()
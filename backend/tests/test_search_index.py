@@ -0,0 +1,45 @@
+from app import search_index
+from app.search_index import PERSON, SONG
+
+
+def _ids(db, query, entity_type=PERSON, limit=5):
+    return [entity_id for entity_id, _ in search_index.search(db, query, entity_type, limit=limit)]
+
+
+def test_normalize_and_choseong():
+    assert search_index.normalize_text("  ＢＴＳ ") == "bts"
+    assert search_index.to_choseong("아이유 IU") == "ㅇㅇㅇ"
+    assert search_index.to_choseong("방탄 소년단") == "ㅂㅌ ㅅㄴㄷ"
+
+
+def test_exact_then_prefix_then_degree_then_length(db):
+    search_index.index_entities(db, PERSON, {
+        1: "IU", 2: "IU Fan Club", 3: "Lee IU", 4: "IUX", 5: "IUXXXXXX",
+    }, {1: 1, 2: 50, 3: 100, 4: 5, 5: 5})
+
+    assert _ids(db, "iu") == [1, 2, 4, 5, 3]
+
+
+def test_token_prefixes_and_choseong(db):
+    search_index.index_entities(db, PERSON, {1: "아이유", 2: "방탄소년단"})
+    search_index.index_entities(db, SONG, {10: "New Jeans", 11: "Newsboy"})
+
+    assert _ids(db, "방탄") == [2]
+    assert _ids(db, "ㅇㅇㅇ") == [1]
+    assert _ids(db, "new jea", SONG) == [10]
+    assert _ids(db, "  ") == []
+
+
+def test_short_prefix_ranks_hubs_among_all_matches(db):
+    labels = {person_id: f"K performer {person_id}" for person_id in range(1, 3001)}
+    labels[3001] = "K hub producer"
+    search_index.index_entities(db, PERSON, labels, {3001: 500, 2999: 10})
+
+    assert _ids(db, "k", limit=2) == [3001, 2999]
+
+
+def test_degree_accumulates_and_documents_are_indexed_once(db):
+    search_index.index_entities(db, PERSON, {1: "Suga"}, {1: 1})
+    search_index.index_entities(db, PERSON, {1: "Suga"}, {1: 2})
+
+    assert search_index.search(db, "suga", PERSON) == [(1, 3)]
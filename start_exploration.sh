@@ -37,9 +37,39 @@ echo "Calling Backend API: ${BACKEND_URL}${ENDPOINT}"
 echo "Payload:"
 echo "${PAYLOAD}"
 
-# curl 명령어를 사용하여 POST 요청 전송
-curl -X POST "${BACKEND_URL}${ENDPOINT}" \
+# 탐색은 백그라운드 작업으로 실행되며, 요청은 작업 ID를 바로 반환합니다.
+RESPONSE=$(curl --silent -X POST "${BACKEND_URL}${ENDPOINT}" \
      -H "Content-Type: application/json" \
-     -d "${PAYLOAD}"
+     -d "${PAYLOAD}")
+echo "${RESPONSE}"
 
-echo "" # 터미널 출력 정리를 위한 개행
\ No newline at end of file
+JOB_ID=$(echo "${RESPONSE}" | python -c "import json, sys; print(json.load(sys.stdin).get('job_id', ''))" 2>/dev/null)
+if [ -z "$JOB_ID" ]; then
+    echo "Error: Failed to start exploration job."
+    exit 1
+fi
+echo "✅ Exploration job started: ${JOB_ID}"
+echo "   (Press Ctrl+C to stop following; the job keeps running. Cancel with:"
+echo "    curl -X POST ${BACKEND_URL}/jobs/${JOB_ID}/cancel)"
+
+# 작업이 끝날 때까지 진행 상황을 주기적으로 출력합니다.
+POLL_INTERVAL=10
+while true; do
+    STATUS_JSON=$(curl --silent "${BACKEND_URL}/jobs/${JOB_ID}")
+    STATE=$(echo "${STATUS_JSON}" | python -c "import json, sys; print(json.load(sys.stdin)['status'])" 2>/dev/null)
+    echo "${STATUS_JSON}" | python -c "
+import json, sys
+job = json.load(sys.stdin)
+p = job['progress']
+print(f\"[{job['status']}] artists: {p['artists_processed']} (in progress: {p['artists_in_progress']}), \"
+      f\"songs: {p['songs_imported']}, queue: {p['queue_length']}, \"
+      f\"db: {p['db_size_bytes'] / 1024 ** 2:.1f} MB, {p['requests_per_second']:.2f} req/s\")
+" 2>/dev/null
+    case "$STATE" in
+        completed|cancelled|failed)
+            echo "${STATUS_JSON}"
+            break
+            ;;
+    esac
+    sleep $POLL_INTERVAL
+done